@@ -0,0 +1,35 @@
+"""
+This file contains the helpers of the conditional responses, ETags and cache headers
+"""
+from fastapi import Response, status
+
+from app.api import settings
+
+
+def format_etag(digest: str) -> str:
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Checks an If-None-Match header against an ETag, the weak comparison is used as GET requires
+    :param if_none_match: Value of the If-None-Match header
+    :param etag: Quoted ETag of the current response
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == '*':
+        return True
+
+    candidates = [candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')]
+    return etag in candidates
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    # A design never changes for the same content hash, so shared caches can store it
+    return {'ETag': etag, 'Cache-Control': f'public, max-age={settings.CACHE_MAX_AGE}'}
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
@@ -0,0 +1,42 @@
+"""
+This file contains the shared dependencies of the API routers
+"""
+from functools import lru_cache
+
+from app.api import settings
+from app.dispatch.design_dispatcher import DesignDispatcher
+from app.jobs.job_manager import JobManager
+from app.rendering.plot_render_service import PlotRenderService
+from app.streaming.stream_registry import StreamRegistry
+
+
+@lru_cache
+def get_job_manager() -> JobManager:
+    return JobManager(
+        max_workers=settings.JOBS_MAX_WORKERS,
+        max_queue_depth=settings.JOBS_MAX_QUEUE_DEPTH,
+        result_ttl=settings.JOBS_RESULT_TTL,
+    )
+
+
+@lru_cache
+def get_plot_render_service() -> PlotRenderService:
+    return PlotRenderService(
+        max_workers=settings.RENDER_MAX_WORKERS,
+        cache_size=settings.RENDER_CACHE_SIZE,
+    )
+
+
+@lru_cache
+def get_design_dispatcher() -> DesignDispatcher:
+    return DesignDispatcher(
+        inline_threshold=settings.DISPATCH_INLINE_THRESHOLD,
+        process_threshold=settings.DISPATCH_PROCESS_THRESHOLD,
+        thread_workers=settings.DISPATCH_THREAD_WORKERS,
+        process_workers=settings.DISPATCH_PROCESS_WORKERS,
+    )
+
+
+@lru_cache
+def get_stream_registry() -> StreamRegistry:
+    return StreamRegistry()
@@ -0,0 +1,189 @@
+"""
+This file contains the routes of the designs API
+"""
+import asyncio
+from typing import Annotated
+
+import numpy as np
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.api.conditional_responses import cache_headers, etag_matches, format_etag, not_modified_response
+from app.api.dependencies import get_design_dispatcher, get_plot_render_service
+from app.api.schemas.design_schemas import DesignQuerySchema, PrecisionQuerySchema, VerifyRequest
+from app.api.schemas.export_schemas import EXPORT_MEDIA_TYPES, ExportFormat, ExportQuerySchema, ExportRequest
+from app.api.schemas.filter_conf_schema import FilterConfSchema
+from app.api.schemas.plot_schemas import PlotQuerySchema
+from app.api.schemas.response_schemas import ResponseQuerySchema
+from app.design.analysis.frequency_response import frequency_response, lttb_indexes, min_max_indexes
+from app.design.fir_filter_factory import create_fir_filter
+from app.design.fir_filter_hash import content_hash
+from app.design.types.precision_types import PrecisionReport
+from app.design.types.response_types import FrequencyResponse, RESPONSE_COLUMNS
+from app.design.types.verification_types import VerificationReport
+from app.design.verification.precision_analyzer import PrecisionAnalyzer
+from app.design.verification.spec_verifier import SpecVerifier
+from app.dispatch.design_dispatcher import DesignDispatcher
+from app.export.design_exporter import iter_csv, iter_xlsx
+from app.rendering.plot_render_service import PlotRenderService
+from app.rendering.types.render_types import IMAGE_MEDIA_TYPES
+
+router = APIRouter(prefix='/designs', tags=['designs'])
+
+
+@router.get('', response_model=None)
+async def get_design(
+        query: Annotated[DesignQuerySchema, Query()],
+        dispatcher: Annotated[DesignDispatcher, Depends(get_design_dispatcher)],
+        response: Response,
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> dict | Response:
+    filter_conf = query.to_filter_conf()
+    # The ETag only needs the configuration, a client that has the design gets 304 without designing it
+    etag = format_etag(content_hash(
+        filter_conf, query.round_value, query.dtype, endpoint='design', verify=query.verify, grid_size=query.grid_size
+    ))
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    coefficients = await dispatcher.design(filter_conf, query.round_value, query.dtype)
+    response.headers.update(cache_headers(etag))
+
+    verification = None
+    if query.verify:
+        # The dense grid FFT would block the event loop
+        verification = await asyncio.to_thread(SpecVerifier(query.grid_size).verify, filter_conf, coefficients)
+
+    return {
+        'coefficients': coefficients,
+        'taps': len(coefficients),
+        'dtype': query.dtype,
+        'verification': verification,
+    }
+
+
+def _sample_response(coefficients: list[float], F: float, query: ResponseQuerySchema) -> list[np.ndarray]:
+    """
+    Calculates the frequency response on the grid of the query and downsamples it
+    :return: Frequency, magnitude in dB, phase and group delay columns
+    """
+    frequencies, magnitude_db, phase, group_delay = frequency_response(coefficients, F, query.grid_size)
+
+    indexes = np.arange(query.grid_size)
+    if query.downsample == 'minmax':
+        indexes = min_max_indexes(magnitude_db, query.points)
+    elif query.downsample == 'lttb':
+        indexes = lttb_indexes(frequencies, magnitude_db, query.points)
+
+    return [frequencies[indexes], magnitude_db[indexes], phase[indexes], group_delay[indexes]]
+
+
+@router.get('/response', response_model=None)
+async def get_frequency_response(
+        query: Annotated[ResponseQuerySchema, Query()],
+        dispatcher: Annotated[DesignDispatcher, Depends(get_design_dispatcher)],
+        response: Response,
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> FrequencyResponse | Response:
+    """
+    Magnitude, phase and group delay on grid_size frequencies from 0 to F/2. The points can be downsampled
+    keeping the minimum and maximum magnitude of every bucket, or with LTTB, so the stopband lobes survive.
+    The binary format is a little endian array of the dtype with one row per column of X-Response-Columns.
+    """
+    filter_conf = query.to_filter_conf()
+    etag = format_etag(content_hash(
+        filter_conf, query.round_value, query.dtype, endpoint='response', grid_size=query.grid_size,
+        downsample=query.downsample, points=query.points, response_format=query.response_format
+    ))
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    coefficients = await dispatcher.design(filter_conf, query.round_value, query.dtype)
+    try:
+        # The FFT of large grids and the downsampling loops would block the event loop
+        columns = await asyncio.to_thread(_sample_response, coefficients, filter_conf['F'], query)
+    except ValueError as e:
+        # The grid needs at least half the taps of the design
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    points = len(columns[0])
+
+    if query.response_format == 'binary':
+        content = np.stack(columns).astype(np.dtype(query.dtype).newbyteorder('<')).tobytes()
+        headers = {
+            **cache_headers(etag),
+            'X-Response-Columns': ','.join(RESPONSE_COLUMNS),
+            'X-Response-Points': str(points),
+            'X-Response-Dtype': query.dtype,
+        }
+        return Response(content=content, media_type='application/octet-stream', headers=headers)
+
+    response.headers.update(cache_headers(etag))
+    return FrequencyResponse(
+        frequency=columns[0].tolist(),
+        magnitude_db=columns[1].tolist(),
+        phase=columns[2].tolist(),
+        group_delay=[None if np.isnan(delay) else delay for delay in columns[3].tolist()],
+        grid_size=query.grid_size,
+        points=points,
+    )
+
+
+@router.get('/precision')
+def get_precision(query: Annotated[PrecisionQuerySchema, Query()]) -> PrecisionReport:
+    fir_filter = create_fir_filter(query.to_filter_conf(), query.round_value)
+    return PrecisionAnalyzer(query.grid_size).analyze(fir_filter, query.dtype)
+
+
+@router.post('/verify')
+def verify_designs(request: VerifyRequest) -> list[VerificationReport]:
+    # A sync route, FastAPI runs the batched FFTs in its thread pool instead of the event loop
+    designs = [(design.filter_conf.to_filter_conf(), design.coefficients) for design in request.designs]
+    return SpecVerifier(request.grid_size).verify_batch(designs)
+
+
+@router.get('/plot', response_class=Response)
+async def plot_design(
+        query: Annotated[PlotQuerySchema, Query()],
+        render_service: Annotated[PlotRenderService, Depends(get_plot_render_service)],
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    filter_conf = query.to_filter_conf()
+    plot_params = query.to_plot_params()
+    etag = format_etag(content_hash(filter_conf, query.round_value, endpoint='plot', **plot_params))
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    # Validates the configuration before it is sent to the render pool
+    create_fir_filter(filter_conf, query.round_value)
+
+    image = await render_service.render(filter_conf, query.round_value, plot_params)
+
+    return Response(content=image, media_type=IMAGE_MEDIA_TYPES[query.image_format], headers=cache_headers(etag))
+
+
+def _export_response(filter_confs: list[FilterConfSchema], round_value: int,
+                     export_format: ExportFormat) -> StreamingResponse:
+    # The filters are validated here and designed while the file is streamed
+    designs = []
+    for idx, filter_conf in enumerate(filter_confs):
+        conf = filter_conf.to_filter_conf()
+        name = f"{conf['filter_type']}_{conf['filter_window']}_{idx + 1}"
+        designs.append((name, create_fir_filter(conf, round_value)))
+
+    content = iter_csv(designs) if export_format == 'csv' else iter_xlsx(designs)
+
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="designs.{export_format}"'}
+    )
+
+
+@router.get('/export')
+def export_design(query: Annotated[ExportQuerySchema, Query()]) -> StreamingResponse:
+    return _export_response([query], query.round_value, query.export_format)
+
+
+@router.post('/export')
+def export_designs(request: ExportRequest) -> StreamingResponse:
+    return _export_response(request.filter_confs, request.round_value, request.export_format)
@@ -0,0 +1,82 @@
+"""
+This file contains the routes of the jobs API
+"""
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api import settings
+from app.api.dependencies import get_job_manager
+from app.api.schemas.job_schemas import DesignJobRequest, FilterJobRequest
+from app.design.fir_filter_factory import create_fir_filter
+from app.jobs.exceptions.job_exceptions import JobNotFoundError, JobNotFinishedError, QueueFullError
+from app.jobs.job_handlers import create_design_handler, create_filter_handler, resolve_data_path
+from app.jobs.job_manager import JobManager
+from app.jobs.types.job_types import JobStatus
+
+router = APIRouter(prefix='/jobs', tags=['jobs'])
+
+JobManagerDep = Annotated[JobManager, Depends(get_job_manager)]
+
+
+def _submit(job_manager: JobManager, kind: str, handler) -> JobStatus:
+    try:
+        return job_manager.submit(kind, handler)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={'Retry-After': str(e.retry_after)}
+        )
+
+
+@router.post('/designs', status_code=status.HTTP_202_ACCEPTED)
+def submit_design_job(request: DesignJobRequest, job_manager: JobManagerDep) -> JobStatus:
+    filter_confs = [filter_conf.to_filter_conf() for filter_conf in request.filter_confs]
+    return _submit(job_manager, 'design', create_design_handler(filter_confs, request.round_value, request.dtype))
+
+
+@router.post('/filters', status_code=status.HTTP_202_ACCEPTED)
+def submit_filter_job(request: FilterJobRequest, job_manager: JobManagerDep) -> JobStatus:
+    filter_conf = request.filter_conf.to_filter_conf()
+    # Validates the configuration before the job is queued
+    create_fir_filter(filter_conf, request.round_value)
+
+    try:
+        input_path = resolve_data_path(request.input_path, settings.JOBS_DATA_DIR)
+        output_path = resolve_data_path(request.output_path, settings.JOBS_DATA_DIR)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    if not input_path.is_file():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{request.input_path} not found")
+
+    handler = create_filter_handler(
+        filter_conf, input_path, output_path, request.round_value, request.block_size, request.dtype
+    )
+    return _submit(job_manager, 'filter', handler)
+
+
+@router.get('/{job_id}')
+def get_job_status(job_id: str, job_manager: JobManagerDep) -> JobStatus:
+    try:
+        return job_manager.get_status(job_id)
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.post('/{job_id}/cancel')
+def cancel_job(job_id: str, job_manager: JobManagerDep) -> JobStatus:
+    try:
+        return job_manager.cancel(job_id)
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get('/{job_id}/result')
+def get_job_result(job_id: str, job_manager: JobManagerDep) -> Any:
+    try:
+        return job_manager.get_result(job_id)
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except JobNotFinishedError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
@@ -0,0 +1,35 @@
+"""
+This file contains the routes of the metrics API
+"""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_design_dispatcher, get_stream_registry
+from app.dispatch.design_dispatcher import DesignDispatcher
+from app.dispatch.types.dispatch_types import CoalescingMetrics, LaneMetrics
+from app.streaming.stream_registry import StreamRegistry
+from app.streaming.types.stream_types import StreamRegistryMetrics
+
+router = APIRouter(prefix='/metrics', tags=['metrics'])
+
+
+@router.get('/dispatch')
+def get_dispatch_metrics(
+        dispatcher: Annotated[DesignDispatcher, Depends(get_design_dispatcher)],
+) -> dict[str, LaneMetrics]:
+    return dispatcher.get_metrics()
+
+
+@router.get('/coalescing')
+def get_coalescing_metrics(
+        dispatcher: Annotated[DesignDispatcher, Depends(get_design_dispatcher)],
+) -> CoalescingMetrics:
+    return dispatcher.get_coalescing_metrics()
+
+
+@router.get('/streams')
+def get_stream_metrics(
+        registry: Annotated[StreamRegistry, Depends(get_stream_registry)],
+) -> StreamRegistryMetrics:
+    return registry.get_metrics()
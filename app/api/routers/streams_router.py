@@ -0,0 +1,74 @@
+"""
+This file contains the routes of the streaming API
+"""
+import asyncio
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+
+from app.api.dependencies import get_design_dispatcher, get_stream_registry
+from app.api.schemas.stream_schemas import StreamOpenSchema
+from app.design.exceptions.filter_config_exceptions import FilterConfValidationError
+from app.design.fir_filter_factory import create_fir_filter
+from app.design.phase.minimum_phase_converter import MinimumPhaseConverter
+from app.dispatch.design_dispatcher import DesignDispatcher
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+from app.streaming.filter_stream import FilterStream
+from app.streaming.stream_registry import StreamRegistry
+
+router = APIRouter(prefix='/streams', tags=['streams'])
+
+
+@router.websocket('/filter')
+async def filter_stream(
+        websocket: WebSocket,
+        dispatcher: Annotated[DesignDispatcher, Depends(get_design_dispatcher)],
+        registry: Annotated[StreamRegistry, Depends(get_stream_registry)],
+):
+    """
+    The first text message opens the stream with a StreamOpenSchema, the reply has the designed taps.
+    Then every binary frame of little endian float32 samples is filtered and sent back, the text
+    messages 'reset' and 'metrics' clear the filter state, acknowledged with 'reset: ok', and send the
+    metrics of the stream.
+    """
+    await websocket.accept()
+    try:
+        request = StreamOpenSchema.model_validate_json(await websocket.receive_text())
+        filter_conf = request.filter_conf.to_filter_conf()
+        coefficients = await dispatcher.design(filter_conf, request.round_value)
+        group_delay = (len(coefficients) - 1) / 2
+        if request.phase == 'minimum':
+            fir_filter = create_fir_filter(filter_conf, request.round_value)
+            fir_filter.coefficients = coefficients
+            report = await asyncio.to_thread(MinimumPhaseConverter().convert, fir_filter)
+            coefficients, group_delay = report['coefficients'], report['group_delay']
+    except (ValidationError, FilterConfValidationError, ValueError) as e:
+        # Close reasons are limited to 123 bytes
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e)[:120])
+        return
+
+    stream = FilterStream(DirectFilterEngine(coefficients, dtype=request.dtype), queue_size=request.queue_size)
+    await websocket.send_json({
+        'taps': len(coefficients), 'phase': request.phase, 'dtype': request.dtype, 'group_delay': group_delay
+    })
+
+    async def receive() -> bytes | str | None:
+        message = await websocket.receive()
+        if message['type'] == 'websocket.disconnect':
+            return None
+        return message['bytes'] if message.get('bytes') is not None else message.get('text')
+
+    async def send(message: bytes | str):
+        if isinstance(message, bytes):
+            await websocket.send_bytes(message)
+        else:
+            await websocket.send_text(message)
+
+    registry.add(stream)
+    try:
+        await stream.run(receive, send)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        registry.remove(stream)
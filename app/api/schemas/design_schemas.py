@@ -0,0 +1,42 @@
+"""
+This file contains the schemas of the designs API
+"""
+from pydantic import BaseModel, Field
+
+from app.api.schemas.filter_conf_schema import FilterConfSchema
+from app.design.types.fir_filter_types import CoefficientType
+
+
+class DesignQuerySchema(FilterConfSchema):
+    """
+    Query of a design, the filter configuration, the precision of the coefficients and the verification options
+    """
+    round_value: int = 7
+    dtype: CoefficientType = 'float64'
+    verify: bool = True
+    grid_size: int = Field(default=8192, ge=16, le=1 << 20)
+
+
+class PrecisionQuerySchema(FilterConfSchema):
+    """
+    Query of a precision analysis, the filter configuration and the precision to compare with float64
+    """
+    round_value: int = 7
+    dtype: CoefficientType = 'float32'
+    grid_size: int = Field(default=8192, ge=16, le=1 << 20)
+
+
+class DesignToVerify(BaseModel):
+    """
+    Design to verify, its configuration and coefficients
+    """
+    filter_conf: FilterConfSchema
+    coefficients: list[float] = Field(min_length=1)
+
+
+class VerifyRequest(BaseModel):
+    """
+    Request to verify many designs
+    """
+    designs: list[DesignToVerify] = Field(min_length=1)
+    grid_size: int = Field(default=8192, ge=16, le=1 << 20)
@@ -0,0 +1,32 @@
+"""
+This file contains the schemas of the export API
+"""
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.api.schemas.filter_conf_schema import FilterConfSchema
+
+ExportFormat = Literal['csv', 'xlsx']
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+class ExportQuerySchema(FilterConfSchema):
+    """
+    Query to export a single design
+    """
+    round_value: int = 7
+    export_format: ExportFormat = 'xlsx'
+
+
+class ExportRequest(BaseModel):
+    """
+    Request to export many designs into one file
+    """
+    filter_confs: list[FilterConfSchema] = Field(min_length=1)
+    round_value: int = 7
+    export_format: ExportFormat = 'xlsx'
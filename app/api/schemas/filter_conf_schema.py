@@ -0,0 +1,35 @@
+"""
+This file contains the schema of the filter configuration received by the API
+"""
+from pydantic import BaseModel
+
+from app.design.types.fir_filter_types import DesignMethod, FilterConf, FilterType, FilterWindow
+
+
+class FilterBandSchema(BaseModel):
+    """
+    Band of a multiband magnitude template
+    """
+    start: float
+    end: float
+    gain: float
+
+
+class FilterConfSchema(BaseModel):
+    """
+    Filter configuration received by the API, the values are validated by the filter validators
+    """
+    filter_type: FilterType
+    filter_window: FilterWindow
+    Ap: float
+    As: float
+    fp: float | None = None
+    fs: float | None = None
+    F: float
+    fs2: float | None = None
+    fp2: float | None = None
+    bands: list[FilterBandSchema] | None = None
+    design_method: DesignMethod | None = None
+
+    def to_filter_conf(self) -> FilterConf:
+        return FilterConf(**self.model_dump(include=set(FilterConfSchema.model_fields), exclude_none=True))
@@ -0,0 +1,29 @@
+"""
+This file contains the schemas of the jobs API
+"""
+from pydantic import BaseModel, Field
+
+from app.api.schemas.filter_conf_schema import FilterConfSchema
+from app.design.types.fir_filter_types import CoefficientType
+
+
+class DesignJobRequest(BaseModel):
+    """
+    Request to design many filters in a job
+    """
+    filter_confs: list[FilterConfSchema] = Field(min_length=1)
+    round_value: int = 7
+    dtype: CoefficientType = 'float64'
+
+
+class FilterJobRequest(BaseModel):
+    """
+    Request to filter a .npy signal in a job, the paths are relative to the jobs data directory
+    """
+    filter_conf: FilterConfSchema
+    input_path: str
+    output_path: str
+    round_value: int = 7
+    block_size: int = Field(default=1 << 20, gt=0)
+    # Precision of the filtering and the output file, the precision of the input file by default
+    dtype: CoefficientType | None = None
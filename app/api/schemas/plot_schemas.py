@@ -0,0 +1,36 @@
+"""
+This file contains the schemas of the plot API
+"""
+from pydantic import Field, model_validator
+
+from app.api.schemas.filter_conf_schema import FilterConfSchema
+from app.rendering.types.render_types import ImageFormat, PlotParams, PlotScale
+
+
+class PlotQuerySchema(FilterConfSchema):
+    """
+    Query of a frequency response plot, the filter configuration and the plot parameters
+    """
+    round_value: int = 7
+    image_format: ImageFormat = 'png'
+    grid_size: int = Field(default=1024, ge=16, le=65536)
+    scale: PlotScale = 'log'
+    f_min: float = Field(default=0, ge=0)
+    f_max: float | None = Field(default=None, gt=0)
+
+    @model_validator(mode='after')
+    def validate_frequency_range(self) -> 'PlotQuerySchema':
+        # Validated here so a bad range is rejected before it reaches the render pool
+        f_max = self.F / 2 if self.f_max is None else self.f_max
+        if not 0 <= self.f_min < f_max <= self.F / 2:
+            raise ValueError("The frequency range must satisfy 0 <= f_min < f_max <= F/2")
+        return self
+
+    def to_plot_params(self) -> PlotParams:
+        return PlotParams(
+            image_format=self.image_format,
+            grid_size=self.grid_size,
+            scale=self.scale,
+            f_min=self.f_min,
+            f_max=self.f_max,
+        )
@@ -0,0 +1,20 @@
+"""
+This file contains the schemas of the frequency response API
+"""
+from pydantic import Field
+
+from app.api.schemas.filter_conf_schema import FilterConfSchema
+from app.design.types.fir_filter_types import CoefficientType
+from app.design.types.response_types import DownsampleMethod, ResponseFormat
+
+
+class ResponseQuerySchema(FilterConfSchema):
+    """
+    Query of a frequency response, the filter configuration, the grid and how the points are returned
+    """
+    round_value: int = 7
+    dtype: CoefficientType = 'float64'
+    grid_size: int = Field(default=8192, ge=16, le=1 << 22)
+    downsample: DownsampleMethod = 'minmax'
+    points: int = Field(default=2048, ge=3, le=1 << 16)
+    response_format: ResponseFormat = 'json'
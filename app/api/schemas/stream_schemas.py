@@ -0,0 +1,22 @@
+"""
+This file contains the schemas of the streaming API
+"""
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.api.schemas.filter_conf_schema import FilterConfSchema
+from app.design.types.fir_filter_types import CoefficientType
+
+
+class StreamOpenSchema(BaseModel):
+    """
+    First message of a filtering stream, the filter to design, its phase, the precision of the filtering and
+    the size of the stream queues. The minimum phase filter has the same magnitude response with a fraction of
+    the delay, and float32 keeps the coefficients and the filter state in the precision of the frames.
+    """
+    filter_conf: FilterConfSchema
+    round_value: int = 7
+    phase: Literal['linear', 'minimum'] = 'linear'
+    dtype: CoefficientType = 'float64'
+    queue_size: int = Field(default=8, ge=1, le=1024)
@@ -0,0 +1,32 @@
+"""
+This file contains the FastAPI application
+"""
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from app.api.dependencies import get_design_dispatcher, get_job_manager, get_plot_render_service
+from app.api.routers import designs_router, jobs_router, metrics_router, streams_router
+from app.design.exceptions.filter_config_exceptions import FilterConfValidationError
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    get_job_manager().shutdown(wait=False)
+    get_plot_render_service().shutdown(wait=False)
+    get_design_dispatcher().shutdown(wait=False)
+
+
+app = FastAPI(title='FIR Filters API', lifespan=lifespan)
+
+app.include_router(designs_router.router)
+app.include_router(jobs_router.router)
+app.include_router(metrics_router.router)
+app.include_router(streams_router.router)
+
+
+@app.exception_handler(FilterConfValidationError)
+async def filter_conf_error_handler(_: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content={'detail': str(exc)})
@@ -0,0 +1,38 @@
+"""
+This file contains the settings of the API, read from the environment
+"""
+import os
+from pathlib import Path
+
+JOBS_MAX_WORKERS: int = int(os.environ.get('FIR_JOBS_MAX_WORKERS', 4))
+"""Number of workers running jobs"""
+
+JOBS_MAX_QUEUE_DEPTH: int = int(os.environ.get('FIR_JOBS_MAX_QUEUE_DEPTH', 32))
+"""Jobs that can wait for a worker before new submissions are rejected with 429"""
+
+JOBS_RESULT_TTL: float = float(os.environ.get('FIR_JOBS_RESULT_TTL', 600))
+"""Seconds a finished job and its result are kept"""
+
+JOBS_DATA_DIR: Path = Path(os.environ.get('FIR_JOBS_DATA_DIR', '.'))
+"""Directory where the filtering jobs read and write their signals"""
+
+RENDER_MAX_WORKERS: int = int(os.environ.get('FIR_RENDER_MAX_WORKERS', 2))
+"""Number of processes rendering plots"""
+
+RENDER_CACHE_SIZE: int = int(os.environ.get('FIR_RENDER_CACHE_SIZE', 256))
+"""Number of rendered images kept in the cache"""
+
+DISPATCH_INLINE_THRESHOLD: float = float(os.environ.get('FIR_DISPATCH_INLINE_THRESHOLD', 2_000))
+"""Designs estimated below this cost in microseconds run inline"""
+
+DISPATCH_PROCESS_THRESHOLD: float = float(os.environ.get('FIR_DISPATCH_PROCESS_THRESHOLD', 50_000))
+"""Designs estimated above this cost in microseconds run in the process pool"""
+
+DISPATCH_THREAD_WORKERS: int = int(os.environ.get('FIR_DISPATCH_THREAD_WORKERS', 4))
+"""Number of threads running designs"""
+
+DISPATCH_PROCESS_WORKERS: int = int(os.environ.get('FIR_DISPATCH_PROCESS_WORKERS', 2))
+"""Number of processes running designs"""
+
+CACHE_MAX_AGE: int = int(os.environ.get('FIR_CACHE_MAX_AGE', 3600))
+"""Seconds that clients and intermediary caches can reuse design and plot responses"""
@@ -0,0 +1,227 @@
+"""
+This file contains the command line interface that designs batches of filters.
+The specifications are streamed from a JSONL or CSV file and designed in parallel with a bounded number of
+batches in flight, so the number of specifications is not bounded by memory.
+
+Run with: python -m app.cli.batch_design_cli specs.jsonl output_dir --output-format packed
+"""
+import csv
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+from typing import Annotated, Iterator
+
+import numpy as np
+import typer
+
+from app.design.fir_filter_factory import design_filter
+from app.design.types.fir_filter_types import CoefficientType, FilterConf
+
+STRING_KEYS = ['filter_type', 'filter_window', 'design_method']
+
+INDEX_DTYPE = np.dtype([('spec', '<i8'), ('offset', '<i8'), ('taps', '<i8')])
+"""Record of the packed index, position of the specification and offset and taps of its coefficients"""
+
+cli = typer.Typer(help='Designs batches of FIR filters')
+
+
+class SpecFormat(str, Enum):
+    jsonl = 'jsonl'
+    csv = 'csv'
+
+
+class OutputFormat(str, Enum):
+    npy = 'npy'
+    packed = 'packed'
+
+
+def _parse_csv_row(row: dict[str, str]) -> FilterConf:
+    filter_conf = {}
+    for key, value in row.items():
+        if value is None or value == '':
+            continue
+        if key == 'bands':
+            filter_conf[key] = json.loads(value)
+        else:
+            filter_conf[key] = value if key in STRING_KEYS else float(value)
+
+    return filter_conf
+
+
+def read_specs(path: Path, spec_format: SpecFormat) -> Iterator[tuple[FilterConf | None, str | None]]:
+    """
+    Reads the filter configurations one by one, a record that cannot be parsed does not stop the reading
+    :param path: JSONL file with a configuration per line, or CSV file with a header of configuration keys
+    :param spec_format: Format of the file
+    :return: Configuration or parse error, with its line number, of each record
+    """
+    with open(path, newline='') as file:
+        if spec_format == SpecFormat.jsonl:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line), None
+                except ValueError as e:
+                    yield None, f"line {line_number}: {type(e).__name__}: {e}"
+        else:
+            reader = csv.DictReader(file)
+            for row in reader:
+                try:
+                    yield _parse_csv_row(row), None
+                except ValueError as e:
+                    yield None, f"line {reader.line_num}: {type(e).__name__}: {e}"
+
+
+def design_batch(
+        filter_confs: list[FilterConf], round_value: int, dtype: CoefficientType = 'float64'
+) -> list[tuple[np.ndarray | None, str | None]]:
+    """
+    Designs a batch of filters in a worker process
+    :return: Coefficients or error of each configuration
+    """
+    results = []
+    for filter_conf in filter_confs:
+        try:
+            results.append((np.asarray(design_filter(filter_conf, round_value, dtype), dtype=dtype), None))
+        except Exception as e:
+            results.append((None, f"{type(e).__name__}: {e}"))
+
+    return results
+
+
+def load_packed_design(output_dir: Path, spec: int) -> np.ndarray:
+    """
+    Loads the coefficients of a specification from a packed output without reading the whole file
+    :param output_dir: Directory of the packed output
+    :param spec: Position of the specification in the input file
+    :raises: KeyError if the specification was not designed
+    """
+    with open(output_dir / 'designs.json') as file:
+        dtype = np.dtype(json.load(file)['dtype']).newbyteorder('<')
+
+    index = np.fromfile(output_dir / 'designs.idx', dtype=INDEX_DTYPE)
+    record = index[index['spec'] == spec]
+    if not len(record):
+        raise KeyError(spec)
+
+    coefficients = np.memmap(output_dir / 'designs.bin', dtype=dtype, mode='r')
+    return np.array(coefficients[record['offset'][0]:record['offset'][0] + record['taps'][0]])
+
+
+class DesignWriter:
+    """
+    Writes the designs as .npy files or packed in one binary file with an index, and the failures as JSONL.
+    The packed file stores little endian coefficients of the dtype written in designs.json.
+    """
+
+    def __init__(self, output_dir: Path, output_format: OutputFormat, dtype: CoefficientType = 'float64'):
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.dtype = np.dtype(dtype).newbyteorder('<')
+        self.designed = 0
+        self.failed = 0
+
+        self._offset = 0
+        self._failures = open(output_dir / 'failures.jsonl', 'w')
+        if output_format == OutputFormat.packed:
+            self._data = open(output_dir / 'designs.bin', 'wb')
+            self._index = open(output_dir / 'designs.idx', 'wb')
+            with open(output_dir / 'designs.json', 'w') as file:
+                json.dump({'dtype': dtype}, file)
+
+    def write(self, spec: int, coefficients: np.ndarray | None, error: str | None):
+        if coefficients is None:
+            self.failed += 1
+            self._failures.write(json.dumps({'spec': spec, 'error': error}) + '\n')
+            return
+
+        self.designed += 1
+        if self.output_format == OutputFormat.npy:
+            np.save(self.output_dir / f"{spec:09d}.npy", coefficients)
+            return
+
+        self._data.write(coefficients.astype(self.dtype).tobytes())
+        self._index.write(np.array([(spec, self._offset, len(coefficients))], dtype=INDEX_DTYPE).tobytes())
+        self._offset += len(coefficients)
+
+    def close(self):
+        self._failures.close()
+        if self.output_format == OutputFormat.packed:
+            self._data.close()
+            self._index.close()
+
+
+@cli.command()
+def design(
+        specs_path: Annotated[Path, typer.Argument(exists=True, dir_okay=False, help='JSONL or CSV specifications')],
+        output_dir: Annotated[Path, typer.Argument(file_okay=False, help='Directory of the coefficients')],
+        spec_format: Annotated[SpecFormat | None, typer.Option(help='Format of the specifications, '
+                                                                    'taken from the extension by default')] = None,
+        output_format: Annotated[OutputFormat, typer.Option()] = OutputFormat.npy,
+        round_value: Annotated[int, typer.Option(help='Decimals used to round the values')] = 7,
+        dtype: Annotated[CoefficientType, typer.Option(help='Precision of the coefficients')] = 'float64',
+        workers: Annotated[int | None, typer.Option(help='Worker processes, one per core by default')] = None,
+        batch_size: Annotated[int, typer.Option(min=1, help='Specifications sent to a worker at once')] = 64,
+        max_in_flight: Annotated[int | None, typer.Option(help='Batches in flight, twice the workers by default')] = None,
+):
+    """
+    Designs every specification of a file in parallel
+    """
+    if spec_format is None:
+        spec_format = SpecFormat.csv if specs_path.suffix.lower() == '.csv' else SpecFormat.jsonl
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    writer = DesignWriter(output_dir, output_format, dtype)
+    specs = enumerate(read_specs(specs_path, spec_format))
+
+    start = time.perf_counter()
+    in_flight: dict[Future, list[int]] = {}
+    try:
+        while True:
+            while len(in_flight) < max_in_flight:
+                batch = list(islice(specs, batch_size))
+                if not batch:
+                    break
+                # The records that could not be parsed fail here, the rest are designed
+                for spec, (_, error) in batch:
+                    if error is not None:
+                        writer.write(spec, None, error)
+                batch = [(spec, filter_conf) for spec, (filter_conf, error) in batch if error is None]
+                if not batch:
+                    continue
+
+                filter_confs = [filter_conf for _, filter_conf in batch]
+                future = executor.submit(design_batch, filter_confs, round_value, dtype)
+                in_flight[future] = [spec for spec, _ in batch]
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                for spec, (coefficients, error) in zip(in_flight.pop(future), future.result()):
+                    writer.write(spec, coefficients, error)
+    finally:
+        writer.close()
+        executor.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    total = writer.designed + writer.failed
+    typer.echo(f"Specifications: {total}")
+    typer.echo(f"Designed: {writer.designed}")
+    typer.echo(f"Failed: {writer.failed}")
+    typer.echo(f"Elapsed: {elapsed:.2f} s")
+    typer.echo(f"Throughput: {total / elapsed if elapsed else 0:.1f} designs/s")
+
+
+if __name__ == '__main__':
+    cli()
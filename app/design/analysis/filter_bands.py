@@ -0,0 +1,74 @@
+"""
+This file contains the helpers to get the pass and stop bands of a filter configuration.
+"""
+from app.design.types.fir_filter_types import FilterConf
+
+
+def get_passbands(filter_conf: FilterConf) -> list[tuple[float, float]]:
+    """
+    Gets the passbands of the filter configuration
+    :param filter_conf: Filter configuration
+    :return: List of (start, end) frequencies in Hz
+    """
+    filter_type = filter_conf['filter_type']
+    nyquist = filter_conf['F'] / 2
+
+    if filter_type == 'lowpass':
+        return [(0, filter_conf['fp'])]
+
+    if filter_type == 'highpass':
+        return [(filter_conf['fp'], nyquist)]
+
+    if filter_type == 'bandpass':
+        return [(filter_conf['fp'], filter_conf['fp2'])]
+
+    if filter_type == 'stopband':
+        return [(0, filter_conf['fp']), (filter_conf['fp2'], nyquist)]
+
+    if filter_type == 'multiband':
+        return [(band['start'], band['end']) for band in filter_conf['bands'] if band['gain'] > 0]
+
+    raise ValueError(f"Bands are not defined for {filter_type} filters")
+
+
+def get_stopbands(filter_conf: FilterConf) -> list[tuple[float, float]]:
+    """
+    Gets the stopbands of the filter configuration
+    :param filter_conf: Filter configuration
+    :return: List of (start, end) frequencies in Hz
+    """
+    filter_type = filter_conf['filter_type']
+    nyquist = filter_conf['F'] / 2
+
+    if filter_type == 'lowpass':
+        return [(filter_conf['fs'], nyquist)]
+
+    if filter_type == 'highpass':
+        return [(0, filter_conf['fs'])]
+
+    if filter_type == 'bandpass':
+        return [(0, filter_conf['fs']), (filter_conf['fs2'], nyquist)]
+
+    if filter_type == 'stopband':
+        return [(filter_conf['fs'], filter_conf['fs2'])]
+
+    if filter_type == 'multiband':
+        return [(band['start'], band['end']) for band in filter_conf['bands'] if band['gain'] == 0]
+
+    raise ValueError(f"Bands are not defined for {filter_type} filters")
+
+
+def get_band_template(filter_conf: FilterConf) -> list[tuple[float, float, float]]:
+    """
+    Gets the bands of the filter configuration with the gain expected in each one
+    :param filter_conf: Filter configuration
+    :return: List of (start, end, gain) sorted by frequency
+    """
+    if filter_conf['filter_type'] == 'multiband':
+        bands = [(band['start'], band['end'], band['gain']) for band in filter_conf['bands']]
+    else:
+        bands = [(start, end, 1.0) for start, end in get_passbands(filter_conf)]
+        bands += [(start, end, 0.0) for start, end in get_stopbands(filter_conf)]
+
+    return sorted(bands)
+
@@ -0,0 +1,110 @@
+"""
+This file contains the helpers to calculate and downsample the frequency response of a filter.
+"""
+import numpy as np
+from scipy import fft
+
+# Magnitudes below this fraction of the peak are treated as zeros, the phase and group delay are not defined there
+MAGNITUDE_FLOOR = 1e-12
+
+
+def group_delay(coefficients: np.ndarray, nfft: int) -> np.ndarray:
+    """
+    Calculates the group delay in samples on nfft / 2 + 1 frequencies from 0 to F / 2,
+    it is Re(DFT(n h[n]) / DFT(h[n])), so it is not defined where the response is zero
+    """
+    ramp = np.arange(len(coefficients)) * coefficients
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.real(fft.rfft(ramp, n=nfft) / fft.rfft(coefficients, n=nfft))
+
+
+def frequency_response(
+        coefficients: list[float], F: float, grid_size: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates the response on grid_size frequencies from 0 to F / 2 with a zero-padded real FFT
+    :param coefficients: Filter coefficients
+    :param F: Sampling frequency in Hz
+    :param grid_size: Number of frequencies
+    :return: tuple with the frequencies, magnitude in dB, unwrapped phase and group delay, NaN where the
+        magnitude is zero
+    """
+    values = np.asarray(coefficients, dtype=np.float64)
+    if grid_size < 2:
+        raise ValueError("grid_size must be at least 2")
+
+    # A grid longer than the filter is plain zero padding, a shorter one aliases the impulse response
+    nfft = 2 * (grid_size - 1)
+    if nfft < len(values):
+        raise ValueError("grid_size must be at least half the number of taps")
+
+    response = fft.rfft(values, n=nfft)
+    magnitude = np.abs(response)
+    zeros = magnitude <= MAGNITUDE_FLOOR * max(float(magnitude.max()), MAGNITUDE_FLOOR)
+
+    frequencies = np.arange(grid_size) * F / nfft
+    magnitude_db = 20 * np.log10(np.maximum(magnitude, MAGNITUDE_FLOOR * max(float(magnitude.max()), 1.0)))
+    phase = np.unwrap(np.angle(response))
+    delays = group_delay(values, nfft)
+    delays[zeros] = np.nan
+
+    return frequencies, magnitude_db, phase, delays
+
+
+def min_max_indexes(values: np.ndarray, points: int) -> np.ndarray:
+    """
+    Keeps the first and last values and picks the minimum and the maximum of every bucket between them,
+    so the peaks and the nulls survive
+    :param values: Series to downsample
+    :param points: Maximum number of points, at least 3
+    :return: Sorted indexes of the kept points
+    """
+    if len(values) <= points:
+        return np.arange(len(values))
+
+    # Two points are reserved for the endpoints, a single free point keeps the maximum
+    free_points = max(points - 2, 1)
+    buckets = max(free_points // 2, 1)
+    edges = np.linspace(1, len(values) - 1, buckets + 1).astype(np.int64)
+    indexes = [0, len(values) - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            bucket = values[start:end]
+            indexes.append(start + int(np.argmax(bucket)))
+            if free_points > 1:
+                indexes.append(start + int(np.argmin(bucket)))
+
+    return np.unique(indexes)
+
+
+def lttb_indexes(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets, keeps the first and last points and from every bucket the point that
+    forms the largest triangle with the point kept before and the average of the next bucket
+    :param x: Horizontal values
+    :param y: Series to downsample
+    :param points: Number of points, at least 3
+    :return: Sorted indexes of the kept points
+    """
+    if len(y) <= points or points < 3:
+        return np.arange(len(y)) if len(y) <= points else min_max_indexes(y, points)
+
+    edges = np.linspace(1, len(y) - 1, points - 1).astype(np.int64)
+    indexes = np.empty(points, dtype=np.int64)
+    indexes[0], indexes[-1] = 0, len(y) - 1
+
+    previous = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        next_start, next_end = edges[bucket + 1], edges[bucket + 2] if bucket + 2 < len(edges) else len(y)
+        next_x = np.mean(x[next_start:max(next_end, next_start + 1)])
+        next_y = np.mean(y[next_start:max(next_end, next_start + 1)])
+
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous]) -
+            (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indexes[bucket + 1] = previous
+
+    return indexes
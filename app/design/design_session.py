@@ -0,0 +1,128 @@
+"""
+This file contains the incremental design session used by the interactive tuning
+"""
+import numpy as np
+
+from app.design.fir_filter import FIRFilter
+from app.design.fir_filter_factory import create_fir_filter
+from app.design.types.fir_filter_types import CoefficientType, FilterConf
+
+EDGE_KEYS: list[str] = ['fp', 'fs', 'fp2', 'fs2', 'F']
+
+# These designs do not split into ripples, order, window and impulse response
+NON_INCREMENTAL_FILTER_TYPES: list[str] = ['multiband']
+NON_INCREMENTAL_DESIGN_METHODS: list[str] = ['equiripple']
+
+
+class DesignSession:
+    """
+    Design Session class, keeps the intermediate results of the last design and recomputes only the stages
+    whose inputs changed:
+        - delta, AS, AP, D and alpha depend on As and Ap
+        - the window depends on the window, the order and, for Kaiser, on AS
+        - the impulse response depends on the filter type, the edges and the order
+    Every stage is keyed by its inputs, so the coefficients are the same as a full FIRFilter design.
+    """
+
+    def __init__(self, filter_conf: FilterConf, round_value: int = 7, dtype: CoefficientType = 'float64'):
+        self.filter_conf = dict(filter_conf)
+        self.round_value = round_value
+        self.dtype = dtype
+
+        self.fir_filter: FIRFilter | None = None
+        self.recomputed: list[str] = []
+        """Stages recomputed by the last design"""
+
+        self._ripples_key = None
+        self._ripples = None
+        self._window_key = None
+        self._window_coefficients = None
+        self._impulse_key = None
+        self._impulse_response = None
+        self._coefficients_key = None
+        self._coefficients = None
+
+        self.design()
+
+    def update(self, **changes) -> list[float]:
+        """
+        Changes some values of the configuration and designs the filter again.
+        The configuration is only kept when the new design succeeds.
+        :param changes: Configuration values to change, None removes the value
+        :return: Ordered filter coefficients
+        """
+        previous_conf = self.filter_conf
+        self.filter_conf = {
+            key: value for key, value in {**previous_conf, **changes}.items() if value is not None
+        }
+        try:
+            return self.design()
+        except Exception:
+            self.filter_conf = previous_conf
+            raise
+
+    def design(self) -> list[float]:
+        """
+        Designs the filter of the current configuration reusing the stages that did not change
+        :return: Ordered filter coefficients
+        """
+        fir_filter = create_fir_filter(self.filter_conf, self.round_value, self.dtype)
+        self.recomputed = []
+
+        if (
+                self.filter_conf['filter_type'] in NON_INCREMENTAL_FILTER_TYPES or
+                self.filter_conf.get('design_method') in NON_INCREMENTAL_DESIGN_METHODS
+        ):
+            self.recomputed = ['ripples', 'window', 'impulse_response', 'coefficients']
+            fir_filter.design()
+            self.fir_filter = fir_filter
+            return fir_filter.coefficients
+
+        ripples_key = (self.filter_conf['As'], self.filter_conf['Ap'])
+        if ripples_key != self._ripples_key:
+            fir_filter._calculate_delta()
+            fir_filter._calculate_ripples()
+            fir_filter._calculate_d_parameter()
+            fir_filter._calculate_alpha_parameter()
+            self._ripples_key = ripples_key
+            self._ripples = (fir_filter.delta, fir_filter.AS, fir_filter.AP, fir_filter.D, fir_filter.alpha)
+            self.recomputed.append('ripples')
+        fir_filter.delta, fir_filter.AS, fir_filter.AP, fir_filter.D, fir_filter.alpha = self._ripples
+
+        # The order is a few operations and sets the order of the strategy used by the impulse response
+        fir_filter.N, _, fir_filter.n = fir_filter.filter_strategy.calculate_filter_order(fir_filter.D)
+
+        window = self.filter_conf['filter_window']
+        window_key = (window, fir_filter.n, fir_filter.N, fir_filter.AS if window == 'kaiser' else None)
+        if window_key != self._window_key:
+            self._window_coefficients = fir_filter._calculate_window(fir_filter.n, fir_filter.N)
+            self._window_key = window_key
+            self.recomputed.append('window')
+        fir_filter.window_coefficients = self._window_coefficients
+
+        impulse_key = (
+            self.filter_conf['filter_type'], fir_filter.n, *(self.filter_conf.get(key) for key in EDGE_KEYS)
+        )
+        if impulse_key != self._impulse_key:
+            self._impulse_response = fir_filter.filter_strategy.get_impulse_response()
+            self._impulse_key = impulse_key
+            self.recomputed.append('impulse_response')
+        fir_filter.impulse_response = self._impulse_response
+
+        coefficients_key = (window_key, impulse_key)
+        if coefficients_key != self._coefficients_key:
+            coef_filt = [
+                round(self._window_coefficients[i] * self._impulse_response[i], self.round_value)
+                for i in range(fir_filter.n + 1)
+            ]
+            self._coefficients = fir_filter.order_coefficients(coef_filt)
+            if self.dtype == 'float32':
+                self._coefficients = np.asarray(self._coefficients, dtype=np.float32).tolist()
+            self._coefficients_key = coefficients_key
+            self.recomputed.append('coefficients')
+
+        fir_filter.coefficients = self._coefficients
+        fir_filter.zero_taps = fir_filter.get_zero_taps(self._coefficients)
+        self.fir_filter = fir_filter
+
+        return self._coefficients
@@ -21,3 +21,7 @@ class IncorrectTypeError(FilterConfValidationError):
     def __init__(self, incorrect_keys: list[str]):
         super().__init__(f"Incorrect types for keys: {', '.join(incorrect_keys)}")
         self.incorrect_keys = incorrect_keys
+
+
+class InvalidValueError(FilterConfValidationError, ValueError):
+    """Raised when a value of the configuration is out of its valid range."""
@@ -0,0 +1,116 @@
+"""
+This file contains the implementation of the equiripple (Parks-McClellan) filter strategy.
+"""
+import numpy as np
+from scipy.signal import remez
+
+from app.design.analysis.filter_bands import get_band_template
+from app.design.exceptions.filter_config_exceptions import InvalidValueError
+from app.design.filter_type_strategies.filter_type_strategy import FilterTypeStrategy
+from app.design.types.equiripple_types import TapSavingReport
+from app.design.types.fir_filter_types import FilterConf
+from app.design.validators.filter_conf_validator import FilterConfValidator
+
+
+class EquirippleFilterStrategy(FilterTypeStrategy, FilterConfValidator):
+    """
+    The Equiripple Filter Strategy class implements the Filter Type Strategy interface.
+    The order of the windowed strategy of the same configuration is the limit, the shortest odd length
+    whose Parks-McClellan design meets Ap and As is searched below it.
+    It must be combined with the rectangular window, the equiripple taps are not windowed.
+    """
+    GRID_SIZE = 8192
+    MAX_ITERATIONS = 100
+
+    def __init__(self, filter_conf: FilterConf, windowed_strategy: FilterTypeStrategy, round_value: int = 7):
+
+        FilterConfValidator.__init__(self, filter_conf)
+
+        self.round_value = round_value
+        self.windowed_strategy = windowed_strategy
+
+        self.F = filter_conf['F']
+        self.bands = get_band_template(filter_conf)
+
+        delta_s = 10 ** (-0.05 * filter_conf['As'])
+        delta_p = (10 ** (0.05 * filter_conf['Ap']) - 1) / (10 ** (0.05 * filter_conf['Ap']) + 1)
+        # The passband ripple is relative to the gain of the band, the stopband attenuation is absolute
+        self.band_deltas = np.array([gain * delta_p if gain > 0 else delta_s for _, _, gain in self.bands])
+
+        self.windowed_N = None
+        self.n = None
+        self.taps = None
+
+    def _design(self, N: int) -> np.ndarray | None:
+        """
+        Designs the equiripple taps of length N
+        :return: Taps or None if the algorithm did not converge
+        """
+        edges = [edge for start, end, _ in self.bands for edge in (start, end)]
+        desired = [gain for _, _, gain in self.bands]
+        try:
+            return remez(N, edges, desired, weight=1 / self.band_deltas, fs=self.F, maxiter=self.MAX_ITERATIONS)
+        except ValueError:
+            return None
+
+    def _meets_spec(self, taps: np.ndarray) -> bool:
+        """
+        Checks the deviation of every band against its ripple on a dense grid
+        """
+        nfft = max(2 * self.GRID_SIZE, len(taps))
+        magnitude = np.abs(np.fft.rfft(taps, nfft))
+        frequencies = np.fft.rfftfreq(nfft, d=1 / self.F)
+
+        for (start, end, gain), delta in zip(self.bands, self.band_deltas):
+            band = magnitude[(frequencies >= start) & (frequencies <= end)]
+            if band.size and np.max(np.abs(band - gain)) > delta:
+                return False
+
+        return True
+
+    def calculate_filter_order(self, d: float) -> tuple[int, int, int]:
+        self.windowed_N, N_o, _ = self.windowed_strategy.calculate_filter_order(d)
+
+        # Binary search over odd lengths up to the windowed length
+        low, high = 1, (self.windowed_N - 1) // 2
+        best_taps = None
+        while low <= high:
+            half = (low + high) // 2
+            taps = self._design(2 * half + 1)
+            if taps is not None and self._meets_spec(taps):
+                best_taps = taps
+                high = half - 1
+            else:
+                low = half + 1
+
+        if best_taps is None:
+            raise InvalidValueError(
+                f"No equiripple design up to {self.windowed_N} taps meets Ap and As, relax the specification"
+            )
+
+        self.taps = best_taps
+        N = len(best_taps)
+        self.n = int((N - 1) / 2)
+
+        return N, N_o, self.n
+
+    def get_impulse_response(self) -> list[float]:
+        if self.taps is None:
+            raise ValueError("Filter order is not defined")
+
+        return np.round(self.taps[self.n:], self.round_value).tolist()
+
+    def get_tap_saving(self) -> TapSavingReport:
+        """
+        Compares the taps of the equiripple design with the windowed design of the same configuration
+        """
+        if self.taps is None:
+            raise ValueError("Filter order is not defined")
+
+        saved_taps = self.windowed_N - len(self.taps)
+        return TapSavingReport(
+            windowed_taps=self.windowed_N,
+            equiripple_taps=len(self.taps),
+            saved_taps=saved_taps,
+            saving_percent=round(100 * saved_taps / self.windowed_N, 2),
+        )
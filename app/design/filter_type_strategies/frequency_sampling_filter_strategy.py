@@ -0,0 +1,116 @@
+"""
+This file contains the implementation of the frequency sampling filter strategy.
+"""
+import numpy as np
+
+from app.design.exceptions.filter_config_exceptions import InvalidValueError
+from app.design.filter_type_strategies.filter_type_strategy import FilterTypeStrategy
+from app.design.types.fir_filter_types import FilterConf
+from app.design.validators.filter_conf_validator import FilterConfValidator
+
+
+class FrequencySamplingFilterStrategy(FilterTypeStrategy, FilterConfValidator):
+    """
+    The Frequency Sampling Filter Strategy class implements the Filter Type Strategy interface.
+    It designs linear-phase filters from an arbitrary multiband magnitude template: the template is
+    sampled on a dense grid, the center of every gap between bands becomes a raised-cosine transition
+    and the impulse response is obtained with an inverse real FFT, so the cost is O(N log N).
+    The window spreads the transitions, so the order is calculated for the part of the gaps left by the smoothing.
+    """
+    FILTER_ORDER_FACTOR = 2
+    GRID_FACTOR = 8
+    TRANSITION_SMOOTHING = 0.2
+
+    def __init__(self, filter_conf: FilterConf, round_value: int = 7):
+
+        FilterConfValidator.__init__(self, filter_conf)
+
+        self.round_value = round_value
+
+        self.F = filter_conf['F']
+        self.bands = sorted(filter_conf['bands'], key=lambda band: band['start'])
+
+        self._validate_band_edges()
+
+        self.n = None
+        self.N = None
+
+    def _validate_band_edges(self):
+        """
+        Validates that the bands are inside 0 and F/2 and do not overlap
+        :raises: InvalidValueError if the bands are not valid
+        """
+        for band in self.bands:
+            if not 0 <= band['start'] < band['end'] <= self.F / 2:
+                raise InvalidValueError("Every band must satisfy 0 <= start < end <= F/2")
+
+            if band['gain'] < 0:
+                raise InvalidValueError("The gain of the bands cannot be negative")
+
+        for previous, current in zip(self.bands, self.bands[1:]):
+            if current['start'] <= previous['end']:
+                raise InvalidValueError("The bands must be separated by transition bands")
+
+    def _get_transition_width(self) -> float:
+        """
+        Gets the narrowest transition between bands
+        """
+        if len(self.bands) < 2:
+            raise InvalidValueError("At least two bands are needed to define a transition")
+
+        return min(current['start'] - previous['end'] for previous, current in zip(self.bands, self.bands[1:]))
+
+    def calculate_filter_order(self, d: float) -> tuple[int, int, int]:
+        if d == 0:
+            raise ValueError("d cannot be 0")
+        transition_width = (1 - self.TRANSITION_SMOOTHING) * self._get_transition_width()
+        N = int(((self.F * d) / transition_width) + self.FILTER_ORDER_FACTOR)
+
+        N_o = N
+
+        N_int = int(N)
+        if (N_int + 1) % 2 == 0:
+            N = N_int + 2
+        else:
+            N = N_int + 1
+
+        self.N = N
+        self.n = int((N - 1) / 2)
+
+        return N, N_o, self.n
+
+    def get_desired_response(self, frequencies: np.ndarray) -> np.ndarray:
+        """
+        Samples the magnitude template, the regions before the first and after the last band keep their gain
+        :param frequencies: Frequencies in Hz
+        :return: Linear magnitude at each frequency
+        """
+        edges = [edge for band in self.bands for edge in (band['start'], band['end'])]
+        gains = [band['gain'] for band in self.bands for _ in range(2)]
+        response = np.interp(frequencies, edges, gains)
+
+        # Raised-cosine transitions centered in the gaps
+        for previous, current in zip(self.bands, self.bands[1:]):
+            center = (previous['end'] + current['start']) / 2
+            half_width = self.TRANSITION_SMOOTHING * (current['start'] - previous['end']) / 2
+            response[(frequencies > previous['end']) & (frequencies <= center - half_width)] = previous['gain']
+            response[(frequencies >= center + half_width) & (frequencies < current['start'])] = current['gain']
+
+            mask = (frequencies > center - half_width) & (frequencies < center + half_width)
+            t = (frequencies[mask] - (center - half_width)) / (2 * half_width)
+            response[mask] = previous['gain'] + (current['gain'] - previous['gain']) * (1 - np.cos(np.pi * t)) / 2
+
+        return response
+
+    def get_impulse_response(self) -> list[float]:
+        if not self.n:
+            raise ValueError("Filter order is not defined")
+
+        # The grid is dense enough to make the time aliasing of the inverse transform negligible
+        nfft = 1 << int(np.ceil(np.log2(self.GRID_FACTOR * self.N)))
+        frequencies = np.fft.rfftfreq(nfft, d=1 / self.F)
+
+        # Zero-phase template, its inverse transform is real and even around 0
+        h = np.fft.irfft(self.get_desired_response(frequencies), nfft)
+
+        return np.round(h[:self.n + 1], self.round_value).tolist()
@@ -66,12 +66,6 @@ class KaiserWindowStrategy(FilterWindowStrategy):
         return result + 1
 
     def calculate_window_coeficients(self, n: int, n_factor: int, AS: float) -> list[float]:
-        if not self.alpha:
-            raise ValueError("Alpha parameter not calculated")
-
-        if not self.betas:
-            raise ValueError("Betas not calculated")
-
         # Calculate alpha
         self._calculate_alpha_parameter(AS=AS)
 
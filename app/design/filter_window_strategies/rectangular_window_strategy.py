@@ -0,0 +1,17 @@
+"""
+This file contains the implementation of the Rectangular window strategy.
+"""
+from app.design.filter_window_strategies.filter_window_strategy import FilterWindowStrategy
+
+
+class RectangularWindowStrategy(FilterWindowStrategy):
+    """
+    The Rectangular Window Strategy class implements the Filter Window Strategy interface.
+    It leaves the impulse response unchanged, it is used by the methods that do not need a window.
+    """
+
+    def __init__(self, round_value: int = 7):
+        self.round_value = round_value
+
+    def calculate_window_coeficients(self, n: int, n_factor: int) -> list[float]:
+        return [1.0] * (n + 1)
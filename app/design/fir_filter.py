@@ -11,7 +11,8 @@ from tabulate import tabulate
 
 from app.design.filter_type_strategies.filter_type_strategy import FilterTypeStrategy
 from app.design.filter_window_strategies.filter_window_strategy import FilterWindowStrategy
-from app.design.types.fir_filter_types import FilterConf
+from app.design.filter_window_strategies.kaiser_window_strategy import KaiserWindowStrategy
+from app.design.types.fir_filter_types import CoefficientType, FilterConf
 from app.design.validators.filter_conf_validator import FilterConfValidator
 
 
@@ -43,22 +44,34 @@ class FIRFilter(FilterConfValidator):
             filter_conf: FilterConf | Dict[str, float | int],
             filter_strategy: FilterTypeStrategy,
             window_strategy: FilterWindowStrategy,
-            round_value: int = 7
+            round_value: int = 7,
+            dtype: CoefficientType = 'float64'
 
     ):
         super().__init__(filter_conf)
 
+        if dtype not in ('float32', 'float64'):
+            raise ValueError("dtype must be one of float32, float64")
+
         self.filter_conf = filter_conf
         self.round_value = round_value
+        self.dtype = dtype
         self.filter_strategy = filter_strategy
         self.window_strategy = window_strategy
 
         self.As = filter_conf['As']
         self.Ap = filter_conf['Ap']
-        self.fp = filter_conf['fp']
-        self.fs = filter_conf['fs']
+        self.fp = filter_conf.get('fp')
+        self.fs = filter_conf.get('fs')
         self.F = filter_conf['F']
 
+        self.N = None
+        self.n = None
+        self.impulse_response = None
+        self.window_coefficients = None
+        self.coefficients = None
+        self.zero_taps = None
+
     def _calculate_delta(self) -> float:
         """
         Calculates the delta parameter for the filter
@@ -127,6 +140,15 @@ class FIRFilter(FilterConfValidator):
 
         return coef_ordered
 
+    @staticmethod
+    def get_zero_taps(coefficients: list[float]) -> list[int]:
+        """
+        Gets the taps that are exactly zero, every other tap of half-band filters is zero
+        :param coefficients: Ordered coefficients
+        :return: Indexes of the zero taps
+        """
+        return [idx for idx, value in enumerate(coefficients) if value == 0]
+
     def plot(self, coefficients: list[float]):
         """
         Plots the filter graphic
@@ -143,9 +165,22 @@ class FIRFilter(FilterConfValidator):
         plt.grid()
         plt.show()
 
-    def execute(self):
+    def _calculate_window(self, n: int, N: int) -> list[float]:
         """
-        Executes the creation of the filter
+        Calculates the window coefficients, the Kaiser window also needs the As value
+        :param n: Filter Order
+        :param N: Factor to calculate N
+        :return: List of window coefficients
+        """
+        if isinstance(self.window_strategy, KaiserWindowStrategy):
+            return self.window_strategy.calculate_window_coeficients(n, N, AS=self.AS)
+
+        return self.window_strategy.calculate_window_coeficients(n, N)
+
+    def estimate_order(self) -> int:
+        """
+        Calculates the filter order without calculating the coefficients
+        :return: Number of taps N
         """
         # Delta
         self._calculate_delta()
@@ -156,18 +191,46 @@ class FIRFilter(FilterConfValidator):
         # Alpha
         self._calculate_alpha_parameter()
         # Filter order
-        N, N_o, n = self.filter_strategy.calculate_filter_order(self.D)
+        self.N, N_o, self.n = self.filter_strategy.calculate_filter_order(self.D)
+
+        return self.N
+
+    def design(self) -> list[float]:
+        """
+        Calculates the filter coefficients without printing or plotting them
+        :return: Ordered filter coefficients
+        """
+        self.estimate_order()
         # Coefficients
-        coefficients = self.filter_strategy.get_impulse_response()
+        self.impulse_response = self.filter_strategy.get_impulse_response()
         # Window
-        window_coef = self.window_strategy.calculate_window_coeficients(n, N)
+        self.window_coefficients = self._calculate_window(self.n, self.N)
 
         coef_filt = []
 
-        for i in range(n + 1):
-            coef_filt.append(round(window_coef[i] * coefficients[i], self.round_value))
+        for i in range(self.n + 1):
+            coef_filt.append(round(self.window_coefficients[i] * self.impulse_response[i], self.round_value))
+
+        self.coefficients = self.order_coefficients(coef_filt)
+        if self.dtype == 'float32':
+            # The values are stored as float32, so every consumer sees the same coefficients
+            self.coefficients = np.asarray(self.coefficients, dtype=np.float32).tolist()
+        self.zero_taps = self.get_zero_taps(self.coefficients)
+
+        return self.coefficients
+
+    def get_coefficient_array(self) -> np.ndarray:
+        """
+        Gets the coefficients as an array of the filter dtype, the filter is designed if it was not designed yet
+        """
+        coefficients = self.coefficients if self.coefficients is not None else self.design()
+        return np.asarray(coefficients, dtype=self.dtype)
 
-        coef_filt_ordenados = self.order_coefficients(coef_filt)
+    def execute(self):
+        """
+        Executes the creation of the filter
+        """
+        coef_filt_ordenados = self.design()
 
         print(show_coef_table(coef_filt_ordenados))
 
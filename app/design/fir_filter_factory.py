@@ -0,0 +1,108 @@
+"""
+This file contains the factory that builds a FIR filter from its configuration
+"""
+from app.design.exceptions.filter_config_exceptions import InvalidValueError
+from app.design.filter_type_strategies.bandpass_filter_strategy import BandPassFilterStrategy
+from app.design.filter_type_strategies.bandstop_filter_strategy import BandStopFilterStrategy
+from app.design.filter_type_strategies.equiripple_filter_strategy import EquirippleFilterStrategy
+from app.design.filter_type_strategies.filter_type_strategy import FilterTypeStrategy
+from app.design.filter_type_strategies.frequency_sampling_filter_strategy import FrequencySamplingFilterStrategy
+from app.design.filter_type_strategies.highpass_filter_strategy import HighPassFilterStrategy
+from app.design.filter_type_strategies.lowpass_filter_strategy import LowPassFilterStrategy
+from app.design.filter_window_strategies.blackman_window_strategy import BlackmanWindowStrategy
+from app.design.filter_window_strategies.filter_window_strategy import FilterWindowStrategy
+from app.design.filter_window_strategies.hamming_window_strategy import HammingWindowStrategy
+from app.design.filter_window_strategies.kaiser_window_strategy import KaiserWindowStrategy
+from app.design.filter_window_strategies.rectangular_window_strategy import RectangularWindowStrategy
+from app.design.fir_filter import FIRFilter
+from app.design.types.fir_filter_types import CoefficientType, FilterConf
+from app.design.validators.filter_conf_validator import FilterConfValidator
+
+FILTER_TYPE_STRATEGIES: dict[str, type[FilterTypeStrategy]] = {
+    'lowpass': LowPassFilterStrategy,
+    'highpass': HighPassFilterStrategy,
+    'bandpass': BandPassFilterStrategy,
+    'stopband': BandStopFilterStrategy,
+    'multiband': FrequencySamplingFilterStrategy,
+}
+
+FILTER_WINDOW_STRATEGIES: dict[str, type[FilterWindowStrategy]] = {
+    'hamming': HammingWindowStrategy,
+    'blackman': BlackmanWindowStrategy,
+    'kaiser': KaiserWindowStrategy,
+}
+
+# The two edge strategies name the first band edges fp1 and fs1
+TWO_EDGE_FILTER_TYPES: list[str] = ['bandpass', 'stopband']
+
+
+def create_filter_strategy(filter_conf: FilterConf, round_value: int = 7) -> FilterTypeStrategy:
+    """
+    Creates the filter type strategy of the configuration
+    :param filter_conf: Filter configuration
+    :param round_value: Decimals used to round the values
+    :return: Filter type strategy
+    """
+    # The strategies read the edges they need, the values are validated before any of them is built
+    FilterConfValidator(filter_conf).validate_values()
+
+    filter_type = filter_conf['filter_type']
+    if filter_type not in FILTER_TYPE_STRATEGIES:
+        raise InvalidValueError(f"There is no strategy for {filter_type} filters")
+
+    strategy_conf = filter_conf
+    if filter_type in TWO_EDGE_FILTER_TYPES:
+        strategy_conf = {**filter_conf, 'fp1': filter_conf['fp'], 'fs1': filter_conf['fs']}
+
+    strategy = FILTER_TYPE_STRATEGIES[filter_type](strategy_conf, round_value=round_value)
+
+    if filter_conf.get('design_method') == 'equiripple':
+        # The windowed strategy gives the order the equiripple search starts from
+        return EquirippleFilterStrategy(filter_conf, strategy, round_value=round_value)
+
+    return strategy
+
+
+def create_window_strategy(filter_conf: FilterConf, round_value: int = 7) -> FilterWindowStrategy:
+    """
+    Creates the filter window strategy of the configuration
+    :param filter_conf: Filter configuration
+    :param round_value: Decimals used to round the values
+    :return: Filter window strategy
+    """
+    if filter_conf.get('design_method') == 'equiripple':
+        return RectangularWindowStrategy(round_value=round_value)
+
+    filter_window = filter_conf['filter_window']
+    if filter_window not in FILTER_WINDOW_STRATEGIES:
+        raise InvalidValueError(f"There is no strategy for {filter_window} windows")
+
+    return FILTER_WINDOW_STRATEGIES[filter_window](round_value=round_value)
+
+
+def create_fir_filter(filter_conf: FilterConf, round_value: int = 7, dtype: CoefficientType = 'float64') -> FIRFilter:
+    """
+    Creates a FIR filter with the strategies selected by the configuration
+    :param filter_conf: Filter configuration
+    :param round_value: Decimals used to round the values
+    :param dtype: Precision of the designed coefficients
+    :return: FIR filter ready to be designed
+    """
+    return FIRFilter(
+        filter_conf=filter_conf,
+        filter_strategy=create_filter_strategy(filter_conf, round_value),
+        window_strategy=create_window_strategy(filter_conf, round_value),
+        round_value=round_value,
+        dtype=dtype
+    )
+
+
+def design_filter(filter_conf: FilterConf, round_value: int = 7, dtype: CoefficientType = 'float64') -> list[float]:
+    """
+    Designs the filter of the configuration
+    :param filter_conf: Filter configuration
+    :param round_value: Decimals used to round the values
+    :param dtype: Precision of the designed coefficients
+    :return: Ordered filter coefficients
+    """
+    return create_fir_filter(filter_conf, round_value, dtype).design()
@@ -0,0 +1,69 @@
+"""
+This file contains the hash that identifies a filter design
+"""
+import hashlib
+import json
+
+from app.design.types.fir_filter_types import CoefficientType, FilterConf
+from app.design.validators.filter_conf_validator import REQUIRED_KEYS, OPTIONAL_KEYS
+
+ALGORITHM_VERSION: int = 1
+"""Version of the design algorithms, it must be increased when a change alters the designed coefficients"""
+
+
+def canonical_filter_conf(filter_conf: FilterConf) -> dict:
+    """
+    Gets the canonical form of a configuration, numbers become floats and unknown or empty keys are dropped
+    :param filter_conf: Filter configuration
+    """
+    canonical = {}
+    for key in REQUIRED_KEYS + OPTIONAL_KEYS:
+        value = filter_conf.get(key)
+        if value is None:
+            continue
+        canonical[key] = value if isinstance(value, str) else float(value)
+
+    if filter_conf.get('design_method', 'window') not in (None, 'window'):
+        canonical['design_method'] = filter_conf['design_method']
+
+    if filter_conf.get('bands'):
+        canonical['bands'] = [
+            [float(band['start']), float(band['end']), float(band['gain'])] for band in filter_conf['bands']
+        ]
+
+    return canonical
+
+
+def design_hash(filter_conf: FilterConf, round_value: int = 7, dtype: CoefficientType = 'float64') -> str:
+    """
+    Hashes the values that determine the coefficients of a design
+    :param filter_conf: Filter configuration
+    :param round_value: Decimals used to round the values
+    :param dtype: Precision of the coefficients
+    :return: Hexadecimal SHA-256 digest
+    """
+    payload = {'filter_conf': canonical_filter_conf(filter_conf), 'round_value': round_value}
+    # float64 designs keep the hashes they had before the dtype existed
+    if dtype != 'float64':
+        payload['dtype'] = dtype
+    serialized = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def content_hash(filter_conf: FilterConf, round_value: int = 7, dtype: CoefficientType = 'float64', **params) -> str:
+    """
+    Hashes the content of a response derived from a design, the design, the algorithm version and the
+    parameters of the response
+    :param filter_conf: Filter configuration
+    :param round_value: Decimals used to round the values
+    :param dtype: Precision of the coefficients
+    :param params: Parameters of the response, they must be serializable as JSON
+    :return: Hexadecimal SHA-256 digest
+    """
+    payload = {
+        'design': design_hash(filter_conf, round_value, dtype),
+        'algorithm_version': ALGORITHM_VERSION,
+        'params': params,
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(serialized.encode()).hexdigest()
@@ -288,19 +288,15 @@ print('\n')
 
 """###################################### EXPORTAR DATOS A EXCEL #######################################################"""
 
-wb = Workbook()
+wb = Workbook(write_only=True)
 ruta = 'ventana.xlsx'
 
-hoja = wb.active
+hoja = wb.create_sheet()
 
-fila = 2  # Fila donde empezamos
+hoja.append([])  # Empezamos en la fila 2, columna B
 
 for val, dato, h, coeficiente in zip(range(n + 1), coef_v, hd, coef_filt):
-    hoja.cell(column=2, row=fila, value=val)
-    hoja.cell(column=3, row=fila, value=dato)
-    hoja.cell(column=4, row=fila, value=h)
-    hoja.cell(column=5, row=fila, value=coeficiente)
-    fila += 1
+    hoja.append([None, val, dato, h, coeficiente])
 
 wb.save(filename=ruta)
 
@@ -0,0 +1,162 @@
+"""
+This file contains the planner of multistage decimating designs
+"""
+import math
+
+from app.design.fir_filter_factory import create_fir_filter
+from app.design.types.fir_filter_types import FilterConf
+from app.design.types.multistage_types import MultistagePlan, StagePlan
+from app.filtering.multistage_cascade import DecimationStage, MultistageCascade
+
+
+def factorizations(value: int, max_factors: int) -> list[tuple[int, ...]]:
+    """
+    Gets the ordered factorizations of a value in factors greater than 1
+    :param value: Value to factorize
+    :param max_factors: Maximum number of factors
+    :return: List of tuples of factors
+    """
+    if value == 1:
+        return [()]
+
+    if max_factors == 0:
+        return []
+
+    result = []
+    for factor in range(2, value + 1):
+        if value % factor == 0:
+            for rest in factorizations(value // factor, max_factors - 1):
+                result.append((factor,) + rest)
+
+    return result
+
+
+class MultistagePlanner:
+    """
+    Multistage Planner class, splits a lowpass configuration into a cascade of decimating stages.
+    Stage i runs at F_(i-1) and decimates to F_i, its stopband starts at F_i - fs so nothing aliases
+    into the final band, the last stage uses the original fs and Ap is split between the stages.
+    The factors are chosen to minimize the multiply-accumulates per input sample.
+    """
+    MAX_DECIMATION = 1024
+
+    def __init__(self, filter_conf: FilterConf, round_value: int = 7, max_stages: int = 3):
+        if filter_conf['filter_type'] != 'lowpass':
+            raise ValueError("Multistage designs are only available for lowpass filters")
+
+        self.filter_conf = filter_conf
+        self.round_value = round_value
+        self.max_stages = max_stages
+
+        self._taps_cache: dict[tuple, int] = {}
+
+    @property
+    def max_decimation(self) -> int:
+        """
+        Largest decimation whose output rate keeps the stopband frequency below its Nyquist frequency
+        """
+        return min(self.MAX_DECIMATION, math.floor(self.filter_conf['F'] / (2 * self.filter_conf['fs'])))
+
+    def _get_stage_conf(self, input_rate: float, output_rate: float, last: bool, stages: int) -> FilterConf:
+        stage_conf = dict(self.filter_conf)
+        stage_conf['F'] = input_rate
+        stage_conf['fs'] = self.filter_conf['fs'] if last else output_rate - self.filter_conf['fs']
+        stage_conf['Ap'] = self.filter_conf['Ap'] / stages
+
+        return FilterConf(**stage_conf)
+
+    def _estimate_taps(self, stage_conf: FilterConf) -> int:
+        """
+        Estimates the taps of a stage with the windowed order, even if the stages use other design methods
+        """
+        key = (stage_conf['F'], stage_conf['fs'], stage_conf['Ap'])
+        if key not in self._taps_cache:
+            estimate_conf = {**stage_conf, 'design_method': 'window'}
+            self._taps_cache[key] = create_fir_filter(estimate_conf, self.round_value).estimate_order()
+
+        return self._taps_cache[key]
+
+    def _plan_factors(self, factors: tuple[int, ...]) -> list[StagePlan] | None:
+        """
+        Plans the stages of a factorization
+        :return: Stages or None if a stage cannot be designed
+        """
+        stages = []
+        input_rate = self.filter_conf['F']
+        accumulated = 1
+        for idx, factor in enumerate(factors):
+            output_rate = input_rate / factor
+            accumulated *= factor
+            stage_conf = self._get_stage_conf(input_rate, output_rate, idx == len(factors) - 1, len(factors))
+            if stage_conf['fs'] <= stage_conf['fp']:
+                return None
+
+            taps = self._estimate_taps(stage_conf)
+            stages.append(StagePlan(
+                decimation=factor,
+                input_rate=input_rate,
+                output_rate=output_rate,
+                fp=stage_conf['fp'],
+                fs=stage_conf['fs'],
+                Ap=stage_conf['Ap'],
+                taps=taps,
+                macs_per_input_sample=taps / accumulated,
+            ))
+            input_rate = output_rate
+
+        return stages
+
+    def plan(self, decimation: int | None = None) -> MultistagePlan:
+        """
+        Finds the cheapest cascade
+        :param decimation: Total decimation, every decimation up to the maximum is tried when it is None
+        :return: Plan of the cheapest cascade
+        """
+        max_decimation = self.max_decimation
+        if decimation is not None and not 1 <= decimation <= max_decimation:
+            raise ValueError(f"decimation must be between 1 and {max_decimation}")
+
+        candidates = [decimation] if decimation is not None else range(1, max_decimation + 1)
+
+        best_stages, best_macs = None, math.inf
+        for total in candidates:
+            for factors in factorizations(total, self.max_stages) if total > 1 else [(1,)]:
+                stages = self._plan_factors(factors)
+                if stages is None:
+                    continue
+
+                macs = sum(stage['macs_per_input_sample'] for stage in stages)
+                if macs < best_macs:
+                    best_stages, best_macs = stages, macs
+
+        if best_stages is None:
+            raise ValueError("There is no multistage plan for this configuration")
+
+        total_decimation = math.prod(stage['decimation'] for stage in best_stages)
+        single_stage_taps = self._estimate_taps(self.filter_conf)
+
+        return MultistagePlan(
+            stages=best_stages,
+            decimation=total_decimation,
+            output_rate=self.filter_conf['F'] / total_decimation,
+            macs_per_input_sample=best_macs,
+            single_stage_taps=single_stage_taps,
+            single_stage_macs=single_stage_taps,
+            single_stage_decimated_macs=single_stage_taps / total_decimation,
+        )
+
+    def design(self, plan: MultistagePlan) -> MultistageCascade:
+        """
+        Designs the stages of a plan with the strategies of the configuration
+        :param plan: Multistage plan
+        :return: Runnable cascade
+        """
+        stages = []
+        for idx, stage in enumerate(plan['stages']):
+            stage_conf = self._get_stage_conf(
+                stage['input_rate'], stage['output_rate'], idx == len(plan['stages']) - 1, len(plan['stages'])
+            )
+            coefficients = create_fir_filter(stage_conf, self.round_value).design()
+            stages.append(DecimationStage(coefficients, stage['decimation']))
+
+        return MultistageCascade(stages)
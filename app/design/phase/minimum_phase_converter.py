@@ -0,0 +1,101 @@
+"""
+This file contains the implementation of the minimum phase converter.
+"""
+import numpy as np
+from scipy import fft
+
+from app.design.analysis.filter_bands import get_passbands
+from app.design.analysis.frequency_response import group_delay
+from app.design.fir_filter import FIRFilter
+from app.design.types.minimum_phase_types import MinimumPhaseReport
+from app.design.verification.spec_verifier import SpecVerifier
+
+
+class MinimumPhaseConverter:
+    """
+    Converts a linear phase filter to the minimum phase filter with the same magnitude response, using the
+    homomorphic method: the real cepstrum of the log magnitude is folded onto the causal part, so its
+    exponential has every zero inside the unit circle and the energy at the start of the impulse response.
+    """
+
+    def __init__(self, fft_factor: int = 32, min_fft_size: int = 8192, floor_db: float = -300):
+        if fft_factor < 2:
+            raise ValueError("fft_factor must be at least 2")
+
+        self.fft_factor = fft_factor
+        self.min_fft_size = min_fft_size
+        # The zeros on the unit circle have no logarithm, the magnitude is floored below the stopband
+        self.floor = 10 ** (floor_db / 20)
+
+    def _get_fft_size(self, taps: int) -> int:
+        # A long transform keeps the cepstrum from wrapping around, which would distort the magnitude
+        return fft.next_fast_len(max(self.min_fft_size, self.fft_factor * taps), real=True)
+
+    def convert_coefficients(self, coefficients: list[float]) -> np.ndarray:
+        """
+        Converts linear phase coefficients to minimum phase with the same length
+        :param coefficients: Linear phase filter coefficients
+        :return: Minimum phase coefficients
+        """
+        values = np.asarray(coefficients, dtype=np.float64)
+        if not len(values):
+            raise ValueError("coefficients cannot be empty")
+
+        nfft = self._get_fft_size(len(values))
+        magnitude = np.abs(fft.rfft(values, n=nfft))
+        log_magnitude = np.log(np.maximum(magnitude, self.floor * max(float(magnitude.max()), self.floor)))
+        cepstrum = fft.irfft(log_magnitude, n=nfft)
+
+        # Fold the anticausal part of the cepstrum onto the causal part
+        folded = np.zeros(nfft, dtype=np.float64)
+        folded[0] = cepstrum[0]
+        folded[1:nfft // 2] = 2 * cepstrum[1:nfft // 2]
+        folded[nfft // 2] = cepstrum[nfft // 2]
+
+        minimum_phase = fft.irfft(np.exp(fft.rfft(folded)), n=nfft)
+        return minimum_phase[:len(values)]
+
+    def convert(self, fir_filter: FIRFilter) -> MinimumPhaseReport:
+        """
+        Converts a designed filter to minimum phase and measures its group delay and magnitude error
+        :param fir_filter: FIR filter, it is designed if it was not designed yet
+        :return: Minimum phase report
+        """
+        coefficients = fir_filter.coefficients
+        if coefficients is None:
+            coefficients = fir_filter.design()
+
+        linear_phase = np.asarray(coefficients, dtype=np.float64)
+        minimum_phase = self.convert_coefficients(coefficients)
+
+        nfft = self._get_fft_size(len(linear_phase))
+        frequencies = np.arange(nfft // 2 + 1) * fir_filter.F / nfft
+        reference_magnitude = np.abs(fft.rfft(linear_phase, n=nfft))
+        magnitude = np.abs(fft.rfft(minimum_phase, n=nfft))
+
+        passband = np.zeros(len(frequencies), dtype=bool)
+        for start, end in get_passbands(fir_filter.filter_conf):
+            passband |= (frequencies >= start) & (frequencies <= end)
+
+        delays = group_delay(minimum_phase, nfft)[passband]
+        with np.errstate(divide='ignore'):
+            magnitude_error_db = np.abs(
+                20 * np.log10(magnitude[passband]) - 20 * np.log10(reference_magnitude[passband])
+            )
+
+        reference, converted = SpecVerifier().verify_batch([
+            (fir_filter.filter_conf, linear_phase.tolist()),
+            (fir_filter.filter_conf, minimum_phase.tolist()),
+        ])
+
+        return MinimumPhaseReport(
+            coefficients=minimum_phase.tolist(),
+            linear_group_delay=(len(linear_phase) - 1) / 2,
+            group_delay=float(np.mean(delays)) if len(delays) else 0.0,
+            max_group_delay=float(np.max(delays)) if len(delays) else 0.0,
+            group_delay_ms=1000 * float(np.mean(delays)) / fir_filter.F if len(delays) else 0.0,
+            passband_magnitude_error=float(np.max(magnitude_error_db)) if len(magnitude_error_db) else 0.0,
+            max_magnitude_error=float(np.max(np.abs(magnitude - reference_magnitude))),
+            reference_attenuation=reference['stopband_attenuation'],
+            minimum_phase_attenuation=converted['stopband_attenuation'],
+        )
@@ -0,0 +1,100 @@
+"""
+This file contains the implementation of the fixed-point coefficient quantizer.
+"""
+import math
+
+import numpy as np
+
+from app.design.fir_filter import FIRFilter
+from app.design.types.quantization_types import QuantizationReport, QuantizationScaling
+from app.design.verification.spec_verifier import SpecVerifier
+
+
+class CoefficientQuantizer:
+    """
+    Quantizes the coefficients of a FIR filter to a fixed-point format (Q15, Q31, ...)
+    """
+
+    def __init__(
+            self,
+            word_length: int = 16,
+            fractional_bits: int | None = None,
+            scaling: QuantizationScaling = 'fixed',
+            grid_size: int = 8192
+    ):
+        if not 2 <= word_length <= 32:
+            raise ValueError("word_length must be between 2 and 32")
+
+        if scaling not in ('fixed', 'normalize'):
+            raise ValueError("scaling must be one of fixed, normalize")
+
+        self.word_length = word_length
+        self.fractional_bits = word_length - 1 if fractional_bits is None else fractional_bits
+        self.scaling = scaling
+        self.grid_size = grid_size
+
+        self.max_value = 2 ** (word_length - 1) - 1
+        self.min_value = -2 ** (word_length - 1)
+
+    def _get_fractional_bits(self, coefficients: np.ndarray) -> int:
+        """
+        Gets the fractional bits, with normalize scaling the largest coefficient uses the full word
+        :param coefficients: Filter coefficients
+        """
+        if self.scaling == 'fixed':
+            return self.fractional_bits
+
+        peak = float(np.max(np.abs(coefficients)))
+        if peak == 0:
+            return self.fractional_bits
+
+        return self.word_length - 1 - math.ceil(math.log2(peak * (1 + 2 ** -self.word_length)))
+
+    def quantize_coefficients(self, coefficients: list[float]) -> tuple[np.ndarray, int, int]:
+        """
+        Quantizes the coefficients with rounding to nearest and saturation
+        :param coefficients: Filter coefficients
+        :return: tuple with the integer coefficients, fractional bits and number of saturated values
+        """
+        values = np.asarray(coefficients, dtype=np.float64)
+        fractional_bits = self._get_fractional_bits(values)
+
+        scaled = np.round(values * 2.0 ** fractional_bits)
+        saturated = int(np.count_nonzero((scaled > self.max_value) | (scaled < self.min_value)))
+        integers = np.clip(scaled, self.min_value, self.max_value).astype(np.int64)
+
+        return integers, fractional_bits, saturated
+
+    def quantize(self, fir_filter: FIRFilter) -> QuantizationReport:
+        """
+        Quantizes the coefficients of a designed filter and measures the attenuation achieved
+        :param fir_filter: FIR filter, it is designed if it was not designed yet
+        :return: Quantization report
+        """
+        coefficients = fir_filter.coefficients
+        if coefficients is None:
+            coefficients = fir_filter.design()
+
+        integers, fractional_bits, saturated = self.quantize_coefficients(coefficients)
+        dequantized = integers / 2.0 ** fractional_bits
+
+        reference, quantized = SpecVerifier(self.grid_size).verify_batch([
+            (fir_filter.filter_conf, coefficients),
+            (fir_filter.filter_conf, dequantized.tolist()),
+        ])
+        reference_attenuation = reference['stopband_attenuation']
+        quantized_attenuation = quantized['stopband_attenuation']
+
+        return QuantizationReport(
+            coefficients=integers.tolist(),
+            word_length=self.word_length,
+            fractional_bits=fractional_bits,
+            saturated=saturated,
+            max_error=float(np.max(np.abs(dequantized - np.asarray(coefficients, dtype=np.float64)))),
+            reference_attenuation=reference_attenuation,
+            quantized_attenuation=quantized_attenuation,
+            attenuation_loss=(
+                None if None in (reference_attenuation, quantized_attenuation)
+                else reference_attenuation - quantized_attenuation
+            ),
+        )
@@ -0,0 +1,21 @@
+"""
+This file contains the definitions of the equiripple design types.
+"""
+from typing import TypedDict
+
+
+class TapSavingReport(TypedDict):
+    """
+    This class represents the taps saved by an equiripple design against the windowed design of the same spec.
+    """
+    windowed_taps: int
+    """Taps of the windowed design"""
+
+    equiripple_taps: int
+    """Taps of the equiripple design"""
+
+    saved_taps: int
+    """Taps saved by the equiripple design"""
+
+    saving_percent: float
+    """Saved taps as a percentage of the windowed taps"""
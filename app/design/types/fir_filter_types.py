@@ -3,8 +3,25 @@ This file contains the definitions of fir filter types.
 """
 from typing import TypedDict, Literal
 
-FilterType = Literal['passband', 'lowpass', 'highpass', 'bandpass']
+FilterType = Literal['passband', 'lowpass', 'highpass', 'bandpass', 'stopband', 'multiband']
 FilterWindow = Literal['hamming', 'blackman', 'kaiser']
+DesignMethod = Literal['window', 'equiripple']
+CoefficientType = Literal['float32', 'float64']
+
+
+class FilterBand(TypedDict):
+    """
+    This class represents a band of a multiband magnitude template.
+    """
+    start: float
+    """First frequency of the band in Hz"""
+
+    end: float
+    """Last frequency of the band in Hz"""
+
+    gain: float
+    """Linear magnitude of the band"""
+
 
 class FilterConf(TypedDict):
     """
@@ -36,3 +53,9 @@ class FilterConf(TypedDict):
 
     fp2: float | None
     """Passband frequency 2 in Hz (optional - zero frequency 2)"""
+
+    bands: list[FilterBand] | None
+    """Magnitude template of multiband filters (optional - the gaps between bands are transitions)"""
+
+    design_method: DesignMethod | None
+    """Design method (optional - window by default, equiripple ignores the filter window)"""
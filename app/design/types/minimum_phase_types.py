@@ -0,0 +1,36 @@
+"""
+This file contains the definitions of the minimum phase conversion types.
+"""
+from typing import TypedDict
+
+
+class MinimumPhaseReport(TypedDict):
+    """
+    This class represents the result of converting a linear phase filter to minimum phase.
+    """
+    coefficients: list[float]
+    """Minimum phase coefficients"""
+
+    linear_group_delay: float
+    """Group delay of the linear phase filter, (N - 1) / 2 samples"""
+
+    group_delay: float
+    """Average group delay in the passbands of the minimum phase filter in samples"""
+
+    max_group_delay: float
+    """Maximum group delay in the passbands of the minimum phase filter in samples"""
+
+    group_delay_ms: float
+    """Average group delay in the passbands in milliseconds at the sampling frequency"""
+
+    passband_magnitude_error: float
+    """Maximum magnitude difference in the passbands in dB"""
+
+    max_magnitude_error: float
+    """Maximum absolute magnitude difference at any frequency"""
+
+    reference_attenuation: float | None
+    """Stopband attenuation in dB of the linear phase filter"""
+
+    minimum_phase_attenuation: float | None
+    """Stopband attenuation in dB of the minimum phase filter"""
@@ -0,0 +1,59 @@
+"""
+This file contains the definitions of the multistage design types.
+"""
+from typing import TypedDict
+
+
+class StagePlan(TypedDict):
+    """
+    This class represents a decimation stage of a multistage plan.
+    """
+    decimation: int
+    """Decimation factor of the stage"""
+
+    input_rate: float
+    """Sampling frequency at the input of the stage in Hz"""
+
+    output_rate: float
+    """Sampling frequency at the output of the stage in Hz"""
+
+    fp: float
+    """Passband frequency of the stage in Hz"""
+
+    fs: float
+    """Stopband frequency of the stage in Hz"""
+
+    Ap: float
+    """Passband ripple of the stage in dB"""
+
+    taps: int
+    """Estimated taps of the stage"""
+
+    macs_per_input_sample: float
+    """Multiply-accumulates of the stage per sample at the input of the cascade"""
+
+
+class MultistagePlan(TypedDict):
+    """
+    This class represents a cascade of decimation stages and its cost against the single stage design.
+    """
+    stages: list[StagePlan]
+    """Stages of the cascade"""
+
+    decimation: int
+    """Total decimation factor"""
+
+    output_rate: float
+    """Sampling frequency at the output of the cascade in Hz"""
+
+    macs_per_input_sample: float
+    """Multiply-accumulates of the cascade per input sample"""
+
+    single_stage_taps: int
+    """Taps of the single stage design"""
+
+    single_stage_macs: float
+    """Multiply-accumulates per input sample of the single stage design filtering at full rate"""
+
+    single_stage_decimated_macs: float
+    """Multiply-accumulates per input sample of the single stage design decimating by the same factor"""
@@ -0,0 +1,35 @@
+"""
+This file contains the definitions of the floating point precision types.
+"""
+from typing import TypedDict
+
+from app.design.types.fir_filter_types import CoefficientType
+
+
+class PrecisionReport(TypedDict):
+    """
+    This class represents the accuracy of a design in a floating point precision against float64.
+    """
+    dtype: CoefficientType
+    """Precision of the coefficients and the filtering"""
+
+    max_coefficient_error: float
+    """Maximum absolute error of the coefficients against float64"""
+
+    reference_attenuation: float | None
+    """Stopband attenuation in dB of the float64 coefficients"""
+
+    attenuation: float | None
+    """Stopband attenuation in dB of the coefficients in the precision"""
+
+    attenuation_loss: float | None
+    """Attenuation lost against float64 in dB"""
+
+    reference_ripple: float | None
+    """Passband ripple in dB of the float64 coefficients"""
+
+    ripple: float | None
+    """Passband ripple in dB of the coefficients in the precision"""
+
+    filtering_snr: float | None
+    """Signal to error ratio in dB of filtering white noise in the precision against float64"""
@@ -0,0 +1,35 @@
+"""
+This file contains the definitions of the fixed-point quantization types.
+"""
+from typing import TypedDict, Literal
+
+QuantizationScaling = Literal['fixed', 'normalize']
+
+
+class QuantizationReport(TypedDict):
+    """
+    This class represents the result of quantizing the filter coefficients.
+    """
+    coefficients: list[int]
+    """Quantized coefficients as integers"""
+
+    word_length: int
+    """Word length in bits, 16 for Q15 and 32 for Q31"""
+
+    fractional_bits: int
+    """Number of fractional bits, the integers are scaled by 2 ** fractional_bits"""
+
+    saturated: int
+    """Number of coefficients clipped to the word range"""
+
+    max_error: float
+    """Maximum absolute error between the quantized and the original coefficients"""
+
+    reference_attenuation: float | None
+    """Stopband attenuation in dB of the original coefficients"""
+
+    quantized_attenuation: float | None
+    """Stopband attenuation in dB after quantization"""
+
+    attenuation_loss: float | None
+    """Attenuation lost because of the quantization in dB"""
@@ -0,0 +1,32 @@
+"""
+This file contains the definitions of the frequency response types.
+"""
+from typing import TypedDict, Literal
+
+DownsampleMethod = Literal['none', 'minmax', 'lttb']
+ResponseFormat = Literal['json', 'binary']
+
+RESPONSE_COLUMNS: list[str] = ['frequency', 'magnitude_db', 'phase', 'group_delay']
+
+
+class FrequencyResponse(TypedDict):
+    """
+    This class represents the frequency response of a filter on a grid of frequencies.
+    """
+    frequency: list[float]
+    """Frequencies in Hz"""
+
+    magnitude_db: list[float]
+    """Magnitude in dB"""
+
+    phase: list[float]
+    """Unwrapped phase in radians"""
+
+    group_delay: list[float | None]
+    """Group delay in samples, None where the magnitude is zero"""
+
+    grid_size: int
+    """Points of the calculated grid, before downsampling"""
+
+    points: int
+    """Points returned"""
@@ -0,0 +1,30 @@
+"""
+This file contains the definitions of the spec verification types.
+"""
+from typing import TypedDict
+
+
+class VerificationReport(TypedDict):
+    """
+    This class represents the response achieved by a design against its configuration.
+    """
+    passband_ripple: float | None
+    """Achieved passband ripple in dB, None when a passband reaches zero magnitude"""
+
+    stopband_attenuation: float | None
+    """Achieved minimum stopband attenuation in dB, None when the stopbands have no energy"""
+
+    passbands: list[tuple[float, float]]
+    """Passband edges in Hz"""
+
+    stopbands: list[tuple[float, float]]
+    """Stopband edges in Hz"""
+
+    meets_ripple: bool
+    """The passband ripple is not greater than Ap"""
+
+    meets_attenuation: bool
+    """The stopband attenuation is not lower than As"""
+
+    passed: bool
+    """The design meets Ap and As"""
@@ -1,14 +1,17 @@
 """
 This file contains the implementation of the filter conf validator
 """
-from app.design.exceptions.filter_config_exceptions import MissingKeysError, IncorrectTypeError
+from app.design.exceptions.filter_config_exceptions import InvalidValueError, MissingKeysError, IncorrectTypeError
 from app.design.types.fir_filter_types import FilterConf
 
 REQUIRED_KEYS: list[str] = ['Ap', 'As', 'fp', 'fs', 'F', 'filter_type', 'filter_window']
 OPTIONAL_KEYS: list[str] = ['fs2', 'fp2']
+MULTIBAND_REQUIRED_KEYS: list[str] = ['Ap', 'As', 'F', 'filter_type', 'filter_window', 'bands']
+BAND_KEYS: list[str] = ['start', 'end', 'gain']
 
-VALID_FILTER_TYPES: list[str] = ['passband', 'lowpass', 'highpass', 'bandpass']
+VALID_FILTER_TYPES: list[str] = ['passband', 'lowpass', 'highpass', 'bandpass', 'stopband', 'multiband']
 VALID_WINDOW_TYPES: list[str] = ['hamming', 'blackman', 'kaiser']
+VALID_DESIGN_METHODS: list[str] = ['window', 'equiripple']
 
 
 class FilterConfTypeValidator:
@@ -21,7 +24,11 @@ class FilterConfTypeValidator:
         self.validate_filter_conf()
 
     def _validate_required_keys(self):
-        missing_keys = [key for key in REQUIRED_KEYS if key not in self.filter_conf]
+        required_keys = REQUIRED_KEYS
+        if self.filter_conf.get('filter_type') == 'multiband':
+            required_keys = MULTIBAND_REQUIRED_KEYS
+
+        missing_keys = [key for key in required_keys if key not in self.filter_conf]
         if missing_keys:
             raise MissingKeysError(missing_keys)
 
@@ -45,21 +52,45 @@ class FilterConfTypeValidator:
         if incorrect_types:
             raise IncorrectTypeError(incorrect_types)
 
+    def _validate_bands(self):
+        """
+        Validates the magnitude template of multiband filters
+        :raises: IncorrectTypeError if the bands are not a list of start, end and gain values
+        """
+        bands = self.filter_conf.get('bands')
+        if bands is None:
+            return
+
+        if not isinstance(bands, list) or not bands or not all(
+                isinstance(band, dict) and all(isinstance(band.get(key), (int, float)) for key in BAND_KEYS)
+                for band in bands
+        ):
+            raise IncorrectTypeError(['bands'])
+
     def _validate_filter_type(self):
         """
         Validates the filter type
-        :raises: ValueError if the filter type is not valid
+        :raises: InvalidValueError if the filter type is not valid
         """
         if self.filter_conf['filter_type'] not in VALID_FILTER_TYPES:
-            raise ValueError(f"Filter type must be one of {', '.join(VALID_FILTER_TYPES)}")
+            raise InvalidValueError(f"Filter type must be one of {', '.join(VALID_FILTER_TYPES)}")
 
     def _validate_filter_window(self):
         """
         Validates the filter window
-        :raises: ValueError if the filter window is not valid
+        :raises: InvalidValueError if the filter window is not valid
         """
         if self.filter_conf['filter_window'] not in VALID_WINDOW_TYPES:
-            raise ValueError(f"Filter window must be one of {', '.join(VALID_WINDOW_TYPES)}")
+            raise InvalidValueError(f"Filter window must be one of {', '.join(VALID_WINDOW_TYPES)}")
+
+    def _validate_design_method(self):
+        """
+        Validates the design method
+        :raises: InvalidValueError if the design method is not valid
+        """
+        design_method = self.filter_conf.get('design_method')
+        if design_method is not None and design_method not in VALID_DESIGN_METHODS:
+            raise InvalidValueError(f"Design method must be one of {', '.join(VALID_DESIGN_METHODS)}")
 
     def validate_filter_conf(self) -> bool:
         """
@@ -75,9 +106,11 @@ class FilterConfTypeValidator:
         self._validate_required_keys()
         self._validate_correct_types()
         self._validate_optional_keys()
+        self._validate_bands()
 
         self._validate_filter_type()
         self._validate_filter_window()
+        self._validate_design_method()
 
         return True
 
@@ -91,71 +124,65 @@ class FilterValuesValidator(FilterConfTypeValidator):
         self.filter_conf = filter_conf
         super().__init__(filter_conf)
 
-    def _validate_frequecies_grater_than(self, keys: list[str], value):
-        invalid_frequency = [key for key in keys if self.filter_conf[key] >= value]
+    def _validate_frequencies_below_nyquist(self, keys: list[str]):
+        nyquist = self.filter_conf['F'] / 2
+        invalid_frequency = [key for key in keys if not 0 < self.filter_conf[key] < nyquist]
         if len(invalid_frequency) > 0:
-            raise ValueError(f'{", ".join(invalid_frequency)} must be greater than {value}')
+            raise InvalidValueError(f'{", ".join(invalid_frequency)} must be between 0 and F/2')
 
     def _validate_ripples(self):
         """
         Validates the ripples of the filter configuration
-        :raises: ValueError if the ripples are not valid
+        :raises: InvalidValueError if the ripples are not valid
         """
         if self.filter_conf['Ap'] <= 0:
-            raise ValueError("Ap must be greater than 0")
+            raise InvalidValueError("Ap must be greater than 0")
 
         if self.filter_conf['As'] <= 0:
-            raise ValueError("As must be greater than 0, usually grateter than 20")
+            raise InvalidValueError("As must be greater than 0, usually grateter than 20")
 
     def _validate_frequency_values(self):
         """
-        Validates the frequency values of the filter configuration
-        :return: True if the values are valid, raises ValueError otherwise
+        Validates the frequency values of the filter configuration, the edges follow the bands of
+        app.design.analysis.filter_bands
+        :raises: InvalidValueError if the values are not valid
         """
-        REQUIRED_FREQUENCY_KEYS = ['fp', 'fs', 'F']
-        OPTIONAL_FREQUENCY_KEYS = ['fp2', 'fs2']
-
-        # Validate frequencies grater than 0
-        self._validate_frequecies_grater_than(REQUIRED_FREQUENCY_KEYS, 0)
-
-        if self.filter_conf['filter_type'] in ['bandpass', 'stopband']:
-            self._validate_frequecies_grater_than(OPTIONAL_FREQUENCY_KEYS, 0)
-
-        # Validate frequencies grater than sampling frequency
-        self._validate_frequecies_grater_than(REQUIRED_FREQUENCY_KEYS, self.filter_conf['F'])
-
-        if self.filter_conf['filter_type'] in ['bandpass', 'stopband']:
-            self._validate_frequecies_grater_than(OPTIONAL_FREQUENCY_KEYS, self.filter_conf['F'])
+        if self.filter_conf['F'] <= 0:
+            raise InvalidValueError("F must be greater than 0")
 
-        if self.filter_conf['filter_type'] == 'highpass':
-            if self.filter_conf['fp'] >= self.filter_conf['fs']:
-                raise ValueError("fp must be greater than fs")
+        filter_type = self.filter_conf['filter_type']
+        if filter_type == 'multiband':
+            # The bands are validated by the frequency sampling strategy
+            return
 
-        if self.filter_conf['filter_type'] == 'lowpass':
-            if self.filter_conf['fp'] <= self.filter_conf['fs']:
-                raise ValueError("fp must be greater than fs")
+        if filter_type in ['bandpass', 'stopband']:
+            missing_keys = [key for key in OPTIONAL_KEYS if self.filter_conf.get(key) is None]
+            if missing_keys:
+                raise MissingKeysError(missing_keys)
+            self._validate_frequencies_below_nyquist(['fp', 'fs', 'fp2', 'fs2'])
+        else:
+            self._validate_frequencies_below_nyquist(['fp', 'fs'])
 
-        if self.filter_conf['filter_type'] == 'bandpass':
-            if self.filter_conf['fp'] >= self.filter_conf['fp2']:
-                raise ValueError("fp must be greater than fp2")
+        fp, fs = self.filter_conf['fp'], self.filter_conf['fs']
 
-            if self.filter_conf['fs'] <= self.filter_conf['fs2']:
-                raise ValueError("fs must be greater than fs2")
+        if filter_type == 'lowpass' and fp >= fs:
+            raise InvalidValueError("fs must be greater than fp")
 
-            if self.filter_conf['fp'] == self.filter_conf['fs']:
-                raise ValueError("fp and fs cannot be the same for highpass/lowpass.")
+        if filter_type == 'highpass' and fs >= fp:
+            raise InvalidValueError("fp must be greater than fs")
 
-        if self.filter_conf['filter_type'] == 'stopband':
-            if self.filter_conf['fp'] <= self.filter_conf['fp2']:
-                raise ValueError("fp must be greater than fp2")
+        if filter_type == 'bandpass':
+            if not fs < fp < self.filter_conf['fp2'] < self.filter_conf['fs2']:
+                raise InvalidValueError("The edges of bandpass filters must satisfy fs < fp < fp2 < fs2")
 
-            if self.filter_conf['fs'] >= self.filter_conf['fs2']:
-                raise ValueError("fs must be greater than fs2")
+        if filter_type == 'stopband':
+            if not fp < fs < self.filter_conf['fs2'] < self.filter_conf['fp2']:
+                raise InvalidValueError("The edges of stopband filters must satisfy fp < fs < fs2 < fp2")
 
     def validate_values(self) -> bool:
         """
         Validates the values of the filter configuration
-        :return: True if the values are valid, False otherwise
+        :return: True if the values are valid, raises InvalidValueError otherwise
         """
         self._validate_ripples()
 
@@ -164,7 +191,7 @@ class FilterValuesValidator(FilterConfTypeValidator):
         return True
 
 
-class FilterConfValidator(FilterConfTypeValidator, FilterValuesValidator):
+class FilterConfValidator(FilterValuesValidator, FilterConfTypeValidator):
     """
     Filter Configuration Validator
     """
@@ -0,0 +1,66 @@
+"""
+This file contains the analyzer of the accuracy lost with a lower floating point precision
+"""
+import numpy as np
+
+from app.design.fir_filter import FIRFilter
+from app.design.types.fir_filter_types import CoefficientType
+from app.design.types.precision_types import PrecisionReport
+from app.design.verification.spec_verifier import SpecVerifier, finite_or_none
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+
+
+class PrecisionAnalyzer:
+    """
+    Precision Analyzer class, measures what a design loses when its coefficients and its filtering use a
+    lower precision than float64: the stopband attenuation and passband ripple of the rounded coefficients
+    and the error of filtering white noise end to end in that precision.
+    """
+
+    def __init__(self, grid_size: int = 8192, samples: int = 1 << 16):
+        if samples < 1:
+            raise ValueError("samples must be greater than 0")
+
+        self.grid_size = grid_size
+        self.samples = samples
+
+    def analyze(self, fir_filter: FIRFilter, dtype: CoefficientType = 'float32') -> PrecisionReport:
+        """
+        Analyzes a design in a precision, the coefficients of the filter are the float64 reference
+        :param fir_filter: FIR filter, it is designed if it was not designed yet
+        :param dtype: Precision to analyze
+        :return: Precision report
+        """
+        coefficients = fir_filter.coefficients
+        if coefficients is None:
+            coefficients = fir_filter.design()
+
+        reference = np.asarray(coefficients, dtype=np.float64)
+        reduced = reference.astype(dtype)
+
+        reference_report, reduced_report = SpecVerifier(self.grid_size).verify_batch([
+            (fir_filter.filter_conf, reference.tolist()),
+            (fir_filter.filter_conf, reduced.astype(np.float64).tolist()),
+        ])
+
+        signal = np.random.default_rng(0).standard_normal(self.samples)
+        expected = DirectFilterEngine(reference).process(signal)
+        filtered = DirectFilterEngine(reduced, dtype=dtype).process(signal.astype(dtype))
+        error_power = float(np.sum((filtered.astype(np.float64) - expected) ** 2))
+        signal_power = float(np.sum(expected ** 2))
+
+        reference_attenuation = reference_report['stopband_attenuation']
+        attenuation = reduced_report['stopband_attenuation']
+
+        return PrecisionReport(
+            dtype=dtype,
+            max_coefficient_error=float(np.max(np.abs(reduced.astype(np.float64) - reference))),
+            reference_attenuation=reference_attenuation,
+            attenuation=attenuation,
+            attenuation_loss=(
+                None if None in (reference_attenuation, attenuation) else reference_attenuation - attenuation
+            ),
+            reference_ripple=reference_report['passband_ripple'],
+            ripple=reduced_report['passband_ripple'],
+            filtering_snr=finite_or_none(10 * np.log10(signal_power / error_power)) if error_power else None,
+        )
@@ -0,0 +1,113 @@
+"""
+This file contains the verifier of the achieved filter specs
+"""
+import numpy as np
+
+from app.design.analysis.filter_bands import get_band_template
+from app.design.types.fir_filter_types import FilterConf
+from app.design.types.verification_types import VerificationReport
+
+
+def finite_or_none(value: float) -> float | None:
+    """
+    Infinite and NaN metrics are not valid JSON, they are reported as None
+    :param value: Metric
+    :return: The metric or None if it is not finite
+    """
+    return float(value) if np.isfinite(value) else None
+
+
+class SpecVerifier:
+    """
+    Spec Verifier class, measures the passband ripple and the stopband attenuation of designs.
+    The magnitude responses of many designs are calculated together with a batched real FFT on a
+    dense grid, grid_size points between 0 and F/2.
+    """
+    BATCH_SIZE = 256
+
+    def __init__(self, grid_size: int = 8192):
+        if grid_size < 16:
+            raise ValueError("grid_size must be at least 16")
+
+        self.grid_size = grid_size
+
+    def _get_fft_size(self, lengths: list[int]) -> int:
+        size = max([2 * self.grid_size] + lengths)
+        return 1 << int(np.ceil(np.log2(size)))
+
+    @staticmethod
+    def _verify_magnitude(filter_conf: FilterConf, magnitude: np.ndarray, nfft: int) -> VerificationReport:
+        """
+        Measures the bands of a configuration in its magnitude response
+        :param filter_conf: Filter configuration
+        :param magnitude: Magnitude response on the FFT bins
+        :param nfft: FFT size
+        """
+        # Bin k is the frequency k * F / nfft
+        bin_width = filter_conf['F'] / nfft
+
+        passbands, stopbands = [], []
+        pass_max, pass_min, stop_max = 0.0, np.inf, 0.0
+        for start, end, gain in get_band_template(filter_conf):
+            band = magnitude[int(np.ceil(start / bin_width)):int(np.floor(end / bin_width)) + 1]
+            if gain > 0:
+                passbands.append((start, end))
+                if band.size:
+                    pass_max = max(pass_max, float(band.max()) / gain)
+                    pass_min = min(pass_min, float(band.min()) / gain)
+            else:
+                stopbands.append((start, end))
+                if band.size:
+                    stop_max = max(stop_max, float(band.max()))
+
+        if not passbands:
+            passband_ripple = 0.0
+        elif pass_min > 0:
+            passband_ripple = 20 * np.log10(pass_max / pass_min)
+        else:
+            passband_ripple = np.inf
+
+        stopband_attenuation = -20 * np.log10(stop_max) if stop_max > 0 else np.inf
+
+        meets_ripple = bool(passband_ripple <= filter_conf['Ap'])
+        meets_attenuation = bool(stopband_attenuation >= filter_conf['As'])
+
+        return VerificationReport(
+            passband_ripple=finite_or_none(passband_ripple),
+            stopband_attenuation=finite_or_none(stopband_attenuation),
+            passbands=passbands,
+            stopbands=stopbands,
+            meets_ripple=meets_ripple,
+            meets_attenuation=meets_attenuation,
+            passed=meets_ripple and meets_attenuation,
+        )
+
+    def verify(self, filter_conf: FilterConf, coefficients: list[float]) -> VerificationReport:
+        """
+        Verifies a design
+        :param filter_conf: Filter configuration
+        :param coefficients: Filter coefficients
+        :return: Verification report
+        """
+        return self.verify_batch([(filter_conf, coefficients)])[0]
+
+    def verify_batch(self, designs: list[tuple[FilterConf, list[float]]]) -> list[VerificationReport]:
+        """
+        Verifies many designs, the responses are calculated in batches of BATCH_SIZE designs
+        :param designs: List of (configuration, coefficients)
+        :return: Verification reports in the same order
+        """
+        reports = []
+        for start in range(0, len(designs), self.BATCH_SIZE):
+            batch = designs[start:start + self.BATCH_SIZE]
+            nfft = self._get_fft_size([len(coefficients) for _, coefficients in batch])
+
+            taps = np.zeros((len(batch), nfft), dtype=np.float64)
+            for idx, (_, coefficients) in enumerate(batch):
+                taps[idx, :len(coefficients)] = coefficients
+
+            magnitudes = np.abs(np.fft.rfft(taps, axis=1))
+            for (filter_conf, _), magnitude in zip(batch, magnitudes):
+                reports.append(self._verify_magnitude(filter_conf, magnitude, nfft))
+
+        return reports
@@ -0,0 +1,171 @@
+"""
+This file contains the dispatcher that runs the designs inline, in a thread pool or in a process pool
+"""
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from app.design.fir_filter_factory import create_fir_filter, design_filter
+from app.design.fir_filter_hash import design_hash
+from app.design.types.fir_filter_types import CoefficientType, FilterConf
+from app.dispatch.single_flight import SingleFlight
+from app.dispatch.types.dispatch_types import CoalescingMetrics, DesignCost, Lane, LaneMetrics, LANES
+
+# Measured design time per tap in microseconds, the Kaiser window sums 25 terms per tap in Python
+WINDOW_TAP_COSTS: dict[str, float] = {
+    'hamming': 1.2,
+    'blackman': 1.4,
+    'kaiser': 12.0,
+}
+BASE_COST = 100.0
+EQUIRIPPLE_COST_FACTOR = 0.2
+
+
+def timed_design(
+        filter_conf: FilterConf, round_value: int, dtype: CoefficientType = 'float64'
+) -> tuple[list[float], float, float]:
+    """
+    Designs a filter measuring when the worker started and finished it
+    :return: tuple with the coefficients, start and finish timestamps
+    """
+    started_at = time.time()
+    coefficients = design_filter(filter_conf, round_value, dtype)
+    return coefficients, started_at, time.time()
+
+
+class DesignDispatcher:
+    """
+    Design Dispatcher class, estimates the cost of a design from its validated configuration and
+    predicted taps, then runs it inline (cheap designs), in a thread pool or in a process pool
+    (long designs that would hold the GIL). Identical designs in flight are coalesced into one.
+    """
+
+    def __init__(
+            self,
+            inline_threshold: float = 2_000,
+            process_threshold: float = 50_000,
+            thread_workers: int = 4,
+            process_workers: int = 2
+    ):
+        if inline_threshold > process_threshold:
+            raise ValueError("inline_threshold cannot be greater than process_threshold")
+
+        self.inline_threshold = inline_threshold
+        self.process_threshold = process_threshold
+
+        self._thread_executor = ThreadPoolExecutor(max_workers=thread_workers, thread_name_prefix='fir-design')
+        self._process_executor = ProcessPoolExecutor(
+            max_workers=process_workers, mp_context=multiprocessing.get_context('spawn')
+        )
+
+        self._single_flight = SingleFlight()
+        self._metrics: dict[str, dict[str, float]] = {
+            lane: {
+                'submitted': 0, 'completed': 0, 'failed': 0, 'in_flight': 0, 'max_in_flight': 0,
+                'wait_time': 0.0, 'run_time': 0.0,
+            }
+            for lane in LANES
+        }
+
+    def estimate_cost(self, filter_conf: FilterConf, round_value: int = 7) -> DesignCost:
+        """
+        Estimates the design time, it validates the configuration
+        :param filter_conf: Filter configuration
+        :param round_value: Decimals used to round the values
+        :return: Predicted taps, cost in microseconds and selected lane
+        """
+        estimate_conf = {**filter_conf, 'design_method': 'window'}
+        taps = create_fir_filter(estimate_conf, round_value).estimate_order()
+
+        cost = BASE_COST + taps * WINDOW_TAP_COSTS.get(filter_conf['filter_window'], 1.0)
+        if filter_conf.get('design_method') == 'equiripple':
+            # Every step of the order search runs the exchange algorithm
+            cost = BASE_COST + EQUIRIPPLE_COST_FACTOR * taps ** 2
+
+        lane: Lane = 'thread'
+        if cost < self.inline_threshold:
+            lane = 'inline'
+        elif cost >= self.process_threshold:
+            lane = 'process'
+
+        return DesignCost(taps=taps, cost=cost, lane=lane)
+
+    async def design(
+            self, filter_conf: FilterConf, round_value: int = 7, dtype: CoefficientType = 'float64'
+    ) -> list[float]:
+        """
+        Designs a filter in the lane selected by its cost, concurrent requests for the same canonical
+        configuration share one computation
+        :param filter_conf: Filter configuration
+        :param round_value: Decimals used to round the values
+        :param dtype: Precision of the designed coefficients
+        :return: Ordered filter coefficients
+        """
+        # The cost estimation validates the configuration before it becomes a shared computation
+        lane = self.estimate_cost(filter_conf, round_value)['lane']
+        key = design_hash(filter_conf, round_value, dtype)
+        coefficients = await self._single_flight.run(
+            key, lambda: self._design_in_lane(lane, filter_conf, round_value, dtype)
+        )
+
+        return list(coefficients)
+
+    async def _design_in_lane(
+            self, lane: Lane, filter_conf: FilterConf, round_value: int, dtype: CoefficientType
+    ) -> list[float]:
+        metrics = self._metrics[lane]
+
+        metrics['submitted'] += 1
+        metrics['in_flight'] += 1
+        metrics['max_in_flight'] = max(metrics['max_in_flight'], metrics['in_flight'])
+        submitted_at = time.time()
+        try:
+            if lane == 'inline':
+                coefficients, started_at, finished_at = timed_design(filter_conf, round_value, dtype)
+            else:
+                executor = self._thread_executor if lane == 'thread' else self._process_executor
+                loop = asyncio.get_running_loop()
+                coefficients, started_at, finished_at = await loop.run_in_executor(
+                    executor, timed_design, dict(filter_conf), round_value, dtype
+                )
+        except BaseException:
+            metrics['failed'] += 1
+            raise
+        finally:
+            metrics['in_flight'] -= 1
+
+        metrics['completed'] += 1
+        metrics['wait_time'] += max(started_at - submitted_at, 0.0)
+        metrics['run_time'] += finished_at - started_at
+
+        return coefficients
+
+    def get_metrics(self) -> dict[str, LaneMetrics]:
+        """
+        Gets the queue metrics of every lane
+        """
+        result = {}
+        for lane, metrics in self._metrics.items():
+            completed = metrics['completed']
+            result[lane] = LaneMetrics(
+                submitted=int(metrics['submitted']),
+                completed=int(completed),
+                failed=int(metrics['failed']),
+                in_flight=int(metrics['in_flight']),
+                max_in_flight=int(metrics['max_in_flight']),
+                average_wait_ms=1000 * metrics['wait_time'] / completed if completed else 0.0,
+                average_run_ms=1000 * metrics['run_time'] / completed if completed else 0.0,
+            )
+
+        return result
+
+    def get_coalescing_metrics(self) -> CoalescingMetrics:
+        """
+        Gets the counters of the coalesced designs
+        """
+        return self._single_flight.get_metrics()
+
+    def shutdown(self, wait: bool = True):
+        self._thread_executor.shutdown(wait=wait, cancel_futures=True)
+        self._process_executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,85 @@
+"""
+This file contains the coalescing of identical requests in flight
+"""
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from app.dispatch.types.dispatch_types import CoalescingMetrics
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Single Flight class, concurrent calls with the same key wait on one computation and all receive its
+    result or its error. A request that is cancelled leaves the computation running for the others, and the
+    computation is only cancelled when nobody waits for it anymore.
+    """
+
+    def __init__(self):
+        self.computations = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.cancelled = 0
+
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+
+    async def run(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs the function or joins the computation in flight with the same key
+        :param key: Key identifying the computation
+        :param function: Function creating the computation
+        :return: Result of the computation
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.computations += 1
+            task = asyncio.ensure_future(function())
+            self._in_flight[key] = task
+            self._waiters[task] = 0
+            task.add_done_callback(lambda done_task: self._finish(key, done_task))
+        else:
+            self.coalesced += 1
+
+        self._waiters[task] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                self._leave(key, task)
+            raise
+        finally:
+            if task in self._waiters and task.done():
+                self._waiters.pop(task)
+
+    def _leave(self, key: str, task: asyncio.Task):
+        """
+        Removes a cancelled request, the computation is cancelled when it was the last one waiting
+        """
+        self._waiters[task] -= 1
+        if self._waiters[task] > 0:
+            return
+
+        # New requests start a fresh computation instead of joining the cancelled one
+        if self._in_flight.get(key) is task:
+            self._in_flight.pop(key)
+        self._waiters.pop(task)
+        self.cancelled += 1
+        task.cancel()
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            self._in_flight.pop(key)
+
+        if not task.cancelled() and task.exception() is not None:
+            self.failed += 1
+
+    def get_metrics(self) -> CoalescingMetrics:
+        return CoalescingMetrics(
+            computations=self.computations,
+            coalesced=self.coalesced,
+            failed=self.failed,
+            cancelled=self.cancelled,
+            in_flight=len(self._in_flight),
+        )
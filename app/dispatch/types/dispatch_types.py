@@ -0,0 +1,68 @@
+"""
+This file contains the definitions of the dispatch types.
+"""
+from typing import TypedDict, Literal
+
+Lane = Literal['inline', 'thread', 'process']
+
+LANES: list[str] = ['inline', 'thread', 'process']
+
+
+class DesignCost(TypedDict):
+    """
+    This class represents the estimated cost of a design.
+    """
+    taps: int
+    """Taps predicted by the windowed order"""
+
+    cost: float
+    """Estimated design time in microseconds"""
+
+    lane: Lane
+    """Lane selected for the design"""
+
+
+class LaneMetrics(TypedDict):
+    """
+    This class represents the queue metrics of a dispatch lane.
+    """
+    submitted: int
+    """Designs sent to the lane"""
+
+    completed: int
+    """Designs finished successfully"""
+
+    failed: int
+    """Designs that raised an error"""
+
+    in_flight: int
+    """Designs waiting for a worker or running"""
+
+    max_in_flight: int
+    """Highest number of designs in flight"""
+
+    average_wait_ms: float
+    """Average time waiting for a worker in milliseconds"""
+
+    average_run_ms: float
+    """Average design time in milliseconds"""
+
+
+class CoalescingMetrics(TypedDict):
+    """
+    This class represents the counters of the request coalescing.
+    """
+    computations: int
+    """Designs actually computed"""
+
+    coalesced: int
+    """Requests that joined a computation in flight, computations saved"""
+
+    failed: int
+    """Computations that raised an error"""
+
+    cancelled: int
+    """Computations cancelled because every waiting request was cancelled"""
+
+    in_flight: int
+    """Computations in flight"""
@@ -0,0 +1,122 @@
+"""
+This file contains the export of the filter designs to CSV and xlsx
+"""
+import csv
+import io
+import json
+import tempfile
+from typing import Iterator, BinaryIO
+
+from openpyxl import Workbook
+
+from app.design.fir_filter import FIRFilter
+from app.design.validators.filter_conf_validator import REQUIRED_KEYS, OPTIONAL_KEYS
+
+DESIGN_EXPORT_HEADERS: list[str] = ['tap', 'offset', 'window', 'ideal_response', 'coefficient']
+# Keys of the summary sheet that are not plain numbers, the bands are written as JSON
+SUMMARY_EXTRA_KEYS: list[str] = ['design_method', 'bands']
+
+CSV_FLUSH_ROWS = 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_design_rows(fir_filter: FIRFilter) -> Iterator[list]:
+    """
+    Iterates over the taps of a design, it is designed if it was not designed yet.
+    The offset is the distance to the center tap, the window and the ideal response are symmetric.
+    :param fir_filter: FIR filter
+    :return: Rows with the values of DESIGN_EXPORT_HEADERS
+    """
+    if fir_filter.coefficients is None:
+        fir_filter.design()
+
+    n = fir_filter.n
+    for tap, coefficient in enumerate(fir_filter.coefficients):
+        offset = abs(tap - n)
+        yield [
+            tap,
+            offset,
+            fir_filter.window_coefficients[offset],
+            fir_filter.impulse_response[offset],
+            coefficient,
+        ]
+
+
+def get_summary_values(fir_filter: FIRFilter, conf_keys: list[str]) -> list:
+    """
+    Gets the configuration values of a design for the summary sheet
+    :param fir_filter: FIR filter
+    :param conf_keys: Keys of the configuration in the order of the summary columns
+    :return: Values of the keys, None for the missing ones
+    """
+    values = []
+    for key in conf_keys:
+        value = fir_filter.filter_conf.get(key)
+        if key == 'design_method' and value is None:
+            value = 'window'
+        elif key == 'bands' and value is not None:
+            value = json.dumps(value)
+        values.append(value)
+
+    return values
+
+
+def iter_csv(designs: list[tuple[str, FIRFilter]]) -> Iterator[bytes]:
+    """
+    Streams the designs as CSV, one row per tap with the name of its design
+    :param designs: List of (name, filter)
+    :return: CSV chunks encoded as UTF-8
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['design'] + DESIGN_EXPORT_HEADERS)
+
+    rows = 0
+    for name, fir_filter in designs:
+        for row in iter_design_rows(fir_filter):
+            writer.writerow([name] + row)
+            rows += 1
+            if rows % CSV_FLUSH_ROWS == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+    yield buffer.getvalue().encode()
+
+
+def write_xlsx(designs: list[tuple[str, FIRFilter]], target: str | BinaryIO):
+    """
+    Writes the designs to a workbook in write-only mode, the rows are streamed to disk instead of kept as cells.
+    The first sheet summarizes the designs and every design gets its own sheet.
+    :param designs: List of (name, filter)
+    :param target: File name or binary file
+    """
+    wb = Workbook(write_only=True)
+
+    conf_keys = REQUIRED_KEYS + OPTIONAL_KEYS + SUMMARY_EXTRA_KEYS
+    summary = wb.create_sheet('designs')
+    summary.append(['design', 'sheet', 'taps'] + conf_keys)
+
+    for idx, (name, fir_filter) in enumerate(designs):
+        sheet_title = f'design_{idx + 1}'
+        sheet = wb.create_sheet(sheet_title)
+        sheet.append(DESIGN_EXPORT_HEADERS)
+        for row in iter_design_rows(fir_filter):
+            sheet.append(row)
+
+        summary.append([name, sheet_title, len(fir_filter.coefficients)] + get_summary_values(fir_filter, conf_keys))
+
+    wb.save(target)
+
+
+def iter_xlsx(designs: list[tuple[str, FIRFilter]]) -> Iterator[bytes]:
+    """
+    Streams the workbook of the designs, it is written to a temporary file and read back in chunks
+    :param designs: List of (name, filter)
+    :return: xlsx chunks
+    """
+    with tempfile.TemporaryFile() as file:
+        write_xlsx(designs, file)
+        file.seek(0)
+        while chunk := file.read(STREAM_CHUNK_SIZE):
+            yield chunk
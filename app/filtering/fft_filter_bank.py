@@ -0,0 +1,90 @@
+"""
+This file contains the implementation of the FFT filter bank
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft
+
+from app.design.fir_filter import FIRFilter
+
+
+class FFTFilterBank:
+    """
+    FFT Filter Bank class, applies many filters to one signal with the overlap-save method.
+    Every block of the signal is transformed once, multiplied by the spectra of all the filters in one
+    operation and transformed back in a batch, the output row i is the signal filtered by filter i.
+    With float32 the transforms run in single precision, complex64 spectra and float32 output.
+    """
+    FFT_SIZE_FACTOR = 4
+    MIN_FFT_SIZE = 256
+    MAX_BATCH_SAMPLES = 1 << 20
+    """Output samples of all the filters calculated at once, it bounds the memory of a block"""
+
+    def __init__(self, fir_filters: list[FIRFilter], fft_size: int | None = None, dtype: str = 'float64'):
+        if not fir_filters:
+            raise ValueError("fir_filters cannot be empty")
+
+        coefficients = [
+            fir_filter.coefficients if fir_filter.coefficients is not None else fir_filter.design()
+            for fir_filter in fir_filters
+        ]
+        self.taps = max(len(filter_coefficients) for filter_coefficients in coefficients)
+
+        if fft_size is None:
+            fft_size = fft.next_fast_len(max(self.MIN_FFT_SIZE, self.FFT_SIZE_FACTOR * self.taps), real=True)
+        if fft_size < self.taps:
+            raise ValueError("fft_size cannot be smaller than the taps of the longest filter")
+
+        self.dtype = np.dtype(dtype)
+        self.fft_size = fft_size
+        self.hop = fft_size - (self.taps - 1)
+        """New samples of every transformed block"""
+
+        # The shorter filters are padded with zeros, it does not change their output
+        padded = np.zeros((len(coefficients), self.taps), dtype=self.dtype)
+        for idx, filter_coefficients in enumerate(coefficients):
+            padded[idx, :len(filter_coefficients)] = filter_coefficients
+        self.coefficients = padded
+        self.spectra = fft.rfft(padded, n=fft_size, axis=-1)
+
+        self._history = np.zeros(self.taps - 1, dtype=self.dtype)
+
+    @property
+    def filters(self) -> int:
+        return len(self.coefficients)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Filters a block of samples with every filter carrying the state of the previous blocks
+        :param samples: Block of input samples
+        :return: Filtered samples, one row per filter with the same length as the block
+        """
+        samples = np.asarray(samples, dtype=self.dtype)
+        output = np.empty((self.filters, len(samples)), dtype=self.dtype)
+        if not len(samples):
+            return output
+
+        extended = np.concatenate((self._history, samples))
+        if len(self._history):
+            self._history = extended[-len(self._history):]
+
+        batch_hops = max(1, self.MAX_BATCH_SAMPLES // (self.hop * self.filters))
+        for start in range(0, len(samples), batch_hops * self.hop):
+            count = min(batch_hops * self.hop, len(samples) - start)
+            frames = -(-count // self.hop)
+
+            # The last frame is completed with zeros, its extra outputs are discarded
+            segment = np.zeros(frames * self.hop + self.taps - 1, dtype=self.dtype)
+            available = extended[start:start + count + self.taps - 1]
+            segment[:len(available)] = available
+            blocks = sliding_window_view(segment, self.fft_size)[::self.hop]
+
+            # The first taps - 1 outputs of every block wrap around and are discarded
+            spectra = fft.rfft(blocks, axis=-1)
+            filtered = fft.irfft(spectra[np.newaxis] * self.spectra[:, np.newaxis], n=self.fft_size, axis=-1)
+            output[:, start:start + count] = filtered[..., self.taps - 1:].reshape(self.filters, -1)[:, :count]
+
+        return output
+
+    def reset(self):
+        self._history = np.zeros(self.taps - 1, dtype=self.dtype)
@@ -0,0 +1,38 @@
+"""
+This file contains the implementation of the direct filter engine.
+"""
+import numpy as np
+from scipy.signal import convolve
+
+from app.filtering.filter_engines.filter_engine import FilterEngine
+
+
+class DirectFilterEngine(FilterEngine):
+    """
+    The Direct Filter Engine filters floating point samples with the filter coefficients.
+    Scipy chooses between the direct and the FFT convolution depending on the sizes.
+    With float32 the coefficients, the state and the output stay in float32.
+    """
+
+    def __init__(self, coefficients: list[float], dtype: str = 'float64'):
+        if not len(coefficients):
+            raise ValueError("coefficients cannot be empty")
+
+        self.dtype = np.dtype(dtype)
+        self.coefficients = np.asarray(coefficients, dtype=self.dtype)
+
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=self.dtype)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        samples = np.asarray(samples, dtype=self.dtype)
+        if not len(samples):
+            return samples
+
+        extended = np.concatenate((self._history, samples))
+        if len(self._history):
+            self._history = extended[-len(self._history):]
+
+        return convolve(extended, self.coefficients, mode='valid')
+
+    def reset(self):
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=self.dtype)
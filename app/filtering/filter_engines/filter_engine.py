@@ -0,0 +1,29 @@
+"""
+This file contains the Filter Engine interface.
+"""
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class FilterEngine(ABC):
+    """
+    The Filter Engine interface declares operations common to the filtering engines.
+    The engines keep the filter state between blocks, so a signal can be filtered in pieces.
+    """
+
+    @abstractmethod
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        This method filters a block of samples carrying the state of the previous blocks.
+        :param samples: Block of input samples
+        :return: Block of filtered samples with the same length
+        """
+        pass
+
+    @abstractmethod
+    def reset(self):
+        """
+        This method clears the filter state.
+        """
+        pass
@@ -0,0 +1,70 @@
+"""
+This file contains the implementation of the integer filter engine.
+"""
+from typing import Literal
+
+import numpy as np
+
+from app.filtering.filter_engines.filter_engine import FilterEngine
+
+Accumulator = Literal['int32', 'int64']
+
+
+class IntegerFilterEngine(FilterEngine):
+    """
+    The Integer Filter Engine filters int16 samples with fixed-point coefficients.
+    It reproduces the arithmetic of a fixed-point MAC: exact products, an int32 or int64
+    accumulator, rounding shift by the fractional bits and saturation to int16.
+    """
+    CHUNK_SIZE = 65536
+
+    def __init__(self, coefficients: list[int], fractional_bits: int, accumulator: Accumulator = 'int64'):
+        if not coefficients:
+            raise ValueError("coefficients cannot be empty")
+
+        if accumulator not in ('int32', 'int64'):
+            raise ValueError("accumulator must be one of int32, int64")
+
+        self.coefficients = np.asarray(coefficients, dtype=np.int64)
+        self.fractional_bits = fractional_bits
+        self.accumulator = accumulator
+
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=np.int16)
+
+    def _filter_chunk(self, extended: np.ndarray) -> np.ndarray:
+        """
+        Filters a chunk that starts with the filter history
+        :param extended: History followed by the new samples
+        :return: Filtered samples as int16
+        """
+        acc = np.convolve(extended.astype(np.int64), self.coefficients, mode='valid')
+
+        if self.accumulator == 'int32':
+            # Two's complement wrap, the same result as an int32 MAC that overflows
+            acc = acc.astype(np.int32).astype(np.int64)
+
+        if self.fractional_bits > 0:
+            acc = (acc + (1 << (self.fractional_bits - 1))) >> self.fractional_bits
+
+        return np.clip(acc, -32768, 32767).astype(np.int16)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        samples = np.asarray(samples)
+        if samples.dtype != np.int16:
+            raise TypeError("samples must be int16")
+
+        output = np.empty(len(samples), dtype=np.int16)
+        history_length = len(self._history)
+
+        # The int64 working buffers are bounded by the chunk size, input and output stay int16
+        for start in range(0, len(samples), self.CHUNK_SIZE):
+            chunk = samples[start:start + self.CHUNK_SIZE]
+            extended = np.concatenate((self._history, chunk))
+            output[start:start + len(chunk)] = self._filter_chunk(extended)
+            if history_length:
+                self._history = extended[-history_length:]
+
+        return output
+
+    def reset(self):
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=np.int16)
@@ -0,0 +1,108 @@
+"""
+This file contains the implementation of the sparse filter engine.
+"""
+import numpy as np
+
+from app.filtering.filter_engines.filter_engine import FilterEngine
+
+
+class SparseFilterEngine(FilterEngine):
+    """
+    The Sparse Filter Engine skips the taps that are structurally zero.
+    When the nonzero taps lie on a stride s (every other tap for half-band filters) the signal is
+    gathered with the same stride and filtered by the short subfilter of those taps, the few taps
+    off the stride (the center tap of half-band filters) are added one by one.
+    The cost is about N / s multiplies per sample instead of N. It is a direct convolution kernel,
+    for very long filters the FFT convolution of the DirectFilterEngine can still be faster.
+    """
+    MAX_STRIDE = 8
+    EXTRA_TAP_COST = 8
+    """Cost of a tap off the stride in strided taps, every extra tap is one more pass over the block"""
+
+    def __init__(self, coefficients: list[float], zero_taps: list[int] | None = None, dtype: str = 'float64'):
+        if not len(coefficients):
+            raise ValueError("coefficients cannot be empty")
+
+        self.dtype = np.dtype(dtype)
+        self.coefficients = np.asarray(coefficients, dtype=self.dtype)
+        if zero_taps is None:
+            zero_taps = np.flatnonzero(self.coefficients == 0).tolist()
+
+        zero = set(zero_taps)
+        nonzero = np.array([idx for idx in range(len(self.coefficients)) if idx not in zero], dtype=np.int64)
+
+        self.stride, self.offset, self.extra_taps = self._find_stride(nonzero)
+        if self.stride > 1:
+            self.subfilter = self.coefficients[self.offset::self.stride]
+            # Trailing zeros of the subfilter do not need to be multiplied
+            last = np.flatnonzero(self.subfilter)
+            self.subfilter = self.subfilter[:last[-1] + 1] if last.size else self.subfilter[:1]
+
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=self.dtype)
+
+    def _find_stride(self, nonzero: np.ndarray) -> tuple[int, int, list[int]]:
+        """
+        Finds the stride with the lowest cost, the cost is the subfilter length plus the weighted extra taps
+        :return: tuple with the stride, offset of the strided taps and the extra taps
+        """
+        best = (1, 0, [])
+        best_cost = len(self.coefficients)
+        if not nonzero.size:
+            return best
+
+        for stride in range(2, self.MAX_STRIDE + 1):
+            residues = nonzero % stride
+            offset = int(np.bincount(residues, minlength=stride).argmax())
+            strided = nonzero[residues == offset]
+            extra_taps = nonzero[residues != offset].tolist()
+
+            cost = (int(strided[-1]) - offset) // stride + 1 + self.EXTRA_TAP_COST * len(extra_taps)
+            if cost < best_cost:
+                best, best_cost = (stride, offset, extra_taps), cost
+
+        return best
+
+    @property
+    def multiplies_per_sample(self) -> int:
+        if self.stride == 1:
+            return len(self.coefficients)
+
+        return len(self.subfilter) + len(self.extra_taps)
+
+    def _filter_strided(self, extended: np.ndarray, length: int) -> np.ndarray:
+        """
+        Filters the strided taps, every output phase convolves one strided stream of the signal
+        """
+        output = np.empty(length, dtype=self.dtype)
+        history_length = len(self._history)
+        taps = len(self.subfilter)
+
+        for phase in range(min(self.stride, length)):
+            outputs = len(range(phase, length, self.stride))
+            start = history_length + phase - self.offset
+            stream = extended[start % self.stride::self.stride]
+            first = start // self.stride - (taps - 1)
+            output[phase::self.stride] = np.convolve(stream[first:first + outputs + taps - 1], self.subfilter, 'valid')
+
+        for tap in self.extra_taps:
+            start = history_length - tap
+            output += self.coefficients[tap] * extended[start:start + length]
+
+        return output
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        samples = np.asarray(samples, dtype=self.dtype)
+        if not len(samples):
+            return samples
+
+        extended = np.concatenate((self._history, samples))
+        if len(self._history):
+            self._history = extended[-len(self._history):]
+
+        if self.stride == 1:
+            return np.convolve(extended, self.coefficients, 'valid')
+
+        return self._filter_strided(extended, len(samples))
+
+    def reset(self):
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=self.dtype)
@@ -0,0 +1,88 @@
+"""
+This file contains the implementation of the decimating filter cascade
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class DecimationStage:
+    """
+    Decimation Stage class, filters and keeps one of every `decimation` samples.
+    Only the kept outputs are calculated, so the cost is taps / decimation per input sample.
+    """
+    MAX_ROWS = 4096
+
+    def __init__(self, coefficients: list[float], decimation: int):
+        if not coefficients:
+            raise ValueError("coefficients cannot be empty")
+
+        if decimation < 1:
+            raise ValueError("decimation must be greater than 0")
+
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.decimation = decimation
+
+        self._reversed = self.coefficients[::-1].copy()
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=np.float64)
+        self._phase = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Filters and decimates a block of samples carrying the state of the previous blocks
+        :param samples: Block of input samples
+        :return: Decimated output samples
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        extended = np.concatenate((self._history, samples))
+
+        # Row i of the windows ends at input sample i
+        windows = sliding_window_view(extended, len(self.coefficients))
+        positions = np.arange(self._phase, len(samples), self.decimation)
+
+        output = np.empty(len(positions), dtype=np.float64)
+        for start in range(0, len(positions), self.MAX_ROWS):
+            rows = positions[start:start + self.MAX_ROWS]
+            output[start:start + len(rows)] = windows[rows] @ self._reversed
+
+        if len(positions):
+            self._phase = int(positions[-1]) + self.decimation - len(samples)
+        else:
+            self._phase -= len(samples)
+
+        if len(self._history):
+            self._history = extended[-len(self._history):]
+
+        return output
+
+    def reset(self):
+        self._history = np.zeros(len(self.coefficients) - 1, dtype=np.float64)
+        self._phase = 0
+
+
+class MultistageCascade:
+    """
+    Multistage Cascade class, runs a signal through a chain of decimation stages
+    """
+
+    def __init__(self, stages: list[DecimationStage]):
+        if not stages:
+            raise ValueError("stages cannot be empty")
+
+        self.stages = stages
+
+    @property
+    def decimation(self) -> int:
+        return int(np.prod([stage.decimation for stage in self.stages]))
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Filters a block of samples, the output rate is the input rate divided by the total decimation
+        """
+        for stage in self.stages:
+            samples = stage.process(samples)
+
+        return samples
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
@@ -0,0 +1,29 @@
+"""
+This file contains the definitions of the filter cascade types.
+"""
+from typing import TypedDict, Literal
+
+CascadeMode = Literal['collapsed', 'sequential']
+
+
+class CascadePlan(TypedDict):
+    """
+    This class represents how a cascade of filters runs and its cost.
+    """
+    mode: CascadeMode
+    """Collapsed into one equivalent filter or run in sequence"""
+
+    macs_per_sample: int
+    """Multiply-accumulates per input sample of the selected mode"""
+
+    collapsed_macs: int
+    """Multiply-accumulates per sample of the equivalent filter"""
+
+    sequential_macs: int
+    """Multiply-accumulates per sample of the filters in sequence"""
+
+    collapsed_taps: int
+    """Taps of the equivalent filter"""
+
+    stage_taps: list[int]
+    """Taps of every filter of the cascade"""
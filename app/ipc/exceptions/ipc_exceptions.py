@@ -0,0 +1,7 @@
+"""
+IPC exceptions
+"""
+
+
+class IPCError(Exception):
+    """Raised when the filter service rejects a request."""
@@ -0,0 +1,93 @@
+"""
+This file contains the client of the local IPC server
+"""
+import json
+import socket
+
+import numpy as np
+from multiprocessing import shared_memory
+
+from app.design.types.fir_filter_types import FilterConf
+from app.ipc.exceptions.ipc_exceptions import IPCError
+from app.ipc.types.ipc_types import DetachRequest, FilterReply, FilterRequest, SharedBuffer
+
+
+def create_shared_array(length: int, dtype: str = 'float64') -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Creates a shared memory segment and an array over it
+    :param length: Number of samples
+    :param dtype: Type of the samples
+    :return: tuple with the segment, which the caller closes and unlinks, and the array
+    """
+    itemsize = np.dtype(dtype).itemsize
+    segment = shared_memory.SharedMemory(create=True, size=max(length * itemsize, 1))
+    return segment, np.ndarray((length,), dtype=dtype, buffer=segment.buf)
+
+
+class FilterIPCClient:
+    """
+    Filter IPC Client class, sends the filtering requests of the buffers that the caller shares
+    """
+
+    def __init__(self, socket_path: str):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(socket_path)
+        self._reader = self._socket.makefile('rb')
+
+    def filter(
+            self,
+            filter_conf: FilterConf,
+            input_buffer: SharedBuffer,
+            output_buffer: SharedBuffer | None = None,
+            round_value: int = 7,
+            stream: str | None = None,
+            reset: bool = False
+    ) -> FilterReply:
+        """
+        Filters a shared buffer
+        :param filter_conf: Filter configuration
+        :param input_buffer: Samples to filter
+        :param output_buffer: Buffer receiving the filtered samples, the input is filtered in place when it is None
+        :param round_value: Decimals used to round the values
+        :param stream: Name of the stream whose filter state is carried between calls
+        :param reset: Clears the state of the stream before filtering
+        :raises: IPCError if the server rejects the request
+        """
+        request = FilterRequest(filter_conf=filter_conf, input=input_buffer, round_value=round_value)
+        if output_buffer is not None:
+            request['output'] = output_buffer
+        if stream is not None:
+            request['stream'] = stream
+            request['reset'] = reset
+
+        return self._send(request)
+
+    def detach(self, name: str):
+        """
+        Asks the server to close a segment, called before the segment is unlinked
+        :param name: Name of the shared memory segment
+        :raises: IPCError if the server rejects the request
+        """
+        self._send(DetachRequest(detach=name))
+
+    def _send(self, request: FilterRequest | DetachRequest) -> FilterReply:
+        self._socket.sendall(json.dumps(request).encode() + b'\n')
+        line = self._reader.readline()
+        if not line:
+            raise IPCError("The server closed the connection")
+
+        reply: FilterReply = json.loads(line)
+        if reply['error'] is not None:
+            raise IPCError(reply['error'])
+
+        return reply
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'FilterIPCClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,196 @@
+"""
+This file contains the local IPC server that filters samples in shared memory.
+Requests are JSON lines sent through a Unix domain socket and the samples never go through the socket.
+"""
+import argparse
+import json
+import os
+import socketserver
+import threading
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from app.design.fir_filter_factory import design_filter
+from app.design.fir_filter_hash import design_hash
+from app.design.types.fir_filter_types import CoefficientType
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+from app.ipc.types.ipc_types import DetachRequest, FilterReply, FilterRequest, SharedBuffer
+
+VALID_SAMPLE_TYPES = ['float32', 'float64']
+
+
+class CoefficientCache:
+    """
+    Least recently used cache of designed coefficients, shared by every connection
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+
+        self._coefficients: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filter_conf: dict, round_value: int, dtype: CoefficientType = 'float64') -> list[float]:
+        key = design_hash(filter_conf, round_value, dtype)
+        with self._lock:
+            coefficients = self._coefficients.get(key)
+            if coefficients is not None:
+                self._coefficients.move_to_end(key)
+                return coefficients
+
+        coefficients = design_filter(filter_conf, round_value, dtype)
+        with self._lock:
+            self._coefficients[key] = coefficients
+            while len(self._coefficients) > self.max_entries:
+                self._coefficients.popitem(last=False)
+
+        return coefficients
+
+
+class FilterRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handles a client connection, the stream states live as long as the connection. The attached segments
+    are kept until the client detaches them or, beyond the server max_segments, the least recently used
+    ones are closed after the request that attached them.
+    """
+
+    def setup(self):
+        super().setup()
+        self.segments: OrderedDict[str, shared_memory.SharedMemory] = OrderedDict()
+        self.engines: dict[str, tuple[str, DirectFilterEngine]] = {}
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+                if 'detach' in request:
+                    reply = self.detach(request)
+                else:
+                    reply = self.filter(request)
+            except Exception as e:
+                reply = FilterReply(samples=0, taps=0, error=f"{type(e).__name__}: {e}")
+
+            # The arrays of the request are released, the segments can be closed
+            self.evict_segments()
+
+            self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+    def finish(self):
+        self.engines.clear()
+        for segment in self.segments.values():
+            segment.close()
+        super().finish()
+
+    def filter(self, request: FilterRequest) -> FilterReply:
+        """
+        Filters the input buffer into the output buffer, or in place when there is no output buffer
+        :param request: Filtering request
+        :return: Number of samples and taps
+        """
+        samples = self.attach(request['input'])
+        output = self.attach(request['output']) if request.get('output') else samples
+        if len(output) != len(samples):
+            raise ValueError("The output buffer must have the same length as the input buffer")
+
+        # The coefficients are designed and the samples filtered in the precision of the input buffer
+        dtype: CoefficientType = 'float32' if samples.dtype == np.float32 else 'float64'
+        filter_conf = request['filter_conf']
+        round_value = request.get('round_value', 7)
+        coefficients = self.server.coefficient_cache.get(filter_conf, round_value, dtype)
+        key = design_hash(filter_conf, round_value, dtype)
+
+        stream = request.get('stream')
+        if stream is None:
+            engine = DirectFilterEngine(coefficients, dtype=samples.dtype)
+        else:
+            # A stream that changes its design or precision starts from a clean state, the key has both
+            design_key, engine = self.engines.get(stream, (None, None))
+            if design_key != key or request.get('reset', False):
+                engine = DirectFilterEngine(coefficients, dtype=samples.dtype)
+                self.engines[stream] = (key, engine)
+
+        output[:] = engine.process(samples)
+
+        return FilterReply(samples=len(samples), taps=len(coefficients), error=None)
+
+    def detach(self, request: DetachRequest) -> FilterReply:
+        """
+        Closes the segment of a client that is going to unlink it
+        :param request: Detach request
+        """
+        segment = self.segments.pop(request['detach'], None)
+        if segment is not None:
+            segment.close()
+
+        return FilterReply(samples=0, taps=0, error=None)
+
+    def evict_segments(self):
+        """
+        Closes the least recently used segments beyond the max_segments of the server
+        """
+        while len(self.segments) > self.server.max_segments:
+            _, segment = self.segments.popitem(last=False)
+            segment.close()
+
+    def attach(self, buffer: SharedBuffer) -> np.ndarray:
+        """
+        Maps a block of a shared memory segment as an array without copying it
+        :param buffer: Shared buffer description
+        """
+        dtype = buffer.get('dtype', 'float64')
+        if dtype not in VALID_SAMPLE_TYPES:
+            raise ValueError(f"Invalid dtype: {dtype}, valid types: {', '.join(VALID_SAMPLE_TYPES)}")
+
+        segment = self.segments.get(buffer['name'])
+        if segment is None:
+            segment = shared_memory.SharedMemory(name=buffer['name'])
+            # The client owns the segment, the tracker of this process must not unlink it on exit
+            resource_tracker.unregister(segment._name, 'shared_memory')
+            self.segments[buffer['name']] = segment
+        else:
+            self.segments.move_to_end(buffer['name'])
+
+        return np.ndarray(
+            (buffer['length'],), dtype=dtype, buffer=segment.buf, offset=buffer.get('offset', 0)
+        )
+
+
+class FilterIPCServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Filter IPC Server class, serves every client connection in its own thread
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, cache_size: int = 64, max_segments: int = 16):
+        if max_segments < 2:
+            raise ValueError("max_segments must be at least 2, a request can use an input and an output segment")
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        self.socket_path = socket_path
+        self.max_segments = max_segments
+        self.coefficient_cache = CoefficientCache(cache_size)
+
+        super().__init__(socket_path, FilterRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Filters samples in shared memory for local processes')
+    parser.add_argument('socket_path', help='Path of the Unix domain socket')
+    parser.add_argument('--cache-size', type=int, default=64, help='Number of designs kept in memory')
+    parser.add_argument('--max-segments', type=int, default=16, help='Number of segments attached per connection')
+    args = parser.parse_args()
+
+    with FilterIPCServer(args.socket_path, args.cache_size, args.max_segments) as server:
+        server.serve_forever()
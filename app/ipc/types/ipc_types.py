@@ -0,0 +1,70 @@
+"""
+This file contains the definitions of the local IPC messages.
+"""
+from typing import TypedDict, Literal, NotRequired
+
+from app.design.types.fir_filter_types import FilterConf
+
+SampleType = Literal['float32', 'float64']
+
+
+class SharedBuffer(TypedDict):
+    """
+    This class represents a block of samples inside a shared memory segment.
+    """
+    name: str
+    """Name of the shared memory segment"""
+
+    length: int
+    """Number of samples"""
+
+    offset: NotRequired[int]
+    """Offset of the first sample in bytes"""
+
+    dtype: NotRequired[SampleType]
+    """Type of the samples, float64 by default"""
+
+
+class FilterRequest(TypedDict):
+    """
+    This class represents a filtering request sent through the control socket.
+    """
+    filter_conf: FilterConf
+    """Filter configuration"""
+
+    input: SharedBuffer
+    """Samples to filter"""
+
+    output: NotRequired[SharedBuffer]
+    """Buffer receiving the filtered samples, the input is filtered in place when it is missing"""
+
+    round_value: NotRequired[int]
+    """Decimals used to round the values"""
+
+    stream: NotRequired[str]
+    """Name of the stream, blocks of the same stream carry the filter state"""
+
+    reset: NotRequired[bool]
+    """Clears the state of the stream before filtering"""
+
+
+class DetachRequest(TypedDict):
+    """
+    This class represents a request to close a shared memory segment before the client unlinks it.
+    """
+    detach: str
+    """Name of the shared memory segment"""
+
+
+class FilterReply(TypedDict):
+    """
+    This class represents the reply to a filtering request.
+    """
+    samples: int
+    """Number of filtered samples"""
+
+    taps: int
+    """Number of filter coefficients"""
+
+    error: str | None
+    """Error of the request"""
@@ -0,0 +1,37 @@
+"""
+Job exceptions
+"""
+
+
+class JobError(Exception):
+    """Base class for all job errors."""
+
+
+class QueueFullError(JobError):
+    """Raised when the job queue has reached its maximum depth."""
+
+    def __init__(self, queue_depth: int, retry_after: int):
+        super().__init__(f"Job queue is full ({queue_depth} jobs waiting), retry in {retry_after} seconds")
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+
+
+class JobNotFoundError(JobError):
+    """Raised when a job does not exist or its result has expired."""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Job {job_id} not found")
+        self.job_id = job_id
+
+
+class JobNotFinishedError(JobError):
+    """Raised when the result of a job is requested before the job has completed."""
+
+    def __init__(self, job_id: str, state: str):
+        super().__init__(f"Job {job_id} has no result, it is {state}")
+        self.job_id = job_id
+        self.state = state
+
+
+class JobCancelledError(JobError):
+    """Raised inside a running job when it has been cancelled."""
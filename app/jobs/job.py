@@ -0,0 +1,101 @@
+"""
+This file contains the implementation of the job class
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from app.jobs.exceptions.job_exceptions import JobCancelledError
+from app.jobs.types.job_types import JobState, JobStatus, FINISHED_JOB_STATES
+
+
+class Job:
+    """
+    Job class, a unit of work run by the job manager.
+    The handler receives the job to report its progress and to check if it has been cancelled.
+    """
+
+    def __init__(self, kind: str, handler: Callable[['Job'], Any]):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.handler = handler
+
+        self.state: JobState = 'queued'
+        self.progress = 0.0
+        self.result = None
+        self.error: str | None = None
+
+        self.submitted_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+        self.future: Future | None = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_JOB_STATES
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def set_progress(self, progress: float):
+        """
+        Reports the progress of the job, raises if the job has been cancelled
+        :param progress: Progress between 0 and 1
+        """
+        self.progress = min(max(progress, 0.0), 1.0)
+        self.raise_if_cancelled()
+
+    def raise_if_cancelled(self):
+        """
+        Stops the handler when the job has been cancelled
+        :raises: JobCancelledError if the job has been cancelled
+        """
+        if self._cancel_event.is_set():
+            raise JobCancelledError(f"Job {self.job_id} cancelled")
+
+    def request_cancel(self):
+        """
+        Asks the job to stop, a running handler stops the next time it reports progress
+        """
+        self._cancel_event.set()
+
+    def run(self):
+        """
+        Runs the handler, it is called from a worker of the pool
+        """
+        if self._cancel_event.is_set():
+            self.state = 'cancelled'
+            self.finished_at = time.time()
+            return
+
+        self.state = 'running'
+        self.started_at = time.time()
+        try:
+            self.result = self.handler(self)
+            self.progress = 1.0
+            self.state = 'completed'
+        except JobCancelledError:
+            self.state = 'cancelled'
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            self.state = 'failed'
+        finally:
+            self.finished_at = time.time()
+
+    def get_status(self, result_ttl: float) -> JobStatus:
+        return JobStatus(
+            job_id=self.job_id,
+            kind=self.kind,
+            state=self.state,
+            progress=self.progress,
+            error=self.error,
+            submitted_at=self.submitted_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            expires_at=self.finished_at + result_ttl if self.finished_at is not None else None,
+        )
@@ -0,0 +1,99 @@
+"""
+This file contains the handlers of the design and filtering jobs
+"""
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from app.design.fir_filter_factory import design_filter
+from app.design.types.fir_filter_types import CoefficientType, FilterConf
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+from app.jobs.job import Job
+
+
+def resolve_data_path(path: str, data_dir: Path) -> Path:
+    """
+    Resolves a path of a job inside the data directory
+    :param path: Path relative to the data directory
+    :param data_dir: Directory where the jobs read and write their files
+    :raises: ValueError if the path is outside the data directory
+    """
+    root = data_dir.resolve()
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError(f"{path} is outside the data directory")
+
+    return resolved
+
+
+def create_design_handler(
+        filter_confs: list[FilterConf], round_value: int = 7, dtype: CoefficientType = 'float64'
+) -> Callable[[Job], list[dict]]:
+    """
+    Creates the handler of a job that designs many filters
+    :param filter_confs: Filter configurations
+    :param round_value: Decimals used to round the values
+    :param dtype: Precision of the designed coefficients
+    :return: Handler that returns the coefficients or the error of each configuration
+    """
+
+    def handler(job: Job) -> list[dict]:
+        results = []
+        for idx, filter_conf in enumerate(filter_confs):
+            try:
+                results.append({'coefficients': design_filter(filter_conf, round_value, dtype), 'error': None})
+            except Exception as e:
+                results.append({'coefficients': None, 'error': f"{type(e).__name__}: {e}"})
+            job.set_progress((idx + 1) / len(filter_confs))
+
+        return results
+
+    return handler
+
+
+def create_filter_handler(
+        filter_conf: FilterConf,
+        input_path: Path,
+        output_path: Path,
+        round_value: int = 7,
+        block_size: int = 1 << 20,
+        dtype: CoefficientType | None = None
+) -> Callable[[Job], dict]:
+    """
+    Creates the handler of a job that filters a .npy signal into another .npy file.
+    Both files are memory mapped and the signal is filtered block by block, so its size is not bounded by memory.
+    :param filter_conf: Filter configuration
+    :param input_path: Input signal, a one dimensional .npy file
+    :param output_path: Output signal, it is created with samples of the precision of the filtering
+    :param round_value: Decimals used to round the values
+    :param block_size: Number of samples filtered per block
+    :param dtype: Precision of the coefficients, the filtering and the output, by default float32 for
+        float32 signals and float64 otherwise
+    :return: Handler that returns the output path and the number of samples
+    """
+
+    def handler(job: Job) -> dict:
+        signal = np.load(input_path, mmap_mode='r')
+        if signal.ndim != 1:
+            raise ValueError("The input signal must be one dimensional")
+
+        precision = dtype or ('float32' if signal.dtype == np.float32 else 'float64')
+        coefficients = design_filter(filter_conf, round_value, precision)
+        engine = DirectFilterEngine(coefficients, dtype=precision)
+        job.raise_if_cancelled()
+
+        output = np.lib.format.open_memmap(output_path, mode='w+', dtype=precision, shape=signal.shape)
+        try:
+            for start in range(0, len(signal), block_size):
+                output[start:start + block_size] = engine.process(signal[start:start + block_size])
+                job.set_progress(min(start + block_size, len(signal)) / max(len(signal), 1))
+            output.flush()
+        finally:
+            del output
+
+        return {
+            'output_path': str(output_path), 'samples': len(signal), 'taps': len(coefficients), 'dtype': precision
+        }
+
+    return handler
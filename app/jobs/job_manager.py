@@ -0,0 +1,136 @@
+"""
+This file contains the implementation of the in-process job manager
+"""
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.jobs.exceptions.job_exceptions import QueueFullError, JobNotFoundError, JobNotFinishedError
+from app.jobs.job import Job
+from app.jobs.types.job_types import JobStatus
+
+
+class JobManager:
+    """
+    Job Manager class, runs jobs in a bounded pool of worker threads without external brokers.
+    At most max_queue_depth jobs can wait for a worker, finished jobs are kept for result_ttl seconds.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue_depth: int = 32, result_ttl: float = 600):
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+
+        if max_queue_depth < 0:
+            raise ValueError("max_queue_depth cannot be negative")
+
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.result_ttl = result_ttl
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fir-job')
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def _purge_expired(self):
+        """
+        Removes the finished jobs whose result has expired, the lock must be held
+        """
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at is not None and job.finished_at + self.result_ttl <= now
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _get_job(self, job_id: str) -> Job:
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+
+        if job is None:
+            raise JobNotFoundError(job_id)
+
+        return job
+
+    def _estimate_retry_after(self) -> int:
+        """
+        Estimates when a queue slot is freed from the average duration of the finished jobs
+        """
+        durations = [
+            job.finished_at - job.started_at for job in self._jobs.values()
+            if job.started_at is not None and job.finished_at is not None
+        ]
+        if not durations:
+            return 1
+
+        return max(1, math.ceil(sum(durations) / len(durations)))
+
+    def submit(self, kind: str, handler: Callable[[Job], Any]) -> JobStatus:
+        """
+        Submits a job
+        :param kind: Kind of work done by the job
+        :param handler: Callable that receives the job and returns its result
+        :return: Status of the submitted job
+        :raises: QueueFullError if the queue has reached its maximum depth
+        """
+        with self._lock:
+            self._purge_expired()
+
+            waiting = sum(1 for job in self._jobs.values() if not job.finished) - self.max_workers
+            if waiting >= self.max_queue_depth:
+                raise QueueFullError(max(waiting, 0), self._estimate_retry_after())
+
+            job = Job(kind, handler)
+            self._jobs[job.job_id] = job
+            job.future = self._executor.submit(job.run)
+
+        return job.get_status(self.result_ttl)
+
+    def get_status(self, job_id: str) -> JobStatus:
+        """
+        Gets the status of a job
+        :raises: JobNotFoundError if the job does not exist or has expired
+        """
+        return self._get_job(job_id).get_status(self.result_ttl)
+
+    def cancel(self, job_id: str) -> JobStatus:
+        """
+        Cancels a job, queued jobs never start and running jobs stop at their next progress report
+        :raises: JobNotFoundError if the job does not exist or has expired
+        """
+        job = self._get_job(job_id)
+
+        if not job.finished:
+            job.request_cancel()
+            if job.future is not None and job.future.cancel():
+                job.state = 'cancelled'
+                job.finished_at = time.time()
+
+        return job.get_status(self.result_ttl)
+
+    def get_result(self, job_id: str) -> Any:
+        """
+        Gets the result of a completed job
+        :raises: JobNotFoundError if the job does not exist or has expired
+        :raises: JobNotFinishedError if the job has not completed
+        """
+        job = self._get_job(job_id)
+
+        if job.state != 'completed':
+            raise JobNotFinishedError(job_id, job.state)
+
+        return job.result
+
+    def shutdown(self, wait: bool = True):
+        """
+        Cancels the pending jobs and stops the workers
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.finished:
+                    job.request_cancel()
+
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,40 @@
+"""
+This file contains the definitions of job types.
+"""
+from typing import TypedDict, Literal
+
+JobState = Literal['queued', 'running', 'completed', 'failed', 'cancelled']
+
+FINISHED_JOB_STATES: list[str] = ['completed', 'failed', 'cancelled']
+
+
+class JobStatus(TypedDict):
+    """
+    This class represents the status of a job.
+    """
+    job_id: str
+    """Job identifier"""
+
+    kind: str
+    """Kind of work done by the job"""
+
+    state: JobState
+    """Current state of the job"""
+
+    progress: float
+    """Progress between 0 and 1"""
+
+    error: str | None
+    """Error message when the job failed"""
+
+    submitted_at: float
+    """Submission timestamp"""
+
+    started_at: float | None
+    """Start timestamp"""
+
+    finished_at: float | None
+    """Finish timestamp"""
+
+    expires_at: float | None
+    """Timestamp when the job and its result are discarded"""
@@ -0,0 +1,51 @@
+"""
+This file contains the service that renders the frequency response plots in a worker pool
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from app.design.fir_filter_hash import design_hash
+from app.design.types.fir_filter_types import FilterConf
+from app.rendering.render_cache import RenderCache
+from app.rendering.response_renderer import render_design
+from app.rendering.types.render_types import PlotParams
+
+
+class PlotRenderService:
+    """
+    Plot Render Service class, renders the plots in worker processes and caches the images
+    by design hash and plot parameters, so repeated plots do not run matplotlib again.
+    """
+
+    def __init__(self, max_workers: int = 2, cache_size: int = 256):
+        self.cache = RenderCache(cache_size)
+
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+    @staticmethod
+    def get_cache_key(filter_conf: FilterConf, round_value: int, params: PlotParams) -> tuple:
+        return design_hash(filter_conf, round_value), tuple(sorted(params.items()))
+
+    async def render(self, filter_conf: FilterConf, round_value: int, params: PlotParams) -> bytes:
+        """
+        Renders the frequency response of a design
+        :param filter_conf: Filter configuration
+        :param round_value: Decimals used to round the values
+        :param params: Plot parameters
+        :return: Image bytes
+        """
+        key = self.get_cache_key(filter_conf, round_value, params)
+
+        image = self.cache.get(key)
+        if image is not None:
+            return image
+
+        loop = asyncio.get_running_loop()
+        image = await loop.run_in_executor(self._executor, render_design, dict(filter_conf), round_value, params)
+        self.cache.put(key, image)
+
+        return image
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
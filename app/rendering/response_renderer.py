@@ -0,0 +1,58 @@
+"""
+This file contains the non-interactive rendering of the frequency response
+"""
+import io
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from scipy.signal import freqz
+
+from app.design.fir_filter_factory import design_filter
+from app.design.types.fir_filter_types import FilterConf
+from app.rendering.types.render_types import PlotParams
+
+
+def render_frequency_response(coefficients: list[float], F: float, params: PlotParams) -> bytes:
+    """
+    Renders the frequency response with the Agg backend, it does not need a display
+    :param coefficients: Filter coefficients
+    :param F: Sampling frequency in Hz
+    :param params: Plot parameters
+    :return: Image bytes
+    """
+    f_max = F / 2 if params['f_max'] is None else params['f_max']
+    if not 0 <= params['f_min'] < f_max <= F / 2:
+        raise ValueError("The frequency range must be inside 0 and F/2")
+
+    frequencies = np.linspace(params['f_min'], f_max, params['grid_size'])
+    _, h = freqz(coefficients, 1, worN=frequencies, fs=F)
+
+    figure = Figure(figsize=(8, 4.5))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+
+    if params['scale'] == 'log':
+        ax.semilogy(frequencies, np.abs(h))
+    else:
+        ax.plot(frequencies, np.abs(h))
+
+    ax.set_xlabel('Frequency [Hz]')
+    ax.set_ylabel('|H(f)|')
+    ax.grid()
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=params['image_format'])
+    return buffer.getvalue()
+
+
+def render_design(filter_conf: FilterConf, round_value: int, params: PlotParams) -> bytes:
+    """
+    Designs the filter and renders its frequency response, it runs in the workers of the render pool
+    :param filter_conf: Filter configuration
+    :param round_value: Decimals used to round the values
+    :param params: Plot parameters
+    :return: Image bytes
+    """
+    coefficients = design_filter(filter_conf, round_value)
+    return render_frequency_response(coefficients, filter_conf['F'], params)
@@ -0,0 +1,32 @@
+"""
+This file contains the definitions of the rendering types.
+"""
+from typing import TypedDict, Literal
+
+ImageFormat = Literal['png', 'svg']
+PlotScale = Literal['log', 'linear']
+
+IMAGE_MEDIA_TYPES: dict[str, str] = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+
+class PlotParams(TypedDict):
+    """
+    This class represents the parameters of a frequency response plot.
+    """
+    image_format: ImageFormat
+    """Format of the image"""
+
+    grid_size: int
+    """Number of frequency points"""
+
+    scale: PlotScale
+    """Scale of the magnitude axis"""
+
+    f_min: float
+    """First frequency of the plot in Hz"""
+
+    f_max: float | None
+    """Last frequency of the plot in Hz, F/2 when it is None"""
@@ -0,0 +1,143 @@
+"""
+This file contains the filtering stream of the real time clients
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Awaitable, Callable
+
+import numpy as np
+
+from app.filtering.filter_engines.filter_engine import FilterEngine
+from app.streaming.types.stream_types import StreamMetrics
+
+# Bigger frames are filtered in a thread so they do not block the other connections
+INLINE_FRAME_SAMPLES = 8192
+LATENCY_WINDOW = 1024
+RESET_ACKNOWLEDGEMENT = 'reset: ok'
+COMMANDS: list[str] = ['reset', 'metrics']
+MAX_COMMAND_ECHO = 64
+
+Receive = Callable[[], Awaitable[bytes | str | None]]
+Send = Callable[[bytes | str], Awaitable[None]]
+
+
+class FilterStream:
+    """
+    Filter Stream class, filters the frames of a client carrying the filter state between them.
+    The frames go through bounded queues from the receiver to the filter and from the filter to the sender,
+    when a queue is full the receiver stops reading and the transport pushes back on the client.
+    """
+
+    def __init__(self, engine: FilterEngine, queue_size: int = 8, dtype: str = '<f4'):
+        self.engine = engine
+        self.dtype = np.dtype(dtype)
+
+        self._input_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._output_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        self.frames = 0
+        self.samples = 0
+        self.max_queued_frames = 0
+        self._opened_at = time.perf_counter()
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    async def run(self, receive: Receive, send: Send):
+        """
+        Filters the frames until the client closes the stream
+        :param receive: Receives the next binary frame or text command, None when the client disconnects
+        :param send: Sends a binary frame or a text message
+        """
+        tasks = [
+            asyncio.create_task(self._receive(receive)),
+            asyncio.create_task(self._filter()),
+            asyncio.create_task(self._send(send)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _receive(self, receive: Receive):
+        while True:
+            message = await receive()
+            await self._input_queue.put((time.perf_counter(), message))
+            self._update_queued_frames()
+            if message is None:
+                return
+
+    async def _filter(self):
+        while True:
+            received_at, message = await self._input_queue.get()
+            if message == 'reset':
+                # The state is cleared here, between the frames before and after the command
+                self.engine.reset()
+                await self._output_queue.put((received_at, RESET_ACKNOWLEDGEMENT))
+                continue
+            if isinstance(message, str) and message not in COMMANDS:
+                await self._output_queue.put((received_at, f'error: unknown command {message[:MAX_COMMAND_ECHO]}'))
+                continue
+            if message is None or isinstance(message, str):
+                # Commands keep their order with the frames
+                await self._output_queue.put((received_at, message))
+                if message is None:
+                    return
+                continue
+
+            if len(message) % self.dtype.itemsize:
+                await self._output_queue.put((received_at, 'error: the frame is not a whole number of samples'))
+                continue
+
+            samples = np.frombuffer(message, dtype=self.dtype)
+            if len(samples) > INLINE_FRAME_SAMPLES:
+                filtered = await asyncio.to_thread(self.engine.process, samples)
+            else:
+                filtered = self.engine.process(samples)
+
+            await self._output_queue.put((received_at, np.asarray(filtered, dtype=self.dtype).tobytes()))
+            self._update_queued_frames()
+
+    async def _send(self, send: Send):
+        while True:
+            received_at, message = await self._output_queue.get()
+            if message is None:
+                return
+
+            if message == 'metrics':
+                await send(json.dumps(self.get_metrics()))
+                continue
+            if isinstance(message, str):
+                await send(message)
+                continue
+
+            await send(message)
+            self._record_frame(len(message) // self.dtype.itemsize, time.perf_counter() - received_at)
+
+    def _update_queued_frames(self):
+        queued = self._input_queue.qsize() + self._output_queue.qsize()
+        self.max_queued_frames = max(self.max_queued_frames, queued)
+
+    def _record_frame(self, samples: int, latency: float):
+        self.frames += 1
+        self.samples += samples
+        self._latency_total += latency
+        self._latency_max = max(self._latency_max, latency)
+        self._latencies.append(latency)
+
+    def get_metrics(self) -> StreamMetrics:
+        duration = time.perf_counter() - self._opened_at
+        return StreamMetrics(
+            frames=self.frames,
+            samples=self.samples,
+            duration_s=duration,
+            throughput_sps=self.samples / duration if duration else 0.0,
+            average_latency_ms=1000 * self._latency_total / self.frames if self.frames else 0.0,
+            p99_latency_ms=1000 * float(np.percentile(self._latencies, 99)) if self._latencies else 0.0,
+            max_latency_ms=1000 * self._latency_max,
+            max_queued_frames=self.max_queued_frames,
+        )
@@ -0,0 +1,36 @@
+"""
+This file contains the registry of the filtering streams
+"""
+from app.streaming.filter_stream import FilterStream
+from app.streaming.types.stream_types import StreamRegistryMetrics
+
+
+class StreamRegistry:
+    """
+    Stream Registry class, keeps the open streams and the totals of the closed ones
+    """
+
+    def __init__(self):
+        self.closed_streams = 0
+
+        self._streams: set[FilterStream] = set()
+        self._closed_frames = 0
+        self._closed_samples = 0
+
+    def add(self, stream: FilterStream):
+        self._streams.add(stream)
+
+    def remove(self, stream: FilterStream):
+        self._streams.discard(stream)
+        self.closed_streams += 1
+        self._closed_frames += stream.frames
+        self._closed_samples += stream.samples
+
+    def get_metrics(self) -> StreamRegistryMetrics:
+        return StreamRegistryMetrics(
+            active_streams=len(self._streams),
+            closed_streams=self.closed_streams,
+            frames=self._closed_frames + sum(stream.frames for stream in self._streams),
+            samples=self._closed_samples + sum(stream.samples for stream in self._streams),
+            streams=[stream.get_metrics() for stream in self._streams],
+        )
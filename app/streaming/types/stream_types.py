@@ -0,0 +1,53 @@
+"""
+This file contains the definitions of the streaming types.
+"""
+from typing import TypedDict
+
+
+class StreamMetrics(TypedDict):
+    """
+    This class represents the metrics of a filtering stream.
+    """
+    frames: int
+    """Frames filtered and sent back"""
+
+    samples: int
+    """Samples filtered and sent back"""
+
+    duration_s: float
+    """Time since the stream was opened in seconds"""
+
+    throughput_sps: float
+    """Samples filtered per second since the stream was opened"""
+
+    average_latency_ms: float
+    """Average time from receiving a frame to sending it back in milliseconds"""
+
+    p99_latency_ms: float
+    """99th percentile of the latency of the recent frames in milliseconds"""
+
+    max_latency_ms: float
+    """Highest latency in milliseconds"""
+
+    max_queued_frames: int
+    """Highest number of frames waiting to be filtered or sent"""
+
+
+class StreamRegistryMetrics(TypedDict):
+    """
+    This class represents the metrics of every filtering stream.
+    """
+    active_streams: int
+    """Streams open"""
+
+    closed_streams: int
+    """Streams closed"""
+
+    frames: int
+    """Frames filtered by every stream"""
+
+    samples: int
+    """Samples filtered by every stream"""
+
+    streams: list[StreamMetrics]
+    """Metrics of the open streams"""
@@ -0,0 +1,187 @@
+"""
+Load test of the designs API, measures the latency percentiles, throughput and error rate of GET /designs
+with a mix of filter types, windows and tap counts. The API runs in process through its ASGI interface
+or in a uvicorn process listening on a Unix domain socket.
+
+Run with: python -m benchmarks.api_load_test --mode asgi --concurrency 1,4,16 --output report.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import httpx
+import numpy as np
+
+FILTER_TYPES = ['lowpass', 'highpass', 'bandpass', 'stopband']
+FILTER_WINDOWS = ['hamming', 'blackman', 'kaiser']
+# Transition widths in Hz at F = 8000, from about 20 to 2000 taps depending on the window
+TRANSITION_WIDTHS = [400, 200, 100, 50, 25, 12.5]
+PERCENTILES = [50, 95, 99]
+
+
+def create_spec_mix(count: int, seed: int = 0) -> list[dict]:
+    """
+    Creates a reproducible mix of filter configurations
+    :param count: Number of configurations
+    :param seed: Seed of the random choices
+    """
+    rng = random.Random(seed)
+    specs = []
+    for _ in range(count):
+        filter_type = rng.choice(FILTER_TYPES)
+        transition = rng.choice(TRANSITION_WIDTHS)
+        # Jitter the edges so the requests are not all identical designs
+        edge = 1000 + rng.uniform(-100, 100)
+
+        spec = dict(filter_type=filter_type, filter_window=rng.choice(FILTER_WINDOWS),
+                    Ap=rng.choice([0.1, 0.5, 1]), As=rng.choice([30, 40, 50, 60]), F=8000)
+        if filter_type == 'lowpass':
+            spec.update(fp=edge, fs=edge + transition)
+        elif filter_type == 'highpass':
+            spec.update(fs=edge, fp=edge + transition)
+        elif filter_type == 'bandpass':
+            spec.update(fs=edge, fp=edge + transition, fp2=2500, fs2=2500 + transition)
+        else:
+            spec.update(fp=edge, fs=edge + transition, fs2=2500, fp2=2500 + transition)
+        specs.append(spec)
+
+    return specs
+
+
+async def run_load(client: httpx.AsyncClient, specs: list[dict], concurrency: int, verify: bool) -> dict:
+    """
+    Sends every configuration with a fixed number of requests in flight
+    :return: Latency percentiles, throughput and error rate of the run
+    """
+    latencies = []
+    status_codes: dict[str, int] = {}
+    errors = 0
+    next_spec = iter(specs)
+
+    async def worker():
+        nonlocal errors
+        for spec in next_spec:
+            start = time.perf_counter()
+            try:
+                response = await client.get('/designs', params={**spec, 'verify': verify})
+                status = str(response.status_code)
+                failed = response.status_code >= 400
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            status_codes[status] = status_codes.get(status, 0) + 1
+            errors += failed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+
+    latencies_ms = 1000 * np.asarray(latencies)
+    return {
+        'concurrency': concurrency,
+        'requests': len(specs),
+        'errors': errors,
+        'error_rate': errors / len(specs),
+        'duration_s': round(duration, 4),
+        'throughput_rps': round(len(specs) / duration, 2),
+        'latency_ms': {
+            'mean': round(float(latencies_ms.mean()), 3),
+            **{f"p{p}": round(float(np.percentile(latencies_ms, p)), 3) for p in PERCENTILES},
+            'max': round(float(latencies_ms.max()), 3),
+        },
+        'status_codes': dict(sorted(status_codes.items())),
+    }
+
+
+async def run_levels(client: httpx.AsyncClient, args: argparse.Namespace) -> list[dict]:
+    specs = create_spec_mix(args.requests, args.seed)
+    await run_load(client, create_spec_mix(args.warmup, args.seed + 1), 1, args.verify)
+
+    runs = []
+    for concurrency in args.concurrency:
+        runs.append(await run_load(client, specs, concurrency, args.verify))
+        print(json.dumps(runs[-1]), file=sys.stderr)
+
+    return runs
+
+
+async def run_asgi(args: argparse.Namespace) -> list[dict]:
+    from app.api.server import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://fir', timeout=args.timeout) as client:
+            return await run_levels(client, args)
+
+
+async def run_socket(args: argparse.Namespace) -> list[dict]:
+    socket_path = os.path.join(tempfile.mkdtemp(), 'fir-api.sock')
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'app.api.server:app', '--uds', socket_path, '--log-level', 'warning']
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not os.path.exists(socket_path):
+            if server.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("The API server did not start")
+            await asyncio.sleep(0.1)
+
+        transport = httpx.AsyncHTTPTransport(uds=socket_path)
+        limits = httpx.Limits(max_connections=max(args.concurrency))
+        async with httpx.AsyncClient(
+                transport=transport, base_url='http://fir', timeout=args.timeout, limits=limits
+        ) as client:
+            return await run_levels(client, args)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test of the designs API')
+    parser.add_argument('--mode', choices=['asgi', 'socket'], default='asgi')
+    parser.add_argument('--concurrency', type=lambda value: [int(level) for level in value.split(',')],
+                        default=[1, 4, 16], help='Comma separated requests in flight of each run')
+    parser.add_argument('--requests', type=int, default=500, help='Requests of each run')
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--verify', action='store_true', help='Verify the designs against their specifications')
+    parser.add_argument('--output', help='Path of the JSON report, it is printed when missing')
+    args = parser.parse_args()
+
+    runs = asyncio.run(run_asgi(args) if args.mode == 'asgi' else run_socket(args))
+
+    report = {
+        'metadata': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'mode': args.mode,
+            'requests': args.requests,
+            'seed': args.seed,
+            'verify': args.verify,
+        },
+        'runs': runs,
+        'saturation_throughput_rps': max(run['throughput_rps'] for run in runs),
+    }
+    serialized = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(serialized + '\n')
+    else:
+        print(serialized)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""
+Benchmark suite of the design, windowing and filtering hot paths.
+The run command stores the timings with the environment metadata as JSON, the compare command flags the
+benchmarks of a run that are slower than a baseline run beyond a threshold.
+
+Run with:
+    python -m benchmarks.benchmark_suite run --output new.json [--filter design/]
+    python -m benchmarks.benchmark_suite compare old.json new.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Callable
+
+import numpy as np
+import scipy
+
+from app.design.fir_filter import FIRFilter
+from app.design.fir_filter_factory import create_fir_filter
+from app.design.quantization.coefficient_quantizer import CoefficientQuantizer
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+from app.filtering.filter_engines.integer_filter_engine import IntegerFilterEngine
+from app.filtering.filter_engines.sparse_filter_engine import SparseFilterEngine
+from benchmarks.sparse_filtering_benchmark import DenseDirectFilterEngine, half_band_conf
+
+FILTER_TYPES = ['lowpass', 'highpass', 'bandpass', 'stopband']
+FILTER_WINDOWS = ['hamming', 'blackman', 'kaiser']
+# Transition widths in Hz at F = 8000, the Kaiser designs have about 45, 180 and 730 taps
+TRANSITION_WIDTHS = {'short': 400, 'medium': 100, 'long': 25}
+FILTERING_SAMPLES = 1 << 18
+FILTERING_BLOCK_SIZE = 1 << 14
+REPEATS = 5
+
+
+def filter_conf(filter_type: str, filter_window: str, transition: float) -> dict:
+    conf = dict(filter_type=filter_type, filter_window=filter_window, Ap=0.1, As=60, F=8000)
+    if filter_type == 'lowpass':
+        conf.update(fp=1000, fs=1000 + transition)
+    elif filter_type == 'highpass':
+        conf.update(fs=1000, fp=1000 + transition)
+    elif filter_type == 'bandpass':
+        conf.update(fs=1000, fp=1000 + transition, fp2=2500, fs2=2500 + transition)
+    else:
+        conf.update(fp=1000, fs=1000 + transition, fs2=2500, fp2=2500 + transition)
+
+    return conf
+
+
+def designed_filter(conf: dict) -> FIRFilter:
+    fir_filter = create_fir_filter(conf)
+    fir_filter.design()
+    return fir_filter
+
+
+def design_benchmarks() -> dict[str, Callable]:
+    benchmarks = {}
+    for filter_type in FILTER_TYPES:
+        for filter_window in FILTER_WINDOWS:
+            for length, transition in TRANSITION_WIDTHS.items():
+                conf = filter_conf(filter_type, filter_window, transition)
+                benchmarks[f"design/{filter_type}/{filter_window}/{length}"] = (
+                    lambda conf=conf: create_fir_filter(conf).design()
+                )
+
+    conf = filter_conf('lowpass', 'kaiser', TRANSITION_WIDTHS['medium'])
+    benchmarks['design/lowpass/equiripple/medium'] = lambda: create_fir_filter(
+        {**conf, 'design_method': 'equiripple'}
+    ).design()
+    bands = [dict(start=0, end=1000, gain=1), dict(start=1100, end=2000, gain=0),
+             dict(start=2100, end=3000, gain=0.5), dict(start=3100, end=4000, gain=0)]
+    benchmarks['design/multiband/hamming/medium'] = lambda: create_fir_filter(
+        dict(filter_type='multiband', filter_window='hamming', Ap=0.1, As=60, F=8000, bands=bands)
+    ).design()
+
+    return benchmarks
+
+
+def strategy_benchmarks() -> dict[str, Callable]:
+    benchmarks = {}
+    for length, transition in TRANSITION_WIDTHS.items():
+        for filter_type in FILTER_TYPES:
+            fir_filter = designed_filter(filter_conf(filter_type, 'kaiser', transition))
+            benchmarks[f"impulse_response/{filter_type}/{length}"] = fir_filter.filter_strategy.get_impulse_response
+
+        for filter_window in FILTER_WINDOWS:
+            fir_filter = designed_filter(filter_conf('lowpass', filter_window, transition))
+            benchmarks[f"window/{filter_window}/{length}"] = (
+                lambda fir_filter=fir_filter: fir_filter._calculate_window(fir_filter.n, fir_filter.N)
+            )
+
+        fir_filter = designed_filter(filter_conf('lowpass', 'kaiser', transition))
+        half = fir_filter.coefficients[fir_filter.n:]
+        benchmarks[f"order_coefficients/{length}"] = lambda half=half: FIRFilter.order_coefficients(half)
+
+    kaiser = designed_filter(filter_conf('lowpass', 'kaiser', TRANSITION_WIDTHS['medium'])).window_strategy
+    benchmarks['kaiser/_sum_k_coefficients'] = lambda: kaiser._sum_k_coefficients(kaiser.alpha)
+
+    return benchmarks
+
+
+def filtering_benchmarks() -> dict[str, Callable]:
+    signal = np.random.default_rng(0).standard_normal(FILTERING_SAMPLES)
+    integer_signal = np.round(signal * 4096).astype(np.int16)
+
+    def run(engine, samples: np.ndarray) -> Callable:
+        def filter_signal():
+            engine.reset()
+            for idx in range(0, len(samples), FILTERING_BLOCK_SIZE):
+                engine.process(samples[idx:idx + FILTERING_BLOCK_SIZE])
+
+        return filter_signal
+
+    benchmarks = {}
+    for length, transition in TRANSITION_WIDTHS.items():
+        fir_filter = designed_filter(half_band_conf(transition))
+        coefficients = fir_filter.coefficients
+        quantized, fractional_bits, _ = CoefficientQuantizer().quantize_coefficients(coefficients)
+
+        benchmarks[f"filtering/dense/{length}"] = run(DenseDirectFilterEngine(coefficients), signal)
+        benchmarks[f"filtering/direct/{length}"] = run(DirectFilterEngine(coefficients), signal)
+        benchmarks[f"filtering/sparse/{length}"] = run(
+            SparseFilterEngine(coefficients, fir_filter.zero_taps), signal
+        )
+        benchmarks[f"filtering/integer/{length}"] = run(
+            IntegerFilterEngine(quantized.tolist(), fractional_bits), integer_signal
+        )
+
+    return benchmarks
+
+
+def time_benchmark(function: Callable, repeats: int) -> dict:
+    """
+    Times a benchmark, the number of calls per repeat is chosen to last at least 0.2 seconds
+    :return: Median and best time per call in seconds
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = np.asarray(timer.repeat(repeat=repeats, number=number)) / number
+    return {'median_s': float(np.median(times)), 'best_s': float(times.min()), 'number': number}
+
+
+def environment_metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+    }
+
+
+def run(args: argparse.Namespace):
+    benchmarks = {**design_benchmarks(), **strategy_benchmarks(), **filtering_benchmarks()}
+
+    results = {}
+    for name, function in benchmarks.items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = time_benchmark(function, args.repeats)
+        print(f"{name:<45} {1e6 * results[name]['median_s']:>12.1f} us", file=sys.stderr)
+
+    report = {'metadata': environment_metadata(), 'repeats': args.repeats, 'results': results}
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as file:
+        baseline = json.load(file)['results']
+    with open(args.candidate) as file:
+        candidate = json.load(file)['results']
+
+    regressions = 0
+    print(f"{'benchmark':<45} {'baseline us':>12} {'candidate us':>13} {'ratio':>7}")
+    for name in sorted(baseline.keys() & candidate.keys()):
+        ratio = candidate[name][args.statistic] / baseline[name][args.statistic]
+        flag = ''
+        if ratio > 1 + args.threshold:
+            flag = 'REGRESSION'
+            regressions += 1
+        elif ratio < 1 - args.threshold:
+            flag = 'improvement'
+        baseline_us, candidate_us = 1e6 * baseline[name][args.statistic], 1e6 * candidate[name][args.statistic]
+        print(f"{name:<45} {baseline_us:>12.1f} {candidate_us:>13.1f} {ratio:>7.2f} {flag}")
+
+    for name in sorted(baseline.keys() ^ candidate.keys()):
+        print(f"{name:<45} only in {'baseline' if name in baseline else 'candidate'}")
+
+    print(f"{regressions} regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks of the design, windowing and filtering hot paths')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Runs the benchmarks and stores the timings as JSON')
+    run_parser.add_argument('--output', required=True)
+    run_parser.add_argument('--filter', help='Runs only the benchmarks whose name contains this text')
+    run_parser.add_argument('--repeats', type=int, default=REPEATS)
+
+    compare_parser = commands.add_parser('compare', help='Flags the regressions of a run against a baseline')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='Allowed slowdown, 0.1 is 10%%')
+    # The best time is the least sensitive to the load of the machine
+    compare_parser.add_argument('--statistic', choices=['best_s', 'median_s'], default='best_s')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark of the FFT filter bank against filtering the signal with every design one by one
+
+Run with: python -m benchmarks.filter_bank_benchmark
+"""
+import time
+
+import numpy as np
+
+from app.design.fir_filter_factory import create_fir_filter
+from app.filtering.fft_filter_bank import FFTFilterBank
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+
+SAMPLES = 1 << 20
+BLOCK_SIZE = 1 << 15
+REPEATS = 5
+F = 64000
+
+
+def channel_designs(channels: int, transition: float) -> list:
+    """
+    Designs bandpass filters that split the band from F / 32 to F / 2 - F / 32 into channels
+    """
+    width = (F / 2 - F / 16) / channels
+    designs = []
+    for idx in range(channels):
+        low = F / 32 + idx * width
+        conf = dict(filter_type='bandpass', filter_window='hamming', Ap=0.1, As=50, F=F,
+                    fs=low - transition, fp=low, fp2=low + width, fs2=low + width + transition)
+        fir_filter = create_fir_filter(conf)
+        fir_filter.design()
+        designs.append(fir_filter)
+
+    return designs
+
+
+def time_blocks(process, reset, signal: np.ndarray) -> float:
+    best = float('inf')
+    for _ in range(REPEATS):
+        reset()
+        start = time.perf_counter()
+        for idx in range(0, len(signal), BLOCK_SIZE):
+            process(signal[idx:idx + BLOCK_SIZE])
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    signal = np.random.default_rng(0).standard_normal(SAMPLES)
+
+    print(f"{'filters':>8} {'taps':>6} {'one by one MS/s':>16} {'bank MS/s':>10} {'speedup':>8}")
+    for channels, transition in ((8, 400), (16, 200), (32, 200), (64, 100)):
+        designs = channel_designs(channels, transition)
+        engines = [DirectFilterEngine(fir_filter.coefficients) for fir_filter in designs]
+        bank = FFTFilterBank(designs)
+
+        def process_one_by_one(samples):
+            return [engine.process(samples) for engine in engines]
+
+        def reset_engines():
+            for engine in engines:
+                engine.reset()
+
+        one_by_one = time_blocks(process_one_by_one, reset_engines, signal)
+        batched = time_blocks(bank.process, bank.reset, signal)
+
+        # Throughput of input samples, every sample goes through all the filters
+        print(
+            f"{channels:>8} {bank.taps:>6} {SAMPLES / one_by_one / 1e6:>16.2f} "
+            f"{SAMPLES / batched / 1e6:>10.2f} {one_by_one / batched:>8.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
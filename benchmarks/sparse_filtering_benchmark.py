@@ -0,0 +1,77 @@
+"""
+Benchmark of the sparse filter engine against the dense direct convolution on half-band filters
+
+Run with: python -m benchmarks.sparse_filtering_benchmark
+The engines are also timed by the filtering benchmarks of benchmarks.benchmark_suite
+"""
+import time
+
+import numpy as np
+
+from app.design.fir_filter_factory import create_fir_filter
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+from app.filtering.filter_engines.sparse_filter_engine import SparseFilterEngine
+from app.filtering.filter_engines.filter_engine import FilterEngine
+
+SAMPLES = 1 << 21
+BLOCK_SIZE = 1 << 16
+REPEATS = 10
+
+
+class DenseDirectFilterEngine(FilterEngine):
+    """
+    Direct convolution over every tap, the kernel the sparse engine uses without skipping the zero taps
+    """
+
+    def __init__(self, coefficients: list[float]):
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self._history = np.zeros(len(self.coefficients) - 1)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        extended = np.concatenate((self._history, samples))
+        self._history = extended[-len(self._history):]
+        return np.convolve(extended, self.coefficients, 'valid')
+
+    def reset(self):
+        self._history = np.zeros(len(self.coefficients) - 1)
+
+
+def half_band_conf(transition: float) -> dict:
+    # fp + fs = F / 2 puts the cutoff at F / 4
+    return dict(filter_type='lowpass', filter_window='kaiser', Ap=0.1, As=60,
+                fp=2000 - transition / 2, fs=2000 + transition / 2, F=8000)
+
+
+def time_engine(engine, signal: np.ndarray) -> float:
+    best = float('inf')
+    for _ in range(REPEATS):
+        engine.reset()
+        start = time.perf_counter()
+        for idx in range(0, len(signal), BLOCK_SIZE):
+            engine.process(signal[idx:idx + BLOCK_SIZE])
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    signal = np.random.default_rng(0).standard_normal(SAMPLES)
+
+    print(f"{'taps':>6} {'zeros':>6} {'direct MS/s':>12} {'auto MS/s':>10} {'sparse MS/s':>12} {'speedup':>8}")
+    for transition in (400, 200, 100, 50, 25, 12.5):
+        fir_filter = create_fir_filter(half_band_conf(transition))
+        coefficients = fir_filter.design()
+
+        direct = time_engine(DenseDirectFilterEngine(coefficients), signal)
+        auto = time_engine(DirectFilterEngine(coefficients), signal)
+        sparse = time_engine(SparseFilterEngine(coefficients, fir_filter.zero_taps), signal)
+
+        # The speedup is measured against the direct kernel over every tap, auto may use the FFT
+        print(
+            f"{len(coefficients):>6} {len(fir_filter.zero_taps):>6} {SAMPLES / direct / 1e6:>12.1f} "
+            f"{SAMPLES / auto / 1e6:>10.1f} {SAMPLES / sparse / 1e6:>12.1f} {direct / sparse:>8.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+This file contains the tests of the plot route
+"""
+import unittest
+
+from fastapi.testclient import TestClient
+
+from app.api.server import app
+
+FILTER_CONF = {'filter_type': 'lowpass', 'filter_window': 'hamming', 'Ap': 0.1, 'As': 50, 'F': 8000, 'fp': 1000,
+               'fs': 1500}
+
+
+class PlotRouterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_frequency_above_nyquist_is_rejected(self):
+        response = self.client.get('/designs/plot', params={**FILTER_CONF, 'f_max': 9000})
+
+        self.assertEqual(response.status_code, 422)
+        self.assertIn('F/2', response.text)
+
+    def test_empty_frequency_range_is_rejected(self):
+        response = self.client.get('/designs/plot', params={**FILTER_CONF, 'f_min': 2000, 'f_max': 1000})
+
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+This file contains the tests of the batch design command line interface
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from app.cli.batch_design_cli import SpecFormat, cli, read_specs
+
+FILTER_CONF = {'filter_type': 'lowpass', 'filter_window': 'hamming', 'Ap': 0.1, 'As': 50, 'F': 8000, 'fp': 1000,
+               'fs': 1500}
+
+
+class BatchDesignCliTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_malformed_jsonl_line_does_not_stop_the_reading(self):
+        path = self.directory / 'specs.jsonl'
+        path.write_text(f"{json.dumps(FILTER_CONF)}\nnot json\n\n{json.dumps(FILTER_CONF)}\n")
+
+        records = list(read_specs(path, SpecFormat.jsonl))
+
+        self.assertEqual(len(records), 3)
+        self.assertIsNone(records[0][1])
+        self.assertIsNone(records[1][0])
+        self.assertTrue(records[1][1].startswith('line 2: JSONDecodeError'))
+        self.assertEqual(records[2], (FILTER_CONF, None))
+
+    def test_malformed_csv_cell_does_not_stop_the_reading(self):
+        path = self.directory / 'specs.csv'
+        path.write_text('filter_type,filter_window,Ap,As,F,fp,fs\n'
+                        'lowpass,hamming,0.1,50,8000,1000,1500\n'
+                        'lowpass,hamming,0.1,fifty,8000,1000,1500\n')
+
+        records = list(read_specs(path, SpecFormat.csv))
+
+        self.assertEqual(records[0], (FILTER_CONF, None))
+        self.assertTrue(records[1][1].startswith('line 3: ValueError'))
+
+    def test_parse_errors_go_to_the_failures(self):
+        path = self.directory / 'specs.jsonl'
+        path.write_text(f"{json.dumps(FILTER_CONF)}\nnot json\n{json.dumps(FILTER_CONF)}\n")
+        output_dir = self.directory / 'designs'
+
+        result = CliRunner().invoke(cli, [str(path), str(output_dir), '--workers', '1'])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('Designed: 2', result.output)
+        failures = [json.loads(line) for line in (output_dir / 'failures.jsonl').read_text().splitlines()]
+        self.assertEqual([failure['spec'] for failure in failures], [1])
+        self.assertEqual(sorted(path.name for path in output_dir.glob('*.npy')), ['000000000.npy', '000000002.npy'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+This file contains the tests of the fixed-point coefficient quantizer
+"""
+import unittest
+
+from app.design.quantization.coefficient_quantizer import CoefficientQuantizer
+
+
+class CoefficientQuantizerTest(unittest.TestCase):
+
+    def test_q15_saturation_count(self):
+        integers, fractional_bits, saturated = CoefficientQuantizer(16).quantize_coefficients([0.5, -1.0, 1.0, 2.0])
+
+        self.assertEqual(fractional_bits, 15)
+        self.assertEqual(integers.tolist(), [16384, -32768, 32767, 32767])
+        self.assertEqual(saturated, 2)
+
+    def test_q31_saturation_count(self):
+        integers, fractional_bits, saturated = CoefficientQuantizer(32).quantize_coefficients([0.25, -1.0, 1.0])
+
+        self.assertEqual(fractional_bits, 31)
+        self.assertEqual(integers.tolist(), [1 << 29, -(1 << 31), (1 << 31) - 1])
+        self.assertEqual(saturated, 1)
+
+    def test_q15_normalize_uses_the_full_word(self):
+        quantizer = CoefficientQuantizer(16, scaling='normalize')
+
+        integers, fractional_bits, saturated = quantizer.quantize_coefficients([0.3, -0.1])
+        self.assertEqual(fractional_bits, 16)
+        self.assertEqual(integers.tolist(), [19661, -6554])
+        self.assertEqual(saturated, 0)
+
+        # A peak of 1.0 does not fit in Q15, one fractional bit is given up
+        integers, fractional_bits, saturated = quantizer.quantize_coefficients([1.0, 0.5])
+        self.assertEqual(fractional_bits, 14)
+        self.assertEqual(integers.tolist(), [16384, 8192])
+        self.assertEqual(saturated, 0)
+
+    def test_q31_normalize_uses_the_full_word(self):
+        integers, fractional_bits, saturated = CoefficientQuantizer(32, scaling='normalize').quantize_coefficients(
+            [0.25, -0.125]
+        )
+
+        self.assertEqual(fractional_bits, 32)
+        self.assertEqual(integers.tolist(), [1 << 30, -(1 << 29)])
+        self.assertEqual(saturated, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+This file contains the tests of the incremental design session
+"""
+import unittest
+
+import numpy as np
+
+from app.design.design_session import DesignSession
+from app.design.fir_filter_factory import create_fir_filter
+
+FILTER_CONF = {'filter_type': 'lowpass', 'filter_window': 'kaiser', 'Ap': 0.1, 'As': 60, 'F': 8000, 'fp': 1000,
+               'fs': 1400}
+
+
+class DesignSessionTest(unittest.TestCase):
+
+    def _assert_full_design(self, session: DesignSession):
+        self.assertEqual(session.fir_filter.coefficients, create_fir_filter(session.filter_conf).design())
+
+    def test_first_design_computes_every_stage(self):
+        session = DesignSession(FILTER_CONF)
+
+        self.assertEqual(session.recomputed, ['ripples', 'window', 'impulse_response', 'coefficients'])
+        self._assert_full_design(session)
+
+    def test_edge_edit_keeps_the_ripples(self):
+        session = DesignSession(FILTER_CONF)
+        session.update(fp=1100)
+
+        self.assertEqual(session.recomputed, ['window', 'impulse_response', 'coefficients'])
+        self._assert_full_design(session)
+
+    def test_edge_edit_with_the_same_order_keeps_the_window(self):
+        session = DesignSession({**FILTER_CONF, 'filter_window': 'hamming'})
+        # The transition width does not change, so neither does the order
+        session.update(fp=1100, fs=1500)
+
+        self.assertEqual(session.recomputed, ['impulse_response', 'coefficients'])
+        self._assert_full_design(session)
+
+    def test_attenuation_edit_recomputes_the_ripples(self):
+        session = DesignSession(FILTER_CONF)
+        session.update(As=70)
+
+        self.assertEqual(session.recomputed, ['ripples', 'window', 'impulse_response', 'coefficients'])
+        self._assert_full_design(session)
+
+    def test_window_edit_keeps_the_ripples_and_the_impulse_response(self):
+        session = DesignSession({**FILTER_CONF, 'filter_window': 'hamming'})
+        session.update(filter_window='blackman')
+
+        self.assertEqual(session.recomputed, ['window', 'coefficients'])
+        self._assert_full_design(session)
+
+    def test_random_edits_match_a_full_design(self):
+        rng = np.random.default_rng(0)
+        session = DesignSession(FILTER_CONF)
+
+        for _ in range(50):
+            fp = float(rng.uniform(500, 2500))
+            session.update(
+                fp=fp,
+                fs=fp + float(rng.uniform(200, 800)),
+                As=float(rng.choice([40, 50, 60, 70])),
+                filter_window=str(rng.choice(['hamming', 'blackman', 'kaiser'])),
+            )
+            self._assert_full_design(session)
+
+    def test_failed_edit_keeps_the_configuration(self):
+        session = DesignSession(FILTER_CONF)
+
+        with self.assertRaises(ValueError):
+            session.update(fs=500)
+
+        self.assertEqual(session.filter_conf, FILTER_CONF)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+This file contains the tests of the coalescing of identical requests
+"""
+import asyncio
+import unittest
+
+from app.dispatch.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.started = 0
+        self.release = asyncio.Event()
+
+    async def _compute(self) -> int:
+        self.started += 1
+        await self.release.wait()
+        return self.started
+
+    def assert_empty(self):
+        self.assertEqual(self.single_flight._waiters, {})
+        self.assertEqual(self.single_flight._in_flight, {})
+
+    async def test_concurrent_callers_share_one_computation(self):
+        callers = [asyncio.create_task(self.single_flight.run('key', self._compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertEqual(await asyncio.gather(*callers), [1] * 5)
+        self.assertEqual(self.started, 1)
+        self.assertEqual(self.single_flight.computations, 1)
+        self.assertEqual(self.single_flight.coalesced, 4)
+        self.assert_empty()
+
+    async def test_cancelling_a_waiter_keeps_the_others(self):
+        callers = [asyncio.create_task(self.single_flight.run('key', self._compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        callers[0].cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await callers[0]
+        self.assertEqual(await asyncio.gather(*callers[1:]), [1, 1])
+        self.assertEqual(self.single_flight.cancelled, 0)
+        self.assert_empty()
+
+    async def test_cancelling_the_last_waiter_cancels_the_computation(self):
+        callers = [asyncio.create_task(self.single_flight.run('key', self._compute)) for _ in range(2)]
+        await asyncio.sleep(0)
+        computation = self.single_flight._in_flight['key']
+
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        self.assertTrue(computation.cancelled())
+        self.assertEqual(self.single_flight.cancelled, 1)
+        self.assert_empty()
+
+        # The next caller does not join the cancelled computation
+        caller = asyncio.create_task(self.single_flight.run('key', self._compute))
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertEqual(await caller, 2)
+        self.assertEqual(self.single_flight.computations, 2)
+        self.assert_empty()
+
+    async def test_an_error_reaches_every_waiter(self):
+        async def fail():
+            await self.release.wait()
+            raise RuntimeError('design failed')
+
+        callers = [asyncio.create_task(self.single_flight.run('key', fail)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(self.single_flight.failed, 1)
+        self.assertEqual(self.single_flight.computations, 1)
+        self.assert_empty()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+This file contains the tests of the FFT filter bank
+"""
+import unittest
+
+import numpy as np
+
+from app.design.fir_filter_factory import create_fir_filter
+from app.filtering.fft_filter_bank import FFTFilterBank
+
+FILTER_CONFS = [
+    {'filter_type': 'lowpass', 'filter_window': 'hamming', 'Ap': 0.1, 'As': 50, 'F': 8000, 'fp': 1000, 'fs': 1500},
+    {'filter_type': 'highpass', 'filter_window': 'blackman', 'Ap': 0.1, 'As': 60, 'F': 8000, 'fp': 2500, 'fs': 2000},
+    {'filter_type': 'bandpass', 'filter_window': 'hamming', 'Ap': 0.1, 'As': 50, 'F': 8000, 'fs': 500, 'fp': 800,
+     'fp2': 1500, 'fs2': 1800},
+]
+
+
+class FFTFilterBankTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.samples = self.rng.standard_normal(5000)
+        self.fir_filters = [create_fir_filter(filter_conf) for filter_conf in FILTER_CONFS]
+        for fir_filter in self.fir_filters:
+            fir_filter.design()
+
+    def _process_random_blocks(self, bank: FFTFilterBank) -> np.ndarray:
+        splits = np.sort(self.rng.choice(np.arange(1, len(self.samples)), size=12, replace=False))
+        return np.concatenate([bank.process(block) for block in np.split(self.samples, splits)], axis=1)
+
+    def _expected(self) -> np.ndarray:
+        return np.stack([
+            np.convolve(self.samples, fir_filter.coefficients)[:len(self.samples)] for fir_filter in self.fir_filters
+        ])
+
+    def test_random_blocks_match_convolve(self):
+        bank = FFTFilterBank(self.fir_filters)
+        output = self._process_random_blocks(bank)
+
+        self.assertEqual(output.shape, (len(FILTER_CONFS), len(self.samples)))
+        np.testing.assert_allclose(output, self._expected(), atol=1e-12)
+
+    def test_blocks_split_in_many_batches(self):
+        bank = FFTFilterBank(self.fir_filters, fft_size=256)
+        # A few hops per batch, so every block runs several batches
+        bank.MAX_BATCH_SAMPLES = 3 * bank.hop * bank.filters
+
+        np.testing.assert_allclose(self._process_random_blocks(bank), self._expected(), atol=1e-12)
+
+    def test_float32(self):
+        bank = FFTFilterBank(self.fir_filters, dtype='float32')
+
+        self.assertEqual(bank.spectra.dtype, np.complex64)
+        output = self._process_random_blocks(bank)
+        self.assertEqual(output.dtype, np.float32)
+        np.testing.assert_allclose(output, self._expected(), atol=1e-4)
+
+    def test_fft_size_smaller_than_the_taps(self):
+        with self.assertRaises(ValueError):
+            FFTFilterBank(self.fir_filters, fft_size=16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+This file contains the tests of the filter cascade
+"""
+import unittest
+
+import numpy as np
+
+from app.design.fir_filter_factory import create_fir_filter
+from app.filtering.filter_cascade import FilterCascade
+
+LOWPASS = {'filter_type': 'lowpass', 'filter_window': 'hamming', 'Ap': 0.1, 'As': 50, 'F': 8000, 'fp': 3000,
+           'fs': 3400}
+HIGHPASS = {'filter_type': 'highpass', 'filter_window': 'hamming', 'Ap': 0.1, 'As': 50, 'F': 8000, 'fp': 600,
+            'fs': 300}
+# fp + fs = F / 2 puts the cutoff at F / 4, every other tap is zero
+HALF_BAND = {'filter_type': 'lowpass', 'filter_window': 'blackman', 'Ap': 0.1, 'As': 70, 'F': 8000, 'fp': 1900,
+             'fs': 2100}
+
+
+class FilterCascadeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.samples = self.rng.standard_normal(4000)
+
+    def _fir_filters(self, filter_confs: list[dict]) -> list:
+        fir_filters = [create_fir_filter(filter_conf) for filter_conf in filter_confs]
+        for fir_filter in fir_filters:
+            fir_filter.design()
+        return fir_filters
+
+    def _process_random_blocks(self, cascade: FilterCascade) -> np.ndarray:
+        splits = np.sort(self.rng.choice(np.arange(1, len(self.samples)), size=12, replace=False))
+        return np.concatenate([cascade.process(block) for block in np.split(self.samples, splits)])
+
+    def _expected(self, fir_filters: list) -> np.ndarray:
+        expected = self.samples
+        for fir_filter in fir_filters:
+            expected = np.convolve(expected, fir_filter.coefficients)[:len(self.samples)]
+        return expected
+
+    def test_both_modes_match_convolve(self):
+        fir_filters = self._fir_filters([LOWPASS, HIGHPASS])
+
+        for mode in ('collapsed', 'sequential'):
+            with self.subTest(mode=mode):
+                cascade = FilterCascade(fir_filters, mode)
+                output = self._process_random_blocks(cascade)
+                np.testing.assert_allclose(output, self._expected(fir_filters), atol=1e-12)
+
+    def test_mode_follows_the_cost(self):
+        fir_filters = self._fir_filters([HALF_BAND, HALF_BAND])
+        cascade = FilterCascade(fir_filters)
+
+        sequential_cost = cascade.sequential_macs + cascade.STAGE_COST
+        self.assertEqual(cascade.mode, 'collapsed' if cascade.collapsed_macs <= sequential_cost else 'sequential')
+        # The zero taps of the half-band stages are not multiplied in sequence
+        self.assertLess(cascade.sequential_macs, sum(len(fir_filter.coefficients) for fir_filter in fir_filters))
+        np.testing.assert_allclose(self._process_random_blocks(cascade), self._expected(fir_filters), atol=1e-12)
+
+    def test_float32(self):
+        fir_filters = self._fir_filters([LOWPASS, HIGHPASS])
+
+        for mode in ('collapsed', 'sequential'):
+            with self.subTest(mode=mode):
+                cascade = FilterCascade(fir_filters, mode, dtype='float32')
+                output = self._process_random_blocks(cascade)
+
+                self.assertEqual(output.dtype, np.float32)
+                np.testing.assert_allclose(output, self._expected(fir_filters), atol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+This file contains the tests of the integer filter engine
+"""
+import unittest
+
+import numpy as np
+
+from app.filtering.filter_engines.integer_filter_engine import IntegerFilterEngine
+
+
+def reference_mac(coefficients: list[int], samples: list[int], fractional_bits: int, accumulator: str) -> list[int]:
+    """
+    Scalar fixed-point MAC, one multiply and accumulate per tap with Python integers
+    """
+    output = []
+    for n in range(len(samples)):
+        acc = 0
+        for k, coefficient in enumerate(coefficients):
+            if n - k >= 0:
+                acc += coefficient * samples[n - k]
+
+        if accumulator == 'int32':
+            acc = (acc + (1 << 31)) % (1 << 32) - (1 << 31)
+
+        if fractional_bits > 0:
+            acc = (acc + (1 << (fractional_bits - 1))) >> fractional_bits
+
+        output.append(min(max(acc, -32768), 32767))
+
+    return output
+
+
+class IntegerFilterEngineTest(unittest.TestCase):
+
+    def _process_blocks(self, engine: IntegerFilterEngine, samples: np.ndarray, blocks: list[int]) -> np.ndarray:
+        outputs = []
+        for start, end in zip([0] + blocks, blocks + [len(samples)]):
+            outputs.append(engine.process(samples[start:end]))
+        return np.concatenate(outputs)
+
+    def test_chunked_process_matches_the_scalar_mac(self):
+        rng = np.random.default_rng(0)
+        coefficients = rng.integers(-32768, 32768, 17).tolist()
+        samples = rng.integers(-32768, 32768, 700).astype(np.int16)
+        expected = {
+            accumulator: reference_mac(coefficients, samples.tolist(), 15, accumulator)
+            for accumulator in ('int32', 'int64')
+        }
+
+        for accumulator in ('int32', 'int64'):
+            with self.subTest(accumulator=accumulator):
+                engine = IntegerFilterEngine(coefficients, 15, accumulator)
+                # Blocks that cross the chunk boundaries and blocks shorter than the taps
+                engine.CHUNK_SIZE = 64
+                output = self._process_blocks(engine, samples, [5, 63, 64, 200, 201, 333])
+
+                self.assertEqual(output.dtype, np.int16)
+                self.assertEqual(output.tolist(), expected[accumulator])
+
+    def test_int32_accumulator_wraps_around(self):
+        coefficients = [32767] * 4
+        samples = np.full(8, 32767, dtype=np.int16)
+
+        wrapped = IntegerFilterEngine(coefficients, 15, 'int32').process(samples)
+        exact = IntegerFilterEngine(coefficients, 15, 'int64').process(samples)
+
+        self.assertEqual(wrapped.tolist(), reference_mac(coefficients, samples.tolist(), 15, 'int32'))
+        # Four products overflow the int32 accumulator to a small negative value instead of saturating
+        self.assertEqual(wrapped[-1], -8)
+        self.assertEqual(exact[-1], 32767)
+
+    def test_rounding_and_saturation_to_int16(self):
+        half = IntegerFilterEngine([1 << 14], 15)
+        self.assertEqual(half.process(np.array([3, -3, 1, -1], dtype=np.int16)).tolist(), [2, -1, 1, 0])
+
+        double = IntegerFilterEngine([32767, 32767], 15)
+        self.assertEqual(double.process(np.array([32767, 32767], dtype=np.int16)).tolist(), [32766, 32767])
+        double.reset()
+        self.assertEqual(double.process(np.array([-32768, -32768], dtype=np.int16)).tolist(), [-32767, -32768])
+
+    def test_rejects_non_int16_samples(self):
+        with self.assertRaises(TypeError):
+            IntegerFilterEngine([1], 0).process(np.zeros(4, dtype=np.int32))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+This file contains the tests of the sparse filter engine
+"""
+import unittest
+
+import numpy as np
+
+from app.filtering.filter_engines.sparse_filter_engine import SparseFilterEngine
+
+
+def random_blocks(rng: np.random.Generator, samples: np.ndarray) -> list[np.ndarray]:
+    splits = np.sort(rng.choice(np.arange(1, len(samples)), size=12, replace=False))
+    return np.split(samples, splits)
+
+
+class SparseFilterEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.samples = self.rng.standard_normal(2000)
+
+    def _half_band(self, taps: int = 31) -> np.ndarray:
+        # Every other tap is zero except the center one
+        n = np.arange(taps) - taps // 2
+        coefficients = np.sinc(n / 2) / 2 * np.hamming(taps)
+        coefficients[(n % 2 == 0) & (n != 0)] = 0
+        return coefficients
+
+    def _assert_matches_convolve(self, engine: SparseFilterEngine, coefficients: np.ndarray, rtol: float):
+        output = np.concatenate([engine.process(block) for block in random_blocks(self.rng, self.samples)])
+        expected = np.convolve(self.samples, coefficients)[:len(self.samples)]
+
+        np.testing.assert_allclose(output, expected, rtol=rtol, atol=rtol)
+
+    def test_half_band_uses_stride_two(self):
+        coefficients = self._half_band()
+        engine = SparseFilterEngine(coefficients)
+
+        self.assertEqual(engine.stride, 2)
+        self.assertEqual(engine.extra_taps, [len(coefficients) // 2])
+        self.assertEqual(engine.multiplies_per_sample, (len(coefficients) + 1) // 2 + 1)
+        self._assert_matches_convolve(engine, coefficients, 1e-12)
+
+    def test_strided_taps_with_an_offset(self):
+        coefficients = np.zeros(40)
+        coefficients[1::3] = self.rng.standard_normal(13)
+        engine = SparseFilterEngine(coefficients)
+
+        self.assertEqual((engine.stride, engine.offset, engine.extra_taps), (3, 1, []))
+        self._assert_matches_convolve(engine, coefficients, 1e-12)
+
+    def test_dense_taps_match_convolve(self):
+        coefficients = self.rng.standard_normal(25)
+        engine = SparseFilterEngine(coefficients)
+
+        self.assertEqual(engine.stride, 1)
+        self._assert_matches_convolve(engine, coefficients, 1e-12)
+
+    def test_float32(self):
+        coefficients = self._half_band()
+        engine = SparseFilterEngine(coefficients, dtype='float32')
+
+        self.assertEqual(engine.process(self.samples[:10]).dtype, np.float32)
+        engine.reset()
+        self._assert_matches_convolve(engine, coefficients, 1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
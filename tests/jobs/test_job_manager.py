@@ -0,0 +1,138 @@
+"""
+This file contains the tests of the in-process job manager
+"""
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_job_manager
+from app.api.server import app
+from app.jobs.exceptions.job_exceptions import JobNotFoundError, QueueFullError
+from app.jobs.job import Job
+from app.jobs.job_handlers import resolve_data_path
+from app.jobs.job_manager import JobManager
+
+FILTER_CONF = {'filter_type': 'lowpass', 'filter_window': 'hamming', 'Ap': 0.1, 'As': 50, 'F': 8000, 'fp': 1000,
+               'fs': 1500}
+TIMEOUT = 5
+
+
+def wait_for(condition, timeout: float = TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("The condition was not met in time")
+        time.sleep(0.005)
+
+
+class JobManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.manager = JobManager(max_workers=1, max_queue_depth=1, result_ttl=60)
+
+    def tearDown(self):
+        self.release.set()
+        self.manager.shutdown()
+
+    def _blocking_handler(self, job: Job) -> str:
+        # Reports progress until released, so a cancellation stops it
+        while not self.release.wait(0.005):
+            job.set_progress(0.5)
+        return 'done'
+
+    def _state(self, job_id: str) -> str:
+        return self.manager.get_status(job_id)['state']
+
+    def test_queue_full_is_rejected(self):
+        running = self.manager.submit('test', self._blocking_handler)
+        wait_for(lambda: self._state(running['job_id']) == 'running')
+        self.manager.submit('test', self._blocking_handler)
+
+        with self.assertRaises(QueueFullError) as context:
+            self.manager.submit('test', self._blocking_handler)
+
+        self.assertEqual(context.exception.queue_depth, 1)
+        self.assertGreaterEqual(context.exception.retry_after, 1)
+
+    def test_queue_full_returns_429_with_retry_after(self):
+        running = self.manager.submit('test', self._blocking_handler)
+        wait_for(lambda: self._state(running['job_id']) == 'running')
+        self.manager.submit('test', self._blocking_handler)
+
+        app.dependency_overrides[get_job_manager] = lambda: self.manager
+        try:
+            response = TestClient(app).post('/jobs/designs', json={'filter_confs': [FILTER_CONF]})
+        finally:
+            app.dependency_overrides.clear()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response.headers['Retry-After']), 1)
+
+    def test_cancel_queued_job(self):
+        running = self.manager.submit('test', self._blocking_handler)
+        wait_for(lambda: self._state(running['job_id']) == 'running')
+        queued = self.manager.submit('test', self._blocking_handler)
+
+        status = self.manager.cancel(queued['job_id'])
+        self.assertEqual(status['state'], 'cancelled')
+
+        self.release.set()
+        wait_for(lambda: self._state(running['job_id']) == 'completed')
+        self.assertEqual(self._state(queued['job_id']), 'cancelled')
+
+    def test_cancel_running_job(self):
+        running = self.manager.submit('test', self._blocking_handler)
+        wait_for(lambda: self._state(running['job_id']) == 'running')
+
+        self.manager.cancel(running['job_id'])
+
+        wait_for(lambda: self._state(running['job_id']) == 'cancelled')
+        self.assertIsNotNone(self.manager.get_status(running['job_id'])['finished_at'])
+
+    def test_expired_jobs_are_purged(self):
+        self.release.set()
+        job = self.manager.submit('test', self._blocking_handler)
+        wait_for(lambda: self._state(job['job_id']) == 'completed')
+        self.assertEqual(self.manager.get_result(job['job_id']), 'done')
+
+        # Moves the end of the job back beyond the result TTL
+        self.manager._jobs[job['job_id']].finished_at -= self.manager.result_ttl
+
+        with self.assertRaises(JobNotFoundError):
+            self.manager.get_status(job['job_id'])
+        self.assertEqual(self.manager._jobs, {})
+
+
+class ResolveDataPathTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_paths_inside_the_data_directory(self):
+        self.assertEqual(resolve_data_path('signals/in.npy', self.data_dir),
+                         self.data_dir.resolve() / 'signals' / 'in.npy')
+
+    def test_traversal_is_rejected(self):
+        for path in ['../../etc/passwd', '/etc/passwd', 'signals/../../in.npy']:
+            with self.subTest(path=path), self.assertRaises(ValueError):
+                resolve_data_path(path, self.data_dir)
+
+    def test_traversal_returns_422(self):
+        response = TestClient(app).post('/jobs/filters', json={
+            'filter_conf': FILTER_CONF, 'input_path': '../../etc/passwd', 'output_path': 'out.npy'
+        })
+
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+This file contains the tests of the filtering stream
+"""
+import unittest
+
+import numpy as np
+
+from app.filtering.filter_engines.direct_filter_engine import DirectFilterEngine
+from app.streaming.filter_stream import FilterStream, INLINE_FRAME_SAMPLES, RESET_ACKNOWLEDGEMENT
+
+
+class FilterStreamTest(unittest.IsolatedAsyncioTestCase):
+
+    async def _run(self, messages: list[bytes | str]) -> list[bytes | str]:
+        stream = FilterStream(DirectFilterEngine([0.25] * 4, dtype='float32'))
+        incoming = iter(messages + [None])
+        sent = []
+
+        async def receive() -> bytes | str | None:
+            return next(incoming)
+
+        async def send(message: bytes | str):
+            sent.append(message)
+
+        await stream.run(receive, send)
+        return sent
+
+    async def test_frames_carry_the_state(self):
+        sent = await self._run([np.ones(2, dtype='<f4').tobytes(), np.ones(2, dtype='<f4').tobytes()])
+
+        self.assertEqual(np.frombuffer(sent[0], dtype='<f4').tolist(), [0.25, 0.5])
+        self.assertEqual(np.frombuffer(sent[1], dtype='<f4').tolist(), [0.75, 1.0])
+
+    async def test_reset_applies_between_frames(self):
+        # The first frame is filtered in a thread, the reset must still wait for it
+        first = np.ones(INLINE_FRAME_SAMPLES + 1, dtype='<f4').tobytes()
+        sent = await self._run([first, 'reset', np.ones(4, dtype='<f4').tobytes()])
+
+        self.assertEqual(len(sent), 3)
+        self.assertEqual(sent[1], RESET_ACKNOWLEDGEMENT)
+        self.assertEqual(np.frombuffer(sent[2], dtype='<f4').tolist(), [0.25, 0.5, 0.75, 1.0])
+
+    async def test_unknown_command_is_an_error(self):
+        sent = await self._run(['hello', np.ones(1, dtype='<f4').tobytes()])
+
+        self.assertEqual(sent[0], 'error: unknown command hello')
+        self.assertEqual(np.frombuffer(sent[1], dtype='<f4').tolist(), [0.25])
+
+
+if __name__ == '__main__':
+    unittest.main()